@@ -8,11 +8,10 @@ __all__ = [
 ]
 
 
-# "force_pydevd" must be imported first to ensure (via side effects)
-# that the ptvsd-vendored copy of pydevd gets used.
-from ._vendored import force_pydevd
+# Note that pydevd is not imported here (so "import ptvsd" stays cheap).
+# The modules which use it import "ptvsd._vendored.force_pydevd" first
+# to ensure (via side effects) that the ptvsd-vendored copy gets used.
 from ptvsd.version import __version__, __author__
 from ptvsd.attach_server import (
     enable_attach, wait_for_attach, break_into_debugger, is_attached,
 )
-del force_pydevd
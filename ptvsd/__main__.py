@@ -6,6 +6,7 @@ import argparse
 import os.path
 import sys
 
+from ptvsd import multiproc
 from ptvsd._local import debug_main, run_main
 from ptvsd.socket import Address
 from ptvsd.version import __version__, __author__  # noqa
@@ -129,7 +130,8 @@ def _group_args(argv):
             supported.append(arg)
 
         # ptvsd support
-        elif arg in ('--host', '--server-host', '--port', '-m'):
+        elif arg in ('--host', '--server-host', '--port', '-m',
+                     '--subprocess-of', '--subprocess-notify'):
             if arg == '-m':
                 gottarget = True
             supported.append(arg)
@@ -159,13 +161,20 @@ def _parse_args(prog, argv):
     host = parser.add_mutually_exclusive_group()
     host.add_argument('--host')
     host.add_argument('--server-host')
-    parser.add_argument('--port', type=int, required=True)
+    # Subprocesses bind a port of their own (see ptvsd.multiproc).
+    parser.add_argument('--port', type=int)
 
     target = parser.add_mutually_exclusive_group(required=True)
     target.add_argument('-m', dest='module')
     target.add_argument('filename', nargs='?')
 
     parser.add_argument('--single-session', action='store_true')
+    # These are only passed to the subprocesses of a debugged process
+    # (see ptvsd.multiproc).
+    parser.add_argument('--subprocess-of', type=int,
+                        default=argparse.SUPPRESS)
+    parser.add_argument('--subprocess-notify', type=int,
+                        default=argparse.SUPPRESS)
     parser.add_argument('-V', '--version', action='version')
     parser.version = __version__
 
@@ -174,7 +183,12 @@ def _parse_args(prog, argv):
 
     serverhost = ns.pop('server_host', None)
     clienthost = ns.pop('host', None)
-    if serverhost:
+    if ns['port'] is None:
+        if 'subprocess_of' not in ns:
+            parser.error('the following arguments are required: --port')
+        ns.pop('port')
+        args.address = None
+    elif serverhost:
         args.address = Address.as_server(serverhost, ns.pop('port'))
     elif not clienthost:
         if args.nodebug:
@@ -198,7 +212,12 @@ def _parse_args(prog, argv):
     return args
 
 
-def main(addr, name, kind, extra=(), nodebug=False, **kwargs):
+def main(addr, name, kind, extra=(), nodebug=False,
+         subprocess_of=None, subprocess_notify=None, **kwargs):
+    if subprocess_notify is not None:
+        multiproc.init_subprocess(subprocess_of, subprocess_notify)
+    if addr is None:
+        addr, kwargs['start_server'] = multiproc.listen_for_client()
     if nodebug:
         run_main(addr, name, kind, *extra, **kwargs)
     else:
@@ -208,4 +227,6 @@ def main(addr, name, kind, extra=(), nodebug=False, **kwargs):
 if __name__ == '__main__':
     args, extra = parse_args()
     main(args.address, args.name, args.kind, extra, nodebug=args.nodebug,
-         singlesession=args.single_session)
+         singlesession=args.single_session,
+         subprocess_of=getattr(args, 'subprocess_of', None),
+         subprocess_notify=getattr(args, 'subprocess_notify', None))
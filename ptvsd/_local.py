@@ -1,7 +1,9 @@
 import sys
 
+from ptvsd._vendored import force_pydevd  # noqa
 import pydevd
 
+from ptvsd import multiproc
 from ptvsd.pydevd_hooks import install
 from ptvsd.runner import run as no_debug_runner
 from ptvsd.socket import Address
@@ -119,6 +121,9 @@ def _run(argv, addr, _pydevd=pydevd, _install=install, **kwargs):
         sys.modules['__main___orig'] = sys.modules['__main__']
         sys.modules['__main__'] = _pydevd
 
+    if '--multiprocess' in argv:
+        multiproc.enable()
+
     daemon = _install(_pydevd, addr, **kwargs)
     sys.argv[:] = argv
     try:
@@ -1,3 +1,4 @@
+from ptvsd._vendored import force_pydevd  # noqa
 import pydevd
 import time
 
@@ -34,7 +35,7 @@ def _pydevd_settrace(redirect_output=None, _pydevd=pydevd, **kwargs):
 global_next_session = None
 
 
-def enable_attach(address, redirect_output=True,
+def enable_attach(address, redirect_output=True, server=None,
                   _pydevd=pydevd, _install=install,
                   on_attach=lambda: None, **kwargs):
     host, port = address
@@ -57,7 +58,8 @@ def enable_attach(address, redirect_output=True,
 
     def start_daemon():
         daemon._sock = daemon._start()
-        _, next_session = daemon.start_server(addr=(host, port))
+        _, next_session = daemon.start_server(addr=(host, port),
+                                              server=server)
         global global_next_session
         global_next_session = next_session
         return daemon._sock
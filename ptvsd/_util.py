@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 import contextlib
+import json
 import os
 import threading
 import time
@@ -50,14 +51,13 @@ def call_all(callables, *args, **kwargs):
 ########################
 # pydevd stuff
 
-from _pydevd_bundle import pydevd_comm  # noqa
-
-
 def log_pydevd_msg(cmdid, seq, args, inbound,
                    log=debug, prefix=None, verbose=False):
     """Log a representation of the given pydevd msg."""
     if log is None or (log is debug and not DEBUG):
         return
+    # pydevd is imported lazily (this module is used by "ptvsd.attach_server").
+    from _pydevd_bundle import pydevd_comm
     if not verbose and cmdid == pydevd_comm.CMD_WRITE_TO_CONSOLE:
         return
 
@@ -72,6 +72,8 @@ def log_pydevd_msg(cmdid, seq, args, inbound,
         else:
             cmdname = '???'
     cmd = '{} ({})'.format(cmdid, cmdname)
+    if isinstance(args, (dict, list)):
+        args = json.dumps(args)
     args = args.replace('\n', '\\n')
     msg = '{}{:28} [{:>10}]: |{}|'.format(prefix, cmd, seq, args)
     log(msg)
@@ -1,4 +1,5 @@
 from importlib import import_module
+import os
 import warnings
 
 from . import check_modules, prefix_matcher, preimport, vendored
@@ -18,12 +19,32 @@ if _unvendored:
 # # due to heavy use of "from" in them.
 with vendored('pydevd'):
     pydevd_constants = import_module('_pydevd_bundle.pydevd_constants')
-# Disable this, since we aren't packaging the Cython modules at the moment.
-pydevd_constants.CYTHON_SUPPORTED = False
 # We limit representation size in our representation provider when needed.
 pydevd_constants.MAXIMUM_VARIABLE_REPRESENTATION_SIZE = 2**32
 
 
+def _cython_speedups_available():
+    """Return True if the Cython speedups built by setup.py are usable."""
+    with vendored('pydevd'):
+        try:
+            cython = import_module('_pydevd_bundle.pydevd_cython_wrapper')
+        except ImportError:
+            return False
+        regular = import_module(
+            '_pydevd_bundle.pydevd_additional_thread_info_regular')
+    # A stale build (from a different pydevd) must not be used.
+    return cython.version == regular.version
+
+
+# Use the Cython tracer when it was built for this interpreter, otherwise
+# silently fall back to the pure-Python one (pydevd would warn about it
+# in the debuggee's stderr).  PYDEVD_USE_CYTHON still overrides this.
+if pydevd_constants.CYTHON_SUPPORTED and \
+        os.getenv('PYDEVD_USE_CYTHON') is None and \
+        not _cython_speedups_available():
+    pydevd_constants.CYTHON_SUPPORTED = False
+
+
 # Now make sure all the top-level modules and packages in pydevd are
 # loaded.  Any pydevd modules that aren't loaded at this point, will
 # be loaded using their parent package's __path__ (i.e. one of the
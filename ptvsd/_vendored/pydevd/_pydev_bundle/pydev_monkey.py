@@ -543,6 +543,11 @@ def patch_new_process_functions():
                 monkey_patch_module(_posixsubprocess, 'fork_exec', create_fork_exec)
             except ImportError:
                 pass
+            else:
+                # Python 3.11 keeps its own reference to fork_exec in the subprocess module.
+                import subprocess
+                if getattr(subprocess, '_fork_exec', None) is getattr(_posixsubprocess, 'original_fork_exec', None):
+                    subprocess._fork_exec = _posixsubprocess.fork_exec
         else:
             # Windows
             try:
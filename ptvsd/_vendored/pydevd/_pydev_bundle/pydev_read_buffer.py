@@ -0,0 +1,108 @@
+'''
+Buffered reading of messages from a socket (used by the pydevd reader thread, which reads commands
+terminated by a new line and by ptvsd, which reads messages with a 'Content-Length' header).
+
+Note: this module must not import threading (ptvsd may import it in the thread which attaches to a
+running process).
+'''
+
+# The number of bytes requested to the socket in each read (may be changed as needed).
+DEFAULT_RECV_SIZE = 64 * 1024
+
+
+class ReadBuffer(object):
+    '''
+    Keeps the bytes read from a socket in a bytearray which is filled with recv_into (so, the contents
+    are not copied around as with the concatenation of strings, which made reading a big message
+    quadratic).
+    '''
+
+    def __init__(self, sock, recv_size=DEFAULT_RECV_SIZE):
+        '''
+        :param socket sock:
+            The socket to read from (if it has no recv_into, recv is used).
+
+        :param int recv_size:
+            The number of bytes requested to the socket in each read.
+        '''
+        self._sock = sock
+        self._recv_size = recv_size
+        self._buffer = bytearray(recv_size)
+        self._start = 0  # Start of the data not consumed yet.
+        self._end = 0  # End of the data read.
+
+    def __len__(self):
+        '''
+        :return int:
+            The number of bytes read which weren't consumed yet.
+        '''
+        return self._end - self._start
+
+    def _read_more(self):
+        '''
+        :return bool:
+            False if the socket was closed (nothing else could be read).
+        '''
+        if self._start == self._end:
+            self._start = self._end = 0
+
+        if self._end + self._recv_size > len(self._buffer):
+            unread = self._end - self._start
+            if self._start > 0:
+                # Move what's still not consumed to the start of the buffer.
+                self._buffer[:unread] = self._buffer[self._start:self._end]
+                self._start = 0
+                self._end = unread
+
+            required = unread + self._recv_size
+            if required > len(self._buffer):
+                self._buffer.extend(bytearray(max(required, 2 * len(self._buffer)) - len(self._buffer)))
+
+        recv_into = getattr(self._sock, 'recv_into', None)
+        if recv_into is not None:
+            # Note: the memoryview must not be kept (a bytearray can't be resized while it's exported).
+            read = recv_into(memoryview(self._buffer)[self._end:self._end + self._recv_size], self._recv_size)
+        else:
+            data = self._sock.recv(self._recv_size)
+            read = len(data)
+            self._buffer[self._end:self._end + read] = data
+
+        if not read:
+            return False
+        self._end += read
+        return True
+
+    def read_line(self, newline=b'\n'):
+        '''
+        :param bytes newline:
+            The bytes which end a line.
+
+        :return bytes:
+            The next line (without the newline) or None if the socket was closed before the newline
+            was found (what was read is still available).
+        '''
+        searched = 0  # Bytes (after self._start) where the newline was already searched.
+        while True:
+            i = self._buffer.find(newline, self._start + searched, self._end)
+            if i != -1:
+                line = bytes(self._buffer[self._start:i])
+                self._start = i + len(newline)
+                return line
+
+            searched = max(0, self._end - self._start - len(newline) + 1)
+            if not self._read_more():
+                return None
+
+    def read(self, length):
+        '''
+        :return bytes:
+            The next length bytes or None if the socket was closed before those were read (what was
+            read is still available).
+        '''
+        while self._end - self._start < length:
+            if not self._read_more():
+                return None
+
+        data = bytes(self._buffer[self._start:self._start + length])
+        self._start += length
+        return data
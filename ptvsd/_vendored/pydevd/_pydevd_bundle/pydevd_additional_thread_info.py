@@ -1,7 +1,11 @@
 # Defines which version of the PyDBAdditionalThreadInfo we'll use.
 
 import os
+from _pydevd_bundle.pydevd_constants import CYTHON_SUPPORTED
 use_cython = os.getenv('PYDEVD_USE_CYTHON', None)
+if not CYTHON_SUPPORTED:
+    # Must match the tracer chosen in pydevd_trace_dispatch.
+    use_cython = 'NO'
 
 if use_cython == 'YES':
     # We must import the cython version if forcing cython
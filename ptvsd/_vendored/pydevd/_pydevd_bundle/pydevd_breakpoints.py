@@ -1,8 +1,72 @@
+import itertools
+import operator
+import re
+
 from _pydevd_bundle.pydevd_constants import dict_iter_values, IS_PY24
 from _pydev_bundle import pydev_log
 from _pydevd_bundle import pydevd_import_class
+from _pydevd_bundle.pydevd_condition_compiler import compile_condition
 from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame
-from _pydev_imps._pydev_saved_modules import threading
+
+
+# The name which replaces @HIT@ (i.e.: the hit count) in the compiled hit condition.
+_HIT_COUNT_NAME = '__pydevd_hit_count__'
+
+# The hit conditions the client usually sends (e.g.: "@HIT@ >= 100" or "@HIT@ % 10 == 0").
+_HIT_COMPARISON_RE = re.compile(r'^\s*@HIT@\s*(==|!=|>=|<=|>|<)\s*(-?\d+)\s*$')
+_HIT_MODULO_RE = re.compile(r'^\s*@HIT@\s*%\s*(\d+)\s*==\s*0\s*$')
+
+_HIT_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+
+def compile_breakpoint_expression(expression):
+    '''
+    :return:
+        The code object to be evaluated for the given condition/expression (or None if it's None).
+
+        If the expression can't be compiled the expression itself is returned (so, evaluating it will report
+        the error just as it would without the precompilation).
+    '''
+    if expression is None:
+        return None
+    try:
+        return compile(expression, '<breakpoint expression>', 'eval')
+    except:
+        pydev_log.info('Unable to compile breakpoint expression: %s\n' % (expression,))
+        return expression
+
+
+def compile_hit_condition(hit_condition):
+    '''
+    :return:
+        A function which receives the hit count and returns whether the hit condition is satisfied (so, no
+        eval() is needed on each hit) or None if it's not one of the usual hit conditions (e.g.: "@HIT@ >= 100"
+        or "@HIT@ % 10 == 0").
+    '''
+    if hit_condition is None:
+        return None
+
+    match = _HIT_MODULO_RE.match(hit_condition)
+    if match is not None:
+        value = int(match.group(1))
+        if value == 0:
+            return None  # Let eval() fail.
+        return lambda hit_count: hit_count % value == 0
+
+    match = _HIT_COMPARISON_RE.match(hit_condition)
+    if match is not None:
+        compare = _HIT_COMPARISONS[match.group(1)]
+        value = int(match.group(2))
+        return lambda hit_count: compare(hit_count, value)
+
+    return None
 
 
 class ExceptionBreakpoint(object):
@@ -25,7 +89,10 @@ class ExceptionBreakpoint(object):
             self.name = None
 
         self.condition = condition
+        self.condition_code = compile_breakpoint_expression(condition)
+        self.condition_evaluator = compile_condition(condition)
         self.expression = expression
+        self.expression_code = compile_breakpoint_expression(expression)
         self.notify_on_unhandled_exceptions = notify_on_unhandled_exceptions
         self.notify_on_handled_exceptions = notify_on_handled_exceptions
         self.notify_on_first_raise_only = notify_on_first_raise_only
@@ -49,12 +116,24 @@ class LineBreakpoint(object):
     def __init__(self, line, condition, func_name, expression, suspend_policy="NONE", hit_condition=None, is_logpoint=False):
         self.line = line
         self.condition = condition
+        self.condition_code = compile_breakpoint_expression(condition)
+        # Simple conditions are evaluated without eval() (None for others).
+        self.condition_evaluator = compile_condition(condition)
         self.func_name = func_name
         self.expression = expression
+        self.expression_code = compile_breakpoint_expression(expression)
         self.suspend_policy = suspend_policy
         self.hit_condition = hit_condition
-        self._hit_count = 0
-        self._hit_condition_lock = threading.Lock()
+        self._hit_condition_code = None
+        self._hit_condition_needs_locals = False
+        self._check_hit_count = compile_hit_condition(hit_condition)
+        if hit_condition is not None and self._check_hit_count is None:
+            self._hit_condition_code = compile_breakpoint_expression(hit_condition.replace('@HIT@', _HIT_COUNT_NAME))
+            if hasattr(self._hit_condition_code, 'co_names'):
+                # Usually only the hit count is referenced, in which case the frame locals aren't needed.
+                self._hit_condition_needs_locals = bool(set(self._hit_condition_code.co_names) - set([_HIT_COUNT_NAME]))
+        # Note: next() on it is atomic (so, no lock is needed to count the hits).
+        self._hit_counter = itertools.count(1)
         # need for frame evaluation: list of code objects, which bytecode was modified by this breakpoint
         self.code_objects = set()
         self.is_logpoint = is_logpoint
@@ -66,15 +145,19 @@ class LineBreakpoint(object):
     def handle_hit_condition(self, frame):
         if self.hit_condition is None:
             return False
-        ret = False
-        with self._hit_condition_lock:
-            self._hit_count += 1
-            expr = self.hit_condition.replace('@HIT@', str(self._hit_count))
-            try:
-                ret = bool(eval(expr, frame.f_globals, frame.f_locals))
-            except Exception:
-                ret = False
-        return ret
+        hit_count = next(self._hit_counter)
+        if self._check_hit_count is not None:
+            return self._check_hit_count(hit_count)
+
+        if self._hit_condition_needs_locals:
+            hit_locals = dict(frame.f_locals)
+        else:
+            hit_locals = {}
+        hit_locals[_HIT_COUNT_NAME] = hit_count
+        try:
+            return bool(eval(self._hit_condition_code, frame.f_globals, hit_locals))
+        except Exception:
+            return False
 
 
 def get_exception_full_qname(exctype):
@@ -64,6 +64,7 @@ each command has a format:
 '''
 
 import itertools
+import json
 import os
 
 from _pydev_bundle.pydev_imports import _queue
@@ -73,7 +74,7 @@ from _pydev_imps._pydev_saved_modules import threading
 from _pydev_imps._pydev_saved_modules import socket
 from socket import socket, AF_INET, SOCK_STREAM, SHUT_RD, SHUT_WR, SOL_SOCKET, SO_REUSEADDR, SHUT_RDWR, timeout
 from _pydevd_bundle.pydevd_constants import DebugInfoHolder, get_thread_id, IS_JYTHON, IS_PY2, IS_PY3K, \
-    IS_PY36_OR_GREATER, STATE_RUN, dict_keys, ASYNC_EVAL_TIMEOUT_SEC, IS_IRONPYTHON, GlobalDebuggerHolder, \
+    IS_PY36_OR_GREATER, STATE_RUN, dict_keys, dict_iter_items, ASYNC_EVAL_TIMEOUT_SEC, IS_IRONPYTHON, GlobalDebuggerHolder, \
     get_global_debugger, GetGlobalDebugger, set_global_debugger # Keep for backward compatibility @UnusedImport
 
 try:
@@ -99,6 +100,7 @@ from _pydevd_bundle.pydevd_utils import quote_smart as quote, compare_object_att
 from _pydev_bundle.pydev_is_thread_alive import is_thread_alive
 from _pydev_bundle import pydev_log
 from _pydev_bundle import _pydev_completer
+from _pydev_bundle.pydev_read_buffer import ReadBuffer
 
 from pydevd_tracing import get_exception_traceback_str
 from _pydevd_bundle import pydevd_console
@@ -189,6 +191,12 @@ CMD_REDIRECT_OUTPUT = 200
 CMD_GET_NEXT_STATEMENT_TARGETS = 201
 CMD_SET_PROJECT_ROOTS = 202
 
+# Same as CMD_GET_VARIABLE, but only gets a page of the indexed items of the variable (see: InternalGetVariablePage).
+CMD_GET_VARIABLE_PAGE = 203
+
+# Replaces all the breakpoints of some type in a file at once (instead of a CMD_REMOVE_BREAK/CMD_SET_BREAK for each one).
+CMD_SET_FILE_BREAKPOINTS = 204
+
 CMD_VERSION = 501
 CMD_RETURN = 502
 CMD_ERROR = 901
@@ -254,6 +262,8 @@ ID_TO_MEANING = {
 
     '200': 'CMD_REDIRECT_OUTPUT',
     '201': 'CMD_GET_NEXT_STATEMENT_TARGETS',
+    '203': 'CMD_GET_VARIABLE_PAGE',
+    '204': 'CMD_SET_FILE_BREAKPOINTS',
 
     '501': 'CMD_VERSION',
     '502': 'CMD_RETURN',
@@ -263,6 +273,16 @@ ID_TO_MEANING = {
 MAX_IO_MSG_SIZE = 1000  #if the io is too big, we'll not send all (could make the debugger too non-responsive)
 #this number can be changed if there's need to do so
 
+# Redirected output is coalesced (see: OutputBuffer).
+IO_BATCH_WINDOW = 0.01  # time (in secs) to wait for more output when there's nothing else to send
+MAX_IO_BATCH_SIZE = 32 * 1024  # a batch is sent in chunks with up to this many characters per stream
+MAX_IO_PENDING_SIZE = 1024 * 1024  # output over this (while the client doesn't keep up) is dropped and counted
+
+# If set, a function which receives the filename of a frame (as sent to the client) and returns whether the frame is
+# shown in the windows of the stack (see: make_get_thread_stack_message). The frames which aren't shown aren't counted
+# in their totalFrames either.
+thread_stack_frame_filter = None
+
 VERSION_STRING = "@@BUILD_NUMBER@@"
 
 from _pydev_bundle._pydev_filesystem_encoding import getfilesystemencoding
@@ -373,50 +393,79 @@ class ReaderThread(PyDBDaemonThread):
 
     def _on_run(self):
         self._stop_trace()
-        read_buffer = ""
+        recv_command = getattr(self.sock, 'recv_command', None)
+        if recv_command is not None:
+            # In-process channel: commands arrive already split into
+            # (cmd_id, seq, text), so there's no line protocol to parse.
+            self._on_run_commands(recv_command)
+            return
+        read_buffer = ReadBuffer(self.sock)
         try:
 
             while not self.killReceived:
                 try:
-                    r = self.sock.recv(1024)
+                    line = read_buffer.read_line()
                 except:
                     if not self.killReceived:
                         traceback.print_exc()
                         self.handle_except()
                     return #Finished communication.
 
+                if line is None:
+                    self.handle_except()
+                    break
+
                 #Note: the java backend is always expected to pass utf-8 encoded strings. We now work with unicode
                 #internally and thus, we may need to convert to the actual encoding where needed (i.e.: filenames
                 #on python 2 may need to be converted to the filesystem encoding).
-                if hasattr(r, 'decode'):
-                    r = r.decode('utf-8')
-
-                read_buffer += r
+                command = line.decode('utf-8')
                 if DebugInfoHolder.DEBUG_RECORD_SOCKET_READS:
-                    sys.stderr.write(u'debugger: received >>%s<<\n' % (read_buffer,))
+                    sys.stderr.write(u'debugger: received >>%s<<\n' % (command,))
+                    sys.stderr.flush()
+
+                args = command.split(u'\t', 2)
+                try:
+                    cmd_id = int(args[0])
+                    pydev_log.debug('Received command: %s %s\n' % (ID_TO_MEANING.get(str(cmd_id), '???'), command,))
+                    self.process_command(cmd_id, int(args[1]), args[2])
+                except:
+                    traceback.print_exc()
+                    sys.stderr.write("Can't process net command: %s\n" % command)
                     sys.stderr.flush()
 
-                if len(read_buffer) == 0:
+        except:
+            traceback.print_exc()
+            self.handle_except()
+
+
+    def _on_run_commands(self, recv_command):
+        try:
+            while not self.killReceived:
+                try:
+                    command = recv_command()
+                except:
+                    if not self.killReceived:
+                        traceback.print_exc()
+                        self.handle_except()
+                    return #Finished communication.
+
+                if command is None:
                     self.handle_except()
                     break
-                while read_buffer.find(u'\n') != -1:
-                    command, read_buffer = read_buffer.split(u'\n', 1)
 
-                    args = command.split(u'\t', 2)
-                    try:
-                        cmd_id = int(args[0])
-                        pydev_log.debug('Received command: %s %s\n' % (ID_TO_MEANING.get(str(cmd_id), '???'), command,))
-                        self.process_command(cmd_id, int(args[1]), args[2])
-                    except:
-                        traceback.print_exc()
-                        sys.stderr.write("Can't process net command: %s\n" % command)
-                        sys.stderr.flush()
+                cmd_id, seq, text = command
+                try:
+                    pydev_log.debug('Received command: %s %s\n' % (ID_TO_MEANING.get(str(cmd_id), '???'), text,))
+                    self.process_command(cmd_id, seq, text)
+                except:
+                    traceback.print_exc()
+                    sys.stderr.write("Can't process net command: %s\t%s\t%s\n" % (cmd_id, seq, text))
+                    sys.stderr.flush()
 
         except:
             traceback.print_exc()
             self.handle_except()
 
-
     def handle_except(self):
         self.global_debugger_holder.global_dbg.finish_debugging_session()
 
@@ -435,10 +484,6 @@ class WriterThread(PyDBDaemonThread):
         self.sock = sock
         self.setName("pydevd.Writer")
         self.cmdQueue = _queue.Queue()
-        if pydevd_vm_type.get_vm_type() == 'python':
-            self.timeout = 0
-        else:
-            self.timeout = 0.1
 
     def add_command(self, cmd):
         """ cmd is NetCommand """
@@ -450,6 +495,8 @@ class WriterThread(PyDBDaemonThread):
 
         self._stop_trace()
         get_has_timeout = sys.hexversion >= 0x02030000 # 2.3 onwards have it.
+        # In-process channel: hand the command over as-is (no quoting/encoding).
+        send_command = getattr(self.sock, 'send_command', None)
         try:
             while True:
                 try:
@@ -475,35 +522,206 @@ class WriterThread(PyDBDaemonThread):
                     #when liberating the thread here, we could have errors because we were shutting down
                     #but the thread was still not liberated
                     return
-                out = cmd.outgoing
 
-                if DebugInfoHolder.DEBUG_TRACE_LEVEL >= 1:
-                    out_message = 'sending cmd --> '
-                    out_message += "%20s" % ID_TO_MEANING.get(out[:3], 'UNKNOWN')
-                    out_message += ' '
-                    out_message += unquote(unquote(out)).replace('\n', ' ')
-                    try:
-                        sys.stderr.write('%s\n' % (out_message,))
-                    except:
-                        pass
+                # Send everything that's queued at once.
+                cmds = [cmd]
+                try:
+                    while True:
+                        cmds.append(self.cmdQueue.get(0))
+                except _queue.Empty:
+                    pass
 
-                if IS_PY3K:
-                    out = bytearray(out, 'utf-8')
-                self.sock.send(out) #TODO: this does not guarantee that all message are sent (and jython does not have a send all)
-                if cmd.id == CMD_EXIT:
-                    break
+                if not self._send_commands(self._get_commands_to_send(cmds), send_command):
+                    return  # CMD_EXIT sent
                 if time is None:
                     break #interpreter shutdown
-                time.sleep(self.timeout)
         except Exception:
             GlobalDebuggerHolder.global_dbg.finish_debugging_session()
             if DebugInfoHolder.DEBUG_TRACE_LEVEL >= 0:
                 traceback.print_exc()
 
+    def _get_commands_to_send(self, cmds):
+        if len(cmds) == 1 and cmds[0].__class__ is _OutputBatch:
+            # Only redirected output to send: wait a bit to see if there's more.
+            return cmds[0].output_buffer.pop_commands(self.cmdQueue)
+
+        ret = []
+        for cmd in cmds:
+            if cmd.__class__ is _OutputBatch:
+                # Redirected output: send all that was written up to now.
+                ret.extend(cmd.output_buffer.pop_commands())
+            else:
+                ret.append(cmd)
+        return ret
+
+    def _send_commands(self, cmds, send_command):
+        """ :return bool: False if CMD_EXIT was sent (in which case commands after it are not sent) """
+        if send_command is not None:
+            for cmd in cmds:
+                send_command(cmd.id, cmd.seq, cmd.text)
+                if cmd.id == CMD_EXIT:
+                    return False
+            return True
+
+        keep_running = True
+        out = []
+        for cmd in cmds:
+            outgoing = cmd.outgoing
+            out.append(outgoing)
+
+            if DebugInfoHolder.DEBUG_TRACE_LEVEL >= 1:
+                out_message = 'sending cmd --> '
+                out_message += "%20s" % ID_TO_MEANING.get(outgoing[:3], 'UNKNOWN')
+                out_message += ' '
+                out_message += unquote(unquote(outgoing)).replace('\n', ' ')
+                try:
+                    sys.stderr.write('%s\n' % (out_message,))
+                except:
+                    pass
+
+            if cmd.id == CMD_EXIT:
+                keep_running = False
+                break
+
+        if out:
+            out = ''.join(out)
+            if IS_PY3K:
+                out = out.encode('utf-8')
+            self._sendall(out)
+        return keep_running
+
+    def _sendall(self, out):
+        sendall = getattr(self.sock, 'sendall', None)
+        if sendall is not None:
+            sendall(out)
+            return
+
+        # i.e.: jython does not have a sendall.
+        while out:
+            sent = self.sock.send(out)
+            out = out[sent:]
+
     def empty(self):
         return self.cmdQueue.empty()
 
 
+#=======================================================================================================================
+# OutputBuffer
+#=======================================================================================================================
+class _OutputBatch(object):
+    """ marker added to the writer queue when output starts to be buffered (see: OutputBuffer) """
+
+    def __init__(self, output_buffer):
+        self.output_buffer = output_buffer
+
+
+class OutputBuffer(object):
+    """ Coalesces the redirected stdout/stderr so that a burst of lines goes in a single
+    CMD_WRITE_TO_CONSOLE per stream instead of one message per write (writes are only merged
+    at line boundaries, so, a partial line is not joined with what's written after it).
+
+    When a batch starts a marker is added to the writer queue (so, the output keeps its order
+    relative to the other messages) and when the writer gets to it, it sends all that was written
+    up to then (waiting up to IO_BATCH_WINDOW for more output if there's nothing else to send).
+
+    If the client doesn't keep up and more than MAX_IO_PENDING_SIZE characters are pending, new
+    output is dropped (the number of dropped characters is reported in the next batch).
+    """
+
+    def __init__(self, writer, cmd_factory):
+        self._writer = writer
+        self._cmd_factory = cmd_factory
+        # Reentrant: a write may happen while writing (i.e.: the garbage collector may run some traced
+        # callback which prints a message from the debugger).
+        self._lock = threading.RLock()
+        self._flush_event = threading.Event()
+        self._pending = []  # list(ctx, list(str)) with consecutive lines written to the same stream merged
+        self._pending_size = 0
+        self._batch_time = None
+        self._dropped = {}  # ctx -> number of characters dropped in the current batch
+        self.dropped_chars = 0  # total number of characters dropped
+
+    def write(self, s, ctx):
+        """
+        :param str s:
+            The output (str on py3 and bytes on py2).
+
+        :param str ctx:
+            '1' for stdout and '2' for stderr.
+        """
+        if not s:
+            return
+        if len(s) > MAX_IO_MSG_SIZE:
+            s = s[0:MAX_IO_MSG_SIZE]
+            s += '...'
+
+        self._lock.acquire()
+        try:
+            start_batch = self._batch_time is None
+            if start_batch:
+                self._batch_time = time.time()
+
+            if self._pending_size + len(s) > MAX_IO_PENDING_SIZE:
+                self._dropped[ctx] = self._dropped.get(ctx, 0) + len(s)
+                self.dropped_chars += len(s)
+            else:
+                last = self._pending[-1] if self._pending else None
+                if last is not None and last[0] == ctx and (last[1][-1].endswith('\n') or s.startswith('\n')):
+                    last[1].append(s)
+                else:
+                    self._pending.append((ctx, [s]))
+                self._pending_size += len(s)
+            if self._pending_size >= MAX_IO_BATCH_SIZE:
+                self._flush_event.set()
+        finally:
+            self._lock.release()
+
+        if start_batch:
+            self._writer.add_command(_OutputBatch(self))
+
+    def flush(self):
+        """ makes the writer send the current batch without waiting for more output (i.e.: when
+        the program is suspended or exiting) """
+        self._flush_event.set()
+
+    def pop_commands(self, cmd_queue=None):
+        """
+        :param Queue cmd_queue:
+            If given and empty, waits for more output (up to IO_BATCH_WINDOW since the batch started).
+
+        :return list(NetCommand):
+            The CMD_WRITE_TO_CONSOLE messages with the output written so far.
+        """
+        batch_time = self._batch_time
+        if cmd_queue is not None and batch_time is not None and cmd_queue.empty():
+            timeout = IO_BATCH_WINDOW - (time.time() - batch_time)
+            if timeout > 0:
+                self._flush_event.wait(timeout)
+
+        self._lock.acquire()
+        try:
+            pending = self._pending
+            dropped = self._dropped
+            self._pending = []
+            self._pending_size = 0
+            self._batch_time = None
+            self._dropped = {}
+            self._flush_event.clear()
+        finally:
+            self._lock.release()
+
+        for ctx, chars in sorted(dict_iter_items(dropped)):
+            pending.append((ctx, ['\n[%s characters of output were dropped]\n' % (chars,)]))
+
+        cmds = []
+        make_io_message = self._cmd_factory.make_io_message
+        for ctx, parts in pending:
+            v = ''.join(parts)
+            for i in range(0, len(v), MAX_IO_BATCH_SIZE):
+                cmds.append(make_io_message(v[i:i + MAX_IO_BATCH_SIZE], ctx, truncate=False))
+        return cmds
+
+
 
 #--------------------------------------------------- CREATING THE SOCKET THREADS
 
@@ -584,7 +802,7 @@ def start_client(host, port):
 #=======================================================================================================================
 # NetCommand
 #=======================================================================================================================
-class NetCommand:
+class NetCommand(object):
     """ Commands received/sent over the network.
 
     Command can represent command received from the debugger,
@@ -602,20 +820,40 @@ class NetCommand:
             seq = NetCommand.next_seq
         self.seq = seq
         self.text = text
-        encoded = quote(to_string(text), '/<>_=" \t')
-        self.outgoing = '%s\t%s\t%s\n' % (id, seq, encoded)
+        self._outgoing = None
+
+    @property
+    def outgoing(self):
+        # Only computed when the command actually goes through a real socket
+        # (the in-process channel uses id/seq/text directly).
+        if self._outgoing is None:
+            text = self.text
+            if text.__class__ in (dict, list):
+                # Structured payload (see NetCommandFactory.structured_payloads).
+                text = json.dumps(text)
+            encoded = quote(to_string(text), '/<>_=" \t')
+            self._outgoing = '%s\t%s\t%s\n' % (self.id, self.seq, encoded)
+        return self._outgoing
 
 #=======================================================================================================================
 # NetCommandFactory
 #=======================================================================================================================
 class NetCommandFactory:
 
+    # When True (negotiated through CMD_VERSION), threads, frames, variables and exception
+    # details are sent as dicts/lists instead of XML strings (those are passed as is to an
+    # in-process client and are sent as json through a socket).
+    structured_payloads = False
+
     def _thread_to_xml(self, thread):
         """ thread information as XML """
         name = pydevd_xml.make_valid_xml_value(thread.getName())
         cmdText = '<thread name="%s" id="%s" />' % (quote(name), get_thread_id(thread))
         return cmdText
 
+    def _thread_to_dict(self, thread):
+        return {'name': thread.getName(), 'id': get_thread_id(thread)}
+
     def make_error_message(self, seq, text):
         cmd = NetCommand(CMD_ERROR, seq, text)
         if DebugInfoHolder.DEBUG_TRACE_LEVEL > 2:
@@ -623,6 +861,8 @@ class NetCommandFactory:
         return cmd
 
     def make_thread_created_message(self, thread):
+        if self.structured_payloads:
+            return NetCommand(CMD_THREAD_CREATE, 0, {'threads': [self._thread_to_dict(thread)]})
         cmdText = "<xml>" + self._thread_to_xml(thread) + "</xml>"
         return NetCommand(CMD_THREAD_CREATE, 0, cmdText)
 
@@ -637,6 +877,8 @@ class NetCommandFactory:
             return self.make_error_message(0, get_exception_traceback_str())
 
     def make_custom_frame_created_message(self, frameId, frameDescription):
+        if self.structured_payloads:
+            return NetCommand(CMD_THREAD_CREATE, 0, {'threads': [{'name': frameDescription, 'id': frameId}]})
         frameDescription = pydevd_xml.make_valid_xml_value(frameDescription)
         cmdText = '<xml><thread name="%s" id="%s"/></xml>' % (frameDescription, frameId)
         return NetCommand(CMD_THREAD_CREATE, 0, cmdText)
@@ -646,6 +888,11 @@ class NetCommandFactory:
         """ returns thread listing as XML """
         try:
             threads = threading.enumerate()
+            if self.structured_payloads:
+                return NetCommand(CMD_RETURN, seq, {'threads': [
+                    self._thread_to_dict(thread) for thread in threads
+                    if is_thread_alive(thread) and not getattr(thread, 'is_pydev_daemon_thread', False)]})
+
             cmd_text = ["<xml>"]
             append = cmd_text.append
             for thread in threads:
@@ -656,8 +903,16 @@ class NetCommandFactory:
         except:
             return self.make_error_message(seq, get_exception_traceback_str())
 
-    def make_get_thread_stack_message(self, seq, thread_id, topmost_frame):
-        """Returns thread stack as XML """
+    def make_get_thread_stack_message(self, seq, thread_id, topmost_frame, start=0, levels=0):
+        """Returns thread stack as XML
+
+        If start or levels are given (or there's a thread_stack_frame_filter), only the frames in that
+        window are sent, along with the totalFrames which could be requested.
+        """
+        if self.structured_payloads:
+            return self._make_get_thread_stack_structured_message(seq, thread_id, topmost_frame, start, levels)
+        if start or levels or thread_stack_frame_filter is not None:
+            return self._make_get_thread_stack_window_message(seq, thread_id, topmost_frame, start, levels)
         try:
             # If frame is None, the return is an empty frame list.
             cmd_text = ['<xml><thread id="%s">' % (thread_id,)]
@@ -684,21 +939,69 @@ class NetCommandFactory:
         except:
             return self.make_error_message(seq, get_exception_traceback_str())
 
+    def _make_get_thread_stack_window_message(self, seq, thread_id, topmost_frame, start, levels):
+        try:
+            stack, total_frames = self._get_thread_stack(
+                topmost_frame, start, levels, thread_stack_frame_filter)
+            topmost_frame = None
+            cmd_text = '<xml><thread id="%s" totalFrames="%s">%s</thread></xml>' % (
+                thread_id, total_frames, self._thread_stack_to_xml(stack))
+            return NetCommand(CMD_GET_THREAD_STACK, seq, cmd_text)
+        except:
+            return self.make_error_message(seq, get_exception_traceback_str())
+
+    def _make_get_thread_stack_structured_message(self, seq, thread_id, topmost_frame, start=0, levels=0):
+        try:
+            frames = []
+            total_frames = 0
+            if topmost_frame is not None:
+                try:
+                    # See: make_get_thread_stack_message (thread_stack_str is the list of frames here).
+                    frame = topmost_frame
+                    thread_stack = None
+                    while frame is not None:
+                        if frame.f_code.co_name == 'do_wait_suspend' and frame.f_code.co_filename.endswith('pydevd.py'):
+                            thread_stack = frame.f_locals.get('thread_stack_str')
+                            break
+                        frame = frame.f_back
+                    if thread_stack:
+                        frame_filter = thread_stack_frame_filter
+                        if frame_filter is not None:
+                            thread_stack = [f for f in thread_stack if frame_filter(f['file'])]
+                        total_frames = len(thread_stack)
+                        if levels:
+                            frames = thread_stack[start:start + levels]
+                        else:
+                            frames = thread_stack[start:]
+                    else:
+                        stack, total_frames = self._get_thread_stack(
+                            topmost_frame, start, levels, thread_stack_frame_filter)
+                        frames = self._thread_stack_to_list(stack)
+                finally:
+                    frame = None
+                    topmost_frame = None
+            return NetCommand(CMD_GET_THREAD_STACK, seq, {'id': thread_id, 'frames': frames, 'totalFrames': total_frames})
+        except:
+            return self.make_error_message(seq, get_exception_traceback_str())
+
     def make_variable_changed_message(self, seq, payload):
         # notify debugger that value was changed successfully
         return NetCommand(CMD_RETURN, seq, payload)
 
-    def make_io_message(self, v, ctx):
+    def make_io_message(self, v, ctx, truncate=True):
         '''
         @param v: the message to pass to the debug server
         @param ctx: 1 for stdio 2 for stderr
+        @param truncate: whether messages longer than MAX_IO_MSG_SIZE should be truncated
         '''
 
         try:
-            if len(v) > MAX_IO_MSG_SIZE:
+            if truncate and len(v) > MAX_IO_MSG_SIZE:
                 v = v[0:MAX_IO_MSG_SIZE]
                 v += '...'
 
+            if self.structured_payloads:
+                return NetCommand(str(CMD_WRITE_TO_CONSOLE), 0, {'output': v, 'ctx': str(ctx)})
             v = pydevd_xml.make_valid_xml_value(quote(v, '/>_= \t'))
             return NetCommand(str(CMD_WRITE_TO_CONSOLE), 0, '<xml><io s="%s" ctx="%s"/></xml>' % (v, ctx))
         except:
@@ -716,10 +1019,24 @@ class NetCommandFactory:
         except:
             return self.make_error_message(0, get_exception_traceback_str())
 
-    def make_thread_stack_str(self, frame):
-        make_valid_xml_value = pydevd_xml.make_valid_xml_value
-        cmd_text_list = []
-        append = cmd_text_list.append
+    def _get_thread_stack(self, frame, start=0, levels=0, frame_filter=None):
+        """
+        :param frame_filter:
+            If given, a function which receives the filename of a frame (as sent to the client) and returns
+            whether it should be shown (see: thread_stack_frame_filter).
+
+        :return tuple(list, int):
+            The (frame_id, method_name, filename_in_utf8, lineno) of the frames which should be shown to the
+            client (starting at the given frame), skipping the first `start` frames and with up to `levels`
+            frames (0 means all of them) and the total number of frames which could be shown.
+
+            Without a frame_filter, only the frames in that window have their filename translated for the
+            client (the others are just counted).
+        """
+        stack = []
+        total_frames = 0
+        # Whether the frames of a file are shown is only checked once per file.
+        shown_files = {}
 
         curr_frame = frame
         frame = None  # Clear frame reference
@@ -740,28 +1057,75 @@ class NetCommandFactory:
                     curr_frame = curr_frame.f_back
                     continue
 
-                filename_in_utf8 = pydevd_file_utils.norm_file_to_client(abs_path_real_path_and_base[0])
-                if not filesystem_encoding_is_utf8 and hasattr(filename_in_utf8, "decode"):
-                    # filename_in_utf8 is a byte string encoded using the file system encoding
-                    # convert it to utf8
-                    filename_in_utf8 = filename_in_utf8.decode(file_system_encoding).encode("utf-8")
+                filename_in_utf8 = None
+                if frame_filter is not None:
+                    filename_in_utf8 = self._norm_file_to_client_utf8(abs_path_real_path_and_base[0])
+                    try:
+                        shown = shown_files[filename_in_utf8]
+                    except KeyError:
+                        shown = shown_files[filename_in_utf8] = frame_filter(filename_in_utf8)
+                    if not shown:
+                        curr_frame = curr_frame.f_back
+                        continue
+
+                total_frames += 1
+                if total_frames <= start or (levels and len(stack) >= levels):
+                    # Out of the requested window: just count it.
+                    curr_frame = curr_frame.f_back
+                    continue
+
+                if filename_in_utf8 is None:
+                    filename_in_utf8 = self._norm_file_to_client_utf8(abs_path_real_path_and_base[0])
 
                 # print("file is ", filename_in_utf8)
 
-                lineno = str(curr_frame.f_lineno)
+                lineno = curr_frame.f_lineno
                 # print("line is ", lineno)
 
-                # Note: variables are all gotten 'on-demand'.
-                append('<frame id="%s" name="%s" ' % (my_id , make_valid_xml_value(method_name)))
-                append('file="%s" line="%s">' % (quote(make_valid_xml_value(filename_in_utf8), '/>_= \t'), lineno))
-                append("</frame>")
+                stack.append((my_id, method_name, filename_in_utf8, lineno))
                 curr_frame = curr_frame.f_back
         except:
             traceback.print_exc()
 
         curr_frame = None  # Clear frame reference
+        return stack, total_frames
+
+    def _norm_file_to_client_utf8(self, abs_path):
+        filename_in_utf8 = pydevd_file_utils.norm_file_to_client(abs_path)
+        if not filesystem_encoding_is_utf8 and hasattr(filename_in_utf8, "decode"):
+            # filename_in_utf8 is a byte string encoded using the file system encoding
+            # convert it to utf8
+            filename_in_utf8 = filename_in_utf8.decode(file_system_encoding).encode("utf-8")
+        return filename_in_utf8
+
+    def _thread_stack_to_xml(self, stack):
+        make_valid_xml_value = pydevd_xml.make_valid_xml_value
+        cmd_text_list = []
+        append = cmd_text_list.append
+
+        for my_id, method_name, filename_in_utf8, lineno in stack:
+            # Note: variables are all gotten 'on-demand'.
+            append('<frame id="%s" name="%s" ' % (my_id , make_valid_xml_value(method_name)))
+            append('file="%s" line="%s">' % (quote(make_valid_xml_value(filename_in_utf8), '/>_= \t'), lineno))
+            append("</frame>")
+
         return ''.join(cmd_text_list)
 
+    def _thread_stack_to_list(self, stack):
+        return [
+            {'id': my_id, 'name': method_name, 'file': filename_in_utf8, 'line': lineno}
+            for my_id, method_name, filename_in_utf8, lineno in stack
+        ]
+
+    def make_thread_stack_str(self, frame):
+        stack, _total_frames = self._get_thread_stack(frame)
+        return self._thread_stack_to_xml(stack)
+
+    def make_thread_stack_list(self, frame):
+        """ Same as make_thread_stack_str, but returns a list of dicts with id, name, file and line. """
+        stack, _total_frames = self._get_thread_stack(frame)
+        return self._thread_stack_to_list(stack)
+
     def make_thread_suspend_str(
         self,
         thread_id,
@@ -813,10 +1177,36 @@ class NetCommandFactory:
 
         return ''.join(cmd_text_list), thread_stack_str
 
+    def make_thread_suspend_dict(
+        self,
+        thread_id,
+        frame,
+        stop_reason=None,
+        message=None,
+        suspend_type="trace",
+        ):
+        """
+        :return tuple(dict,list):
+            Same as make_thread_suspend_str, but with the thread as a dict and the stack as
+            a list (see: make_thread_stack_list).
+        """
+        thread_stack = self.make_thread_stack_list(frame)
+        thread_suspend = {'id': thread_id, 'frames': thread_stack}
+        if stop_reason is not None:
+            thread_suspend['stop_reason'] = stop_reason
+        if message is not None:
+            thread_suspend['message'] = message
+        if suspend_type is not None:
+            thread_suspend['suspend_type'] = suspend_type
+        return thread_suspend, thread_stack
+
     def make_thread_suspend_message(self, thread_id, frame, stop_reason, message, suspend_type):
         try:
-            
-            thread_suspend_str, thread_stack_str = self.make_thread_suspend_str(
+            if self.structured_payloads:
+                make_thread_suspend = self.make_thread_suspend_dict
+            else:
+                make_thread_suspend = self.make_thread_suspend_str
+            thread_suspend_str, thread_stack_str = make_thread_suspend(
                 thread_id, frame, stop_reason, message, suspend_type)
             cmd = NetCommand(CMD_THREAD_SUSPEND, 0, thread_suspend_str)
             cmd.thread_stack_str = thread_stack_str
@@ -902,6 +1292,8 @@ class NetCommandFactory:
         
     def make_get_exception_details_message(self, seq, thread_id, topmost_frame):
         """Returns exception details as XML """
+        if self.structured_payloads:
+            return self._make_get_exception_details_structured_message(seq, thread_id, topmost_frame)
         try:
             # If the debugger is not suspended, just return the thread and its id.
             cmd_text = ['<xml><thread id="%s" ' % (thread_id,)]
@@ -931,6 +1323,33 @@ class NetCommandFactory:
         except:
             return self.make_error_message(seq, get_exception_traceback_str())
 
+    def _make_get_exception_details_structured_message(self, seq, thread_id, topmost_frame):
+        try:
+            # If the debugger is not suspended, just return the thread and its id.
+            details = {'id': thread_id}
+
+            if topmost_frame is not None:
+                try:
+                    frame = topmost_frame
+                    topmost_frame = None
+                    while frame is not None:
+                        if frame.f_code.co_name == 'do_wait_suspend' and frame.f_code.co_filename.endswith('pydevd.py'):
+                            arg = frame.f_locals.get('arg', None)
+                            if arg is not None:
+                                exc_type, exc_desc, trace_obj = arg
+                                while trace_obj.tb_next is not None:
+                                    trace_obj = trace_obj.tb_next
+                                details['exc_type'] = str(exc_type) or 'exception: type unknown'
+                                details['exc_desc'] = str(exc_desc) or 'exception: no description'
+                                details['frames'] = self.make_thread_stack_list(trace_obj.tb_frame)
+                                break
+                        frame = frame.f_back
+                finally:
+                    frame = None
+            return NetCommand(CMD_GET_EXCEPTION_DETAILS, seq, details)
+        except:
+            return self.make_error_message(seq, get_exception_traceback_str())
+
     def make_send_curr_exception_trace_proceeded_message(self, seq, thread_id):
         try:
             return NetCommand(CMD_SEND_CURR_EXCEPTION_TRACE_PROCEEDED, 0, str(thread_id))
@@ -1158,27 +1577,72 @@ class InternalGetVariable(InternalThreadCommand):
     def do_it(self, dbg):
         """ Converts request into python variable """
         try:
-            xml = StringIO.StringIO()
-            xml.write("<xml>")
             _typeName, val_dict = pydevd_vars.resolve_compound_variable_fields(self.thread_id, self.frame_id, self.scope, self.attributes)
             if val_dict is None:
                 val_dict = {}
 
-            # assume properly ordered if resolver returns 'OrderedDict'
-            # check type as string to support OrderedDict backport for older Python
-            keys = dict_keys(val_dict)
-            if not (_typeName == "OrderedDict" or val_dict.__class__.__name__ == "OrderedDict" or IS_PY36_OR_GREATER):
-                keys.sort(key=compare_object_attrs_key)
+            self._send_variables(dbg, [(k, val_dict[k]) for k in self._get_sorted_keys(_typeName, val_dict)])
+        except Exception:
+            cmd = dbg.cmd_factory.make_error_message(
+                self.sequence, "Error resolving variables %s" % (get_exception_traceback_str(),))
+            dbg.writer.add_command(cmd)
 
-            for k in keys:
-                val = val_dict[k]
+    def _get_sorted_keys(self, type_name, val_dict):
+        # assume properly ordered if resolver returns 'OrderedDict'
+        # check type as string to support OrderedDict backport for older Python
+        keys = dict_keys(val_dict)
+        if not (type_name == "OrderedDict" or val_dict.__class__.__name__ == "OrderedDict" or IS_PY36_OR_GREATER):
+            keys.sort(key=compare_object_attrs_key)
+        return keys
+
+    def _send_variables(self, dbg, items):
+        """ :param items: list(tuple(name, value)) """
+        if dbg.cmd_factory.structured_payloads:
+            variables = []
+            for k, val in items:
                 evaluate_full_value = pydevd_xml.should_evaluate_full_value(val)
-                xml.write(pydevd_xml.var_to_xml(val, k, evaluate_full_value=evaluate_full_value))
-
-            xml.write("</xml>")
-            cmd = dbg.cmd_factory.make_get_variable_message(self.sequence, xml.getvalue())
-            xml.close()
+                variables.append(pydevd_xml.var_to_dict(val, k, evaluate_full_value=evaluate_full_value))
+            cmd = dbg.cmd_factory.make_get_variable_message(self.sequence, variables)
             dbg.writer.add_command(cmd)
+            return
+
+        xml = StringIO.StringIO()
+        xml.write("<xml>")
+        for k, val in items:
+            evaluate_full_value = pydevd_xml.should_evaluate_full_value(val)
+            xml.write(pydevd_xml.var_to_xml(val, k, evaluate_full_value=evaluate_full_value))
+
+        xml.write("</xml>")
+        cmd = dbg.cmd_factory.make_get_variable_message(self.sequence, xml.getvalue())
+        xml.close()
+        dbg.writer.add_command(cmd)
+
+
+#=======================================================================================================================
+# InternalGetVariablePage
+#=======================================================================================================================
+class InternalGetVariablePage(InternalGetVariable):
+    """ gets a page of the fields of a variable (the named fields are followed by the indexed fields
+    in [start:start + count]) """
+    def __init__(self, seq, thread_id, frame_id, scope, attrs, start, count, filter):
+        InternalGetVariable.__init__(self, seq, thread_id, frame_id, scope, attrs)
+        self.start = start
+        self.count = count
+        self.filter = filter
+
+    def do_it(self, dbg):
+        """ Converts request into python variable """
+        try:
+            resolved = pydevd_vars.resolve_compound_variable_page(
+                self.thread_id, self.frame_id, self.scope, self.attributes, self.start, self.count, self.filter)
+            if resolved is None:
+                items = []
+            else:
+                _typeName, named, indexed = resolved
+                items = [(k, named[k]) for k in self._get_sorted_keys(_typeName, named)]
+                items.extend(indexed)
+
+            self._send_variables(dbg, items)
         except Exception:
             cmd = dbg.cmd_factory.make_error_message(
                 self.sequence, "Error resolving variables %s" % (get_exception_traceback_str(),))
@@ -1256,6 +1720,12 @@ class InternalGetFrame(InternalThreadCommand):
             frame = pydevd_vars.find_frame(self.thread_id, self.frame_id)
             if frame is not None:
                 hidden_ns = pydevconsole.get_ipython_hidden_vars()
+                if dbg.cmd_factory.structured_payloads:
+                    variables = pydevd_xml.frame_vars_to_dicts(frame.f_locals, hidden_ns)
+                    del frame
+                    cmd = dbg.cmd_factory.make_get_frame_message(self.sequence, variables)
+                    dbg.writer.add_command(cmd)
+                    return
                 xml = "<xml>"
                 xml += pydevd_xml.frame_vars_to_xml(frame.f_locals, hidden_ns)
                 del frame
@@ -1332,6 +1802,11 @@ class InternalEvaluateExpression(InternalThreadCommand):
             result = pydevd_vars.evaluate_expression(self.thread_id, self.frame_id, self.expression, self.doExec)
             if self.temp_name != "":
                 pydevd_vars.change_attr_expression(self.thread_id, self.frame_id, self.temp_name, self.expression, dbg, result)
+            if dbg.cmd_factory.structured_payloads:
+                variables = [pydevd_xml.var_to_dict(result, self.expression, self.doTrim)]
+                cmd = dbg.cmd_factory.make_evaluate_expression_message(self.sequence, variables)
+                dbg.writer.add_command(cmd)
+                return
             xml = "<xml>"
             xml += pydevd_xml.var_to_xml(result, self.expression, self.doTrim)
             xml += "</xml>"
@@ -0,0 +1,149 @@
+'''
+Compiles simple breakpoint conditions (such as "i == 5000" or "x > 10 and not done") into functions which evaluate
+them directly against the frame, without eval() (which has to create a new frame to run the condition's code object
+on each hit).
+
+Only comparisons, boolean operators, "not", names and constants are supported. For any other expression None is
+returned (and the condition is evaluated with eval()).
+
+The names which are used are looked up in the frame locals, then in the globals and then in the builtins, just as
+eval() does. Note that up to Python 3.12, getting frame.f_locals copies all the fast locals to a dict on each hit
+(there's no other way to get them from Python code) and that's most of the cost of checking such a condition. From
+Python 3.13 onwards it's a proxy to the frame, so, the locals aren't copied.
+'''
+try:
+    import ast
+except ImportError:
+    ast = None
+
+try:
+    import __builtin__ as _builtins
+except ImportError:
+    import builtins as _builtins
+
+
+class _Unsupported(Exception):
+    pass
+
+
+_NAME_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+_COMPARE_OPERATORS = {
+    'Eq': '==',
+    'NotEq': '!=',
+    'Lt': '<',
+    'LtE': '<=',
+    'Gt': '>',
+    'GtE': '>=',
+    'Is': 'is',
+    'IsNot': 'is not',
+    'In': 'in',
+    'NotIn': 'not in',
+}
+
+
+def _load_global(frame, name):
+    f_globals = frame.f_globals
+    try:
+        return f_globals[name]
+    except KeyError:
+        pass
+
+    builtins = f_globals.get('__builtins__', _builtins)
+    try:
+        if isinstance(builtins, dict):
+            return builtins[name]
+        return getattr(builtins, name)
+    except (KeyError, AttributeError):
+        raise NameError("name '%s' is not defined" % (name,))
+
+
+def compile_condition(condition):
+    '''
+    :param str condition:
+        The condition of a breakpoint.
+
+    :return:
+        A function which receives a frame and returns the value of the condition in it (raising the same errors
+        eval() would) or None if the condition is not simple enough.
+    '''
+    if ast is None or condition is None:
+        return None
+    try:
+        generator = _Generator()
+        expression = generator.generate(ast.parse(condition.strip(), mode='eval').body)
+
+        lines = ['def evaluate_condition(_frame):']
+        if generator.uses_names:
+            lines.append('    _locals = _frame.f_locals')
+        lines.append('    return %s' % (expression,))
+
+        namespace = generator.constants
+        namespace['_load_global'] = _load_global
+        exec(compile('\n'.join(lines), '<breakpoint condition>', 'exec'), namespace)
+    except:
+        # Not supported (or not valid, in which case eval() reports the error).
+        return None
+
+    return namespace['evaluate_condition']
+
+
+class _Generator(object):
+    '''
+    Generates the source of an expression equivalent to the condition, where the names are looked up in the frame
+    (the constants are referenced from the namespace where it's compiled).
+    '''
+
+    def __init__(self):
+        self.constants = {}
+        self.uses_names = False
+
+    def _constant(self, value):
+        name = '_const%d' % (len(self.constants),)
+        self.constants[name] = value
+        return name
+
+    def generate(self, node):
+        node_type = node.__class__.__name__
+
+        if node_type == 'Constant' or node_type == 'NameConstant':
+            return self._constant(node.value)
+
+        if node_type == 'Num':
+            return self._constant(node.n)
+
+        if node_type == 'Str' or node_type == 'Bytes':
+            return self._constant(node.s)
+
+        if node_type == 'Name':
+            if node.ctx.__class__.__name__ != 'Load':
+                raise _Unsupported()
+            name = node.id
+            if name in _NAME_CONSTANTS:  # Python 2.
+                return self._constant(_NAME_CONSTANTS[name])
+            self.uses_names = True
+            return '(_locals[%r] if %r in _locals else _load_global(_frame, %r))' % (name, name, name)
+
+        if node_type == 'UnaryOp':
+            op_type = node.op.__class__.__name__
+            if op_type == 'Not':
+                return '(not %s)' % (self.generate(node.operand),)
+            if op_type == 'USub':
+                return '(-%s)' % (self.generate(node.operand),)
+            raise _Unsupported()
+
+        if node_type == 'BoolOp':
+            op = ' and ' if node.op.__class__.__name__ == 'And' else ' or '
+            return '(%s)' % (op.join(self.generate(value) for value in node.values),)
+
+        if node_type == 'Compare':
+            parts = [self.generate(node.left)]
+            for op, comparator in zip(node.ops, node.comparators):
+                try:
+                    parts.append(_COMPARE_OPERATORS[op.__class__.__name__])
+                except KeyError:
+                    raise _Unsupported()
+                parts.append(self.generate(comparator))
+            return '(%s)' % (' '.join(parts),)
+
+        raise _Unsupported()
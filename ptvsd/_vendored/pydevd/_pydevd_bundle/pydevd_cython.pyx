@@ -11,7 +11,7 @@ pydev_log.debug("Using Cython speedups")
 # from _pydevd_bundle.pydevd_frame import PyDBFrame
 # ENDIF
 
-version = 11
+version = 12
 
 if not hasattr(sys, '_current_frames'):
 
@@ -20,9 +20,9 @@ if not hasattr(sys, '_current_frames'):
         from java.lang import NoSuchFieldException
         from org.python.core import ThreadStateMapping
         try:
-            cachedThreadState = ThreadStateMapping.getDeclaredField('globalThreadStates') # Dev version
+            cachedThreadState = ThreadStateMapping.getDeclaredField('globalThreadStates')  # Dev version
         except NoSuchFieldException:
-            cachedThreadState = ThreadStateMapping.getDeclaredField('cachedThreadState') # Release Jython 2.7.0
+            cachedThreadState = ThreadStateMapping.getDeclaredField('cachedThreadState')  # Release Jython 2.7.0
         cachedThreadState.accessible = True
         thread_states = cachedThreadState.get(ThreadStateMapping)
 
@@ -56,6 +56,7 @@ if not hasattr(sys, '_current_frames'):
 else:
     _current_frames = sys._current_frames
 
+
 #=======================================================================================================================
 # PyDBAdditionalThreadInfo
 #=======================================================================================================================
@@ -80,6 +81,7 @@ cdef class PyDBAdditionalThreadInfo:
     cdef public int suspend_type;
     cdef public int pydev_next_line;
     cdef public str pydev_func_name;
+    cdef public bint suspended_at_unhandled;
     # ELSE
 #     __slots__ = [
 #         'pydev_state',
@@ -96,13 +98,14 @@ cdef class PyDBAdditionalThreadInfo:
 #         'suspend_type',
 #         'pydev_next_line',
 #         'pydev_func_name',
+#         'suspended_at_unhandled',
 #     ]
     # ENDIF
 
     def __init__(self):
         self.pydev_state = STATE_RUN
         self.pydev_step_stop = None
-        self.pydev_step_cmd = -1 # Something as CMD_STEP_INTO, CMD_STEP_OVER, etc.
+        self.pydev_step_cmd = -1  # Something as CMD_STEP_INTO, CMD_STEP_OVER, etc.
         self.pydev_notify_kill = False
         self.pydev_smart_step_stop = None
         self.pydev_django_resolve_frame = False
@@ -113,21 +116,42 @@ cdef class PyDBAdditionalThreadInfo:
         self.pydev_message = ''
         self.suspend_type = PYTHON_SUSPEND
         self.pydev_next_line = -1
-        self.pydev_func_name = '.invalid.' # Must match the type in cython
-
+        self.pydev_func_name = '.invalid.'  # Must match the type in cython
+        self.suspended_at_unhandled = False
 
-    def iter_frames(self, t):
-        #sys._current_frames(): dictionary with thread id -> topmost frame
+    def get_topmost_frame(self, thread):
+        '''
+        Gets the topmost frame for the given thread. Note that it may be None
+        and callers should remove the reference to the frame as soon as possible
+        to avoid disturbing user code.
+        '''
+        # sys._current_frames(): dictionary with thread id -> topmost frame
         current_frames = _current_frames()
-        v = current_frames.get(t.ident)
-        if v is not None:
-            return [v]
-        return []
+        return current_frames.get(thread.ident)
 
     def __str__(self):
         return 'State:%s Stop:%s Cmd: %s Kill:%s' % (
             self.pydev_state, self.pydev_step_stop, self.pydev_step_cmd, self.pydev_notify_kill)
 
+
+from _pydev_imps._pydev_saved_modules import threading
+_set_additional_thread_info_lock = threading.Lock()
+
+
+def set_additional_thread_info(thread):
+    try:
+        additional_info = thread.additional_info
+        if additional_info is None:
+            raise AttributeError()
+    except:
+        with _set_additional_thread_info_lock:
+            # If it's not there, set it within a lock to avoid any racing
+            # conditions.
+            additional_info = getattr(thread, 'additional_info', None)
+            if additional_info is None:
+                additional_info = thread.additional_info = PyDBAdditionalThreadInfo()
+
+    return additional_info
 import linecache
 import os.path
 import re
@@ -143,7 +167,8 @@ from _pydevd_bundle.pydevd_comm import CMD_STEP_CAUGHT_EXCEPTION, CMD_STEP_RETUR
 from _pydevd_bundle.pydevd_constants import STATE_SUSPEND, get_thread_id, STATE_RUN, dict_iter_values, IS_PY3K, \
     dict_keys, RETURN_VALUES_DICT
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE, PYDEV_FILE
-from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, just_raised, remove_exception_from_frame, ignore_exception_trace
+from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, just_raised, remove_exception_from_frame, ignore_exception_trace, \
+    has_breakpoint_in_code
 from _pydevd_bundle.pydevd_utils import get_clsname_for_code
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame
 try:
@@ -179,7 +204,11 @@ def handle_breakpoint_condition(py_db, info, breakpoint, new_frame):
         if condition is None:
             return False
 
-        return eval(condition, new_frame.f_globals, new_frame.f_locals)
+        condition_evaluator = breakpoint.condition_evaluator
+        if condition_evaluator is not None:
+            return condition_evaluator(new_frame)
+
+        return eval(breakpoint.condition_code, new_frame.f_globals, new_frame.f_locals)
 
     except:
         if type(condition) != type(''):
@@ -213,7 +242,7 @@ def handle_breakpoint_condition(py_db, info, breakpoint, new_frame):
 def handle_breakpoint_expression(breakpoint, info, new_frame):
     try:
         try:
-            val = eval(breakpoint.expression, new_frame.f_globals, new_frame.f_locals)
+            val = eval(breakpoint.expression_code, new_frame.f_globals, new_frame.f_locals)
         except:
             val = sys.exc_info()[1]
     finally:
@@ -322,21 +351,18 @@ cdef class PyDBFrame:
                         return False, frame
                     
                     was_just_raised = just_raised(trace)
-                    if was_just_raised:
-                        add_exception_to_frame(frame, (exception, value, trace))
-                    
                     if was_just_raised:
         
-                        if main_debugger.break_on_exceptions_thrown_in_same_context:
+                        if main_debugger.skip_on_exceptions_thrown_in_same_context:
                             # Option: Don't break if an exception is caught in the same function from which it is thrown
                             return False, frame
 
                     if exception_breakpoint.notify_on_first_raise_only:
-                        if main_debugger.break_on_exceptions_thrown_in_same_context:
+                        if main_debugger.skip_on_exceptions_thrown_in_same_context:
                             # In this case we never stop if it was just raised, so, to know if it was the first we
                             # need to check if we're in the 2nd method.
                             if not was_just_raised and not just_raised(trace.tb_next):
-                                return False, frame  # I.e.: we stop only when we'r
+                                return False, frame  # I.e.: we stop only when we're at the caller of a method that throws an exception
                                 
                         else:
                             if not was_just_raised:
@@ -348,6 +374,9 @@ cdef class PyDBFrame:
                         info.pydev_message = exception_breakpoint.qname
                     except:
                         info.pydev_message = exception_breakpoint.qname.encode('utf-8')
+                        
+                    # Always add exception to frame (must remove later after we proceed).
+                    add_exception_to_frame(frame, (exception, value, trace))
 
                 else:
                     # No regular exception breakpoint, let's see if some plugin handles it.
@@ -471,7 +500,10 @@ cdef class PyDBFrame:
 
             main_debugger.set_trace_for_frame_and_parents(frame)
         finally:
+            # Make sure the user cannot see the '__exception__' we added after we leave the suspend state.
+            remove_exception_from_frame(frame)
             #Clear some local variables...
+            frame = None
             trace_obj = None
             initial_trace_obj = None
             check_trace_obj = None
@@ -536,6 +568,8 @@ cdef class PyDBFrame:
         cdef bint is_line;
         cdef bint is_call;
         cdef bint is_return;
+        cdef bint should_stop;
+        cdef dict breakpoints_for_file;
         cdef str curr_func_name;
         cdef bint exist_result;
         cdef dict frame_skips_cache;
@@ -550,7 +584,7 @@ cdef class PyDBFrame:
     # ENDIF
 
         main_debugger, filename, info, thread, frame_skips_cache, frame_cache_key = self._args
-        # print('frame trace_dispatch', frame.f_lineno, frame.f_code.co_name, event, info.pydev_step_cmd)
+        # print('frame trace_dispatch', frame.f_lineno, frame.f_code.co_name, frame.f_code.co_filename, event, info.pydev_step_cmd)
         try:
             info.is_tracing = True
             line = frame.f_lineno
@@ -658,19 +692,9 @@ cdef class PyDBFrame:
                         has_breakpoint_in_frame = breakpoints_in_frame_cache == 1
 
                     else:
-                        has_breakpoint_in_frame = False
-                        # Checks the breakpoint to see if there is a context match in some function
-                        curr_func_name = frame.f_code.co_name
-
-                        #global context is set with an empty name
-                        if curr_func_name in ('?', '<module>'):
-                            curr_func_name = ''
-
-                        for breakpoint in dict_iter_values(breakpoints_for_file): #jython does not support itervalues()
-                            #will match either global or some function
-                            if breakpoint.func_name in ('None', curr_func_name):
-                                has_breakpoint_in_frame = True
-                                break
+                        # Checks whether some breakpoint is in the lines of this code object (nested functions
+                        # and lambdas are checked when their own frames are traced).
+                        has_breakpoint_in_frame = has_breakpoint_in_code(frame.f_code, breakpoints_for_file)
 
                         # Cache the value (1 or 0 or -1 for default because of cython).
                         if has_breakpoint_in_frame:
@@ -724,20 +748,21 @@ cdef class PyDBFrame:
 
                         if breakpoint.expression is not None:
                             handle_breakpoint_expression(breakpoint, info, new_frame)
-                            if breakpoint.is_logpoint:
+                            if breakpoint.is_logpoint and info.pydev_message is not None and len(info.pydev_message) > 0:
+                                cmd = main_debugger.cmd_factory.make_io_message(info.pydev_message + os.linesep, '1')
+                                main_debugger.writer.add_command(cmd)
                                 return self.trace_dispatch
+                            
+                    if is_call and frame.f_code.co_name in ('<module>', '<lambda>'):
+                        # If we find a call for a module, it means that the module is being imported/executed for the
+                        # first time. In this case we have to ignore this hit as it may later duplicated by a
+                        # line event at the same place (so, if there's a module with a print() in the first line
+                        # the user will hit that line twice, which is not what we want).
+                        #
+                        # As for lamdba, as it only has a single statement, it's not interesting to trace
+                        # its call and later its line event as they're usually in the same line.
+                        return self.trace_dispatch
 
-                        if not main_debugger.first_breakpoint_reached:
-                            if is_call:
-                                back = frame.f_back
-                                if back is not None:
-                                    # When we start debug session, we call execfile in pydevd run function. It produces an additional
-                                    # 'call' event for tracing and we stop on the first line of code twice.
-                                    _, back_filename, base = get_abs_path_real_path_and_base_from_frame(back)
-                                    if (base == DEBUG_START[0] and back.f_code.co_name == DEBUG_START[1]) or \
-                                            (base == DEBUG_START_PY3K[0] and back.f_code.co_name == DEBUG_START_PY3K[1]):
-                                        stop = False
-                                        main_debugger.first_breakpoint_reached = True
                 else:
                     # if the frame is traced after breakpoint stop,
                     # but the file should be ignored while stepping because of filters
@@ -873,7 +898,7 @@ cdef class PyDBFrame:
                             #(note that it can still go on for other threads, but for this one, we just make it finish)
                             #So, just setting it to None should be OK
                             _, back_filename, base = get_abs_path_real_path_and_base_from_frame(back)
-                            if base == DEBUG_START[0] and back.f_code.co_name == DEBUG_START[1]:
+                            if (base, back.f_code.co_name) in (DEBUG_START, DEBUG_START_PY3K):
                                 back = None
 
                             elif base == TRACE_PROPERTY:
@@ -930,14 +955,14 @@ from _pydevd_bundle.pydevd_kill_all_pydevd_threads import kill_all_pydev_threads
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame, NORM_PATHS_AND_BASE_CONTAINER
 from pydevd_tracing import SetTrace
 # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
-# In Cython, PyDBAdditionalThreadInfo is bundled in the file.
+# In Cython, set_additional_thread_info is bundled in the file.
 from cpython.object cimport PyObject
 from cpython.ref cimport Py_INCREF, Py_XDECREF
 # ELSE
-# from _pydevd_bundle.pydevd_additional_thread_info import PyDBAdditionalThreadInfo
+# from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
 # from _pydevd_bundle.pydevd_frame import PyDBFrame
-# 
 # ENDIF
+from os.path import basename, splitext
 
 threadingCurrentThread = threading.currentThread
 get_file_type = DONT_TRACE.get
@@ -948,7 +973,6 @@ get_file_type = DONT_TRACE.get
 # ELSE
 # ENDIF
 
-
 # Cache where we should keep that we completely skipped entering some context.
 # It needs to be invalidated when:
 # - Breakpoints are changed
@@ -964,7 +988,7 @@ def trace_dispatch(py_db, frame, event, arg):
     thread = None
     # Cache the frame which should be traced to deal with unhandled exceptions.
     # (i.e.: thread entry-points).
-    from os.path import basename, splitext
+
     f_unhandled = frame
     only_trace_for_unhandled_exceptions = True
     # print('called at', f_unhandled.f_code.co_name, f_unhandled.f_code.co_filename, f_unhandled.f_code.co_firstlineno)
@@ -974,7 +998,7 @@ def trace_dispatch(py_db, frame, event, arg):
         if name == 'threading':
             if f_unhandled.f_code.co_name in ('__bootstrap', '_bootstrap'):
                 # We need __bootstrap_inner, not __bootstrap.
-                return py_db.trace_dispatch
+                return None
             
             elif f_unhandled.f_code.co_name in ('__bootstrap_inner', '_bootstrap_inner'):
                 # Note: be careful not to use threading.currentThread to avoid creating a dummy thread.
@@ -985,6 +1009,10 @@ def trace_dispatch(py_db, frame, event, arg):
                     break
             
         elif name == 'pydevd':
+            if f_unhandled.f_code.co_name in ('run', 'main'):
+                # We need to get to _exec
+                return None
+            
             if f_unhandled.f_code.co_name == '_exec':
                 only_trace_for_unhandled_exceptions = True
                 break
@@ -1001,6 +1029,7 @@ def trace_dispatch(py_db, frame, event, arg):
         thread = threadingCurrentThread()
 
     if getattr(thread, 'pydev_do_not_trace', None):
+        SetTrace(None, apply_to_pydevd_thread=True)
         return None
 
     try:
@@ -1008,13 +1037,13 @@ def trace_dispatch(py_db, frame, event, arg):
         if additional_info is None:
             raise AttributeError()
     except:
-        additional_info = thread.additional_info = PyDBAdditionalThreadInfo()
+        additional_info = set_additional_thread_info(thread)
         
     # print('enter thread tracer', thread, get_thread_id(thread))
     thread_tracer = ThreadTracer((py_db, thread, additional_info, global_cache_skips, global_cache_frame_skips))
     
     if f_unhandled is not None:
-        # print(' --> found', f_unhandled.f_code.co_name, f_unhandled.f_code.co_filename, f_unhandled.f_code.co_firstlineno)
+        # print(' --> found to trace unhandled', f_unhandled.f_code.co_name, f_unhandled.f_code.co_filename, f_unhandled.f_code.co_firstlineno)
         if only_trace_for_unhandled_exceptions:
             f_trace = thread_tracer.trace_unhandled_exceptions
         else:
@@ -1057,7 +1086,9 @@ cdef class PyDbFrameTraceAndUnhandledExceptionsTrace(object):
         self._unhandled_trace = unhandled_trace
     
     def trace_dispatch(self, frame, event, arg):
+        # print('PyDbFrameTraceAndUnhandledExceptionsTrace', event, frame.f_code.co_name, frame.f_code.co_filename, frame.f_code.co_firstlineno)
         if event == 'exception' and arg is not None:
+            # print('self._unhandled_trace', self._unhandled_trace)
             self._unhandled_trace(frame, event, arg)
         else:
             self._pydb_frame_trace(frame, event, arg)
@@ -1093,12 +1124,16 @@ cdef class ThreadTracer:
 
     def trace_unhandled_exceptions(self, frame, event, arg):
         # Note that we ignore the frame as this tracing method should only be put in topmost frames already.
+        # print('trace_unhandled_exceptions', event, frame.f_code.co_name, frame.f_code.co_filename, frame.f_code.co_firstlineno)
         if event == 'exception' and arg is not None:
             from _pydevd_bundle.pydevd_breakpoints import stop_on_unhandled_exception
             py_db, t, additional_info = self._args[0:3]
             if arg is not None:
-                exctype, value, tb = arg
-                stop_on_unhandled_exception(py_db, t, additional_info, exctype, value, tb)        
+                if not additional_info.suspended_at_unhandled:
+                    if frame.f_back is not None:
+                        additional_info.suspended_at_unhandled = True
+                    
+                    stop_on_unhandled_exception(py_db, t, additional_info, arg)
         # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
         return SafeCallWrapper(self.trace_unhandled_exceptions)
         # ELSE
@@ -1106,6 +1141,7 @@ cdef class ThreadTracer:
         # ENDIF
     
     def trace_dispatch_and_unhandled_exceptions(self, frame, event, arg):
+        # print('trace_dispatch_and_unhandled_exceptions', event, frame.f_code.co_name, frame.f_code.co_filename, frame.f_code.co_firstlineno)
         if event == 'exception' and arg is not None:
             self.trace_unhandled_exceptions(frame, event, arg)
             ret = self.trace_dispatch_and_unhandled_exceptions
@@ -1119,7 +1155,7 @@ cdef class ThreadTracer:
                 # Ok, this frame needs to be traced and needs to deal with unhandled exceptions. Create
                 # a class which does this for us.
                 py_db_frame_trace_and_unhandled_exceptions_trace = PyDbFrameTraceAndUnhandledExceptionsTrace(
-                    self.trace_dispatch_and_unhandled_exceptions, pydb_frame_trace)
+                    pydb_frame_trace, self.trace_dispatch_and_unhandled_exceptions)
                 ret = py_db_frame_trace_and_unhandled_exceptions_trace.trace_dispatch
         # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
         return SafeCallWrapper(ret)
@@ -13,7 +13,8 @@ from _pydevd_bundle.pydevd_comm import CMD_STEP_CAUGHT_EXCEPTION, CMD_STEP_RETUR
 from _pydevd_bundle.pydevd_constants import STATE_SUSPEND, get_thread_id, STATE_RUN, dict_iter_values, IS_PY3K, \
     dict_keys, RETURN_VALUES_DICT
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE, PYDEV_FILE
-from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, just_raised, remove_exception_from_frame, ignore_exception_trace
+from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, just_raised, remove_exception_from_frame, ignore_exception_trace, \
+    has_breakpoint_in_code
 from _pydevd_bundle.pydevd_utils import get_clsname_for_code
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame
 try:
@@ -49,7 +50,11 @@ def handle_breakpoint_condition(py_db, info, breakpoint, new_frame):
         if condition is None:
             return False
 
-        return eval(condition, new_frame.f_globals, new_frame.f_locals)
+        condition_evaluator = breakpoint.condition_evaluator
+        if condition_evaluator is not None:
+            return condition_evaluator(new_frame)
+
+        return eval(breakpoint.condition_code, new_frame.f_globals, new_frame.f_locals)
 
     except:
         if type(condition) != type(''):
@@ -83,7 +88,7 @@ def handle_breakpoint_condition(py_db, info, breakpoint, new_frame):
 def handle_breakpoint_expression(breakpoint, info, new_frame):
     try:
         try:
-            val = eval(breakpoint.expression, new_frame.f_globals, new_frame.f_locals)
+            val = eval(breakpoint.expression_code, new_frame.f_globals, new_frame.f_locals)
         except:
             val = sys.exc_info()[1]
     finally:
@@ -533,19 +538,9 @@ class PyDBFrame:
                         has_breakpoint_in_frame = breakpoints_in_frame_cache == 1
 
                     else:
-                        has_breakpoint_in_frame = False
-                        # Checks the breakpoint to see if there is a context match in some function
-                        curr_func_name = frame.f_code.co_name
-
-                        #global context is set with an empty name
-                        if curr_func_name in ('?', '<module>', '<lambda>'):
-                            curr_func_name = ''
-
-                        for breakpoint in dict_iter_values(breakpoints_for_file): #jython does not support itervalues()
-                            #will match either global or some function
-                            if breakpoint.func_name in ('None', curr_func_name):
-                                has_breakpoint_in_frame = True
-                                break
+                        # Checks whether some breakpoint is in the lines of this code object (nested functions
+                        # and lambdas are checked when their own frames are traced).
+                        has_breakpoint_in_frame = has_breakpoint_in_code(frame.f_code, breakpoints_for_file)
 
                         # Cache the value (1 or 0 or -1 for default because of cython).
                         if has_breakpoint_in_frame:
@@ -1,4 +1,10 @@
 from _pydevd_bundle.pydevd_constants import IS_PY3K
+import weakref
+
+try:
+    from dis import findlinestarts
+except:
+    findlinestarts = None
 
 class Frame(object):
     def __init__(
@@ -65,4 +71,52 @@ def cached_call(obj, func, *args):
 
     return getattr(obj, cached_name)
 
-
+# Weakly keyed by the code object (when code objects can't be weakly referenced the lines are just not cached).
+_code_to_lines = weakref.WeakKeyDictionary()
+
+
+def get_code_lines(code):
+    '''
+    :return frozenset(int):
+        The lines in which the given code object may have 'line' events (along with its first line, where
+        the 'call' event happens) or None if that can't be computed. Note that the lines of nested functions,
+        lambdas, etc. are in their own code objects.
+    '''
+    try:
+        return _code_to_lines[code]
+    except (KeyError, TypeError):
+        pass
+
+    if findlinestarts is None:
+        return None
+    try:
+        lines = set(lineno for _offset, lineno in findlinestarts(code) if lineno is not None)
+    except:
+        # i.e.: Jython/IronPython code objects.
+        return None
+    lines.add(code.co_firstlineno)
+    lines = frozenset(lines)
+
+    try:
+        _code_to_lines[code] = lines
+    except TypeError:
+        pass
+    return lines
+
+
+def has_breakpoint_in_code(code, breakpoints_for_file):
+    '''
+    :param dict breakpoints_for_file:
+        The breakpoints for the file of the code (line -> breakpoint).
+
+    :return bool:
+        Whether a breakpoint may be hit while running the given code object.
+    '''
+    code_lines = get_code_lines(code)
+    if code_lines is None:
+        return True  # Unable to know: we have to trace it.
+
+    for line in breakpoints_for_file:
+        if line in code_lines:
+            return True
+    return False
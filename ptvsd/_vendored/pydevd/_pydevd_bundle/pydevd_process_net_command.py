@@ -20,11 +20,75 @@ from _pydevd_bundle.pydevd_comm import CMD_RUN, CMD_VERSION, CMD_LIST_THREADS, C
     CMD_RUN_CUSTOM_OPERATION, InternalRunCustomOperation, CMD_IGNORE_THROWN_EXCEPTION_AT, CMD_ENABLE_DONT_TRACE, \
     CMD_SHOW_RETURN_VALUES, ID_TO_MEANING, CMD_GET_DESCRIPTION, InternalGetDescription, InternalLoadFullValue, \
     CMD_LOAD_FULL_VALUE, CMD_REDIRECT_OUTPUT, CMD_GET_NEXT_STATEMENT_TARGETS, InternalGetNextStatementTargets, CMD_SET_PROJECT_ROOTS, \
-    CMD_GET_THREAD_STACK, CMD_THREAD_DUMP_TO_STDERR, CMD_STOP_ON_START, CMD_GET_EXCEPTION_DETAILS
+    CMD_GET_THREAD_STACK, CMD_THREAD_DUMP_TO_STDERR, CMD_STOP_ON_START, CMD_GET_EXCEPTION_DETAILS, \
+    CMD_GET_VARIABLE_PAGE, InternalGetVariablePage, CMD_SET_FILE_BREAKPOINTS
 from _pydevd_bundle.pydevd_constants import get_thread_id, IS_PY3K, DebugInfoHolder, dict_keys, STATE_RUN, \
     NEXT_VALUE_SEPARATOR, IS_WINDOWS
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
 
+
+def _unescape_breakpoint_text(text):
+    # We must restore new lines and tabs as done in
+    # AbstractDebugTarget.breakpointAdded
+    return text.replace("@_@NEW_LINE_CHAR@_@", '\n').replace("@_@TAB_CHAR@_@", '\t').strip()
+
+
+def _norm_breakpoint_file(file):
+    if not IS_PY3K:  # In Python 3, the frame object will have unicode for the file, whereas on python 2 it has a byte-array encoded with the filesystem encoding.
+        file = file.encode(file_system_encoding)
+
+    file = pydevd_file_utils.norm_file_to_server(file)
+
+    if not pydevd_file_utils.exists(file):
+        sys.stderr.write('pydev debugger: warning: trying to add breakpoint'\
+            ' to file that does not exist: %s (will have no effect)\n' % (file,))
+        sys.stderr.flush()
+    return file
+
+
+def _create_line_breakpoint(py_db, type, file, line, func_name, condition, expression, suspend_policy, hit_condition, is_logpoint):
+    '''
+    :return tuple(breakpoint, breakpoints, file_to_id_to_breakpoint):
+        The breakpoint created along with the dicts where it should be added.
+
+    :raise NameError: if the breakpoint type is not supported.
+    '''
+    if condition is not None and (len(condition) <= 0 or condition == "None"):
+        condition = None
+
+    if expression is not None and (len(expression) <= 0 or expression == "None"):
+        expression = None
+
+    if hit_condition is not None and (len(hit_condition) <= 0 or hit_condition == "None"):
+        hit_condition = None
+
+    if type == 'python-line':
+        breakpoint = LineBreakpoint(line, condition, func_name, expression, suspend_policy, hit_condition=hit_condition, is_logpoint=is_logpoint)
+        breakpoints = py_db.breakpoints
+        file_to_id_to_breakpoint = py_db.file_to_id_to_line_breakpoint
+        supported_type = True
+    else:
+        result = None
+        plugin = py_db.get_plugin_lazy_init()
+        if plugin is not None:
+            result = plugin.add_breakpoint('add_line_breakpoint', py_db, type, file, line, condition, expression, func_name, hit_condition=hit_condition, is_logpoint=is_logpoint)
+        if result is not None:
+            supported_type = True
+            breakpoint, breakpoints = result
+            file_to_id_to_breakpoint = py_db.file_to_id_to_plugin_breakpoint
+        else:
+            supported_type = False
+
+    if not supported_type:
+        raise NameError(type)
+
+    if DebugInfoHolder.DEBUG_TRACE_BREAKPOINTS > 0:
+        pydev_log.debug('Added breakpoint:%s - line:%s - func_name:%s\n' % (file, line, func_name.encode('utf-8')))
+        sys.stderr.flush()
+
+    return breakpoint, breakpoints, file_to_id_to_breakpoint
+
+
 def process_net_command(py_db, cmd_id, seq, text):
     '''Processes a command received from the Java side
 
@@ -63,6 +127,9 @@ def process_net_command(py_db, cmd_id, seq, text):
                 # Breakpoints can be grouped by 'LINE' or by 'ID'.
                 breakpoints_by = 'LINE'
 
+                # Payloads can be 'XML' or 'JSON' (see: NetCommandFactory.structured_payloads).
+                payload_format = 'XML'
+
                 splitted = text.split('\t')
                 if len(splitted) == 1:
                     _local_version = splitted
@@ -73,11 +140,16 @@ def process_net_command(py_db, cmd_id, seq, text):
                 elif len(splitted) == 3:
                     _local_version, ide_os, breakpoints_by = splitted
 
+                elif len(splitted) == 4:
+                    _local_version, ide_os, breakpoints_by, payload_format = splitted
+
                 if breakpoints_by == 'ID':
                     py_db._set_breakpoints_with_id = True
                 else:
                     py_db._set_breakpoints_with_id = False
 
+                py_db.cmd_factory.structured_payloads = payload_format == 'JSON'
+
                 pydevd_file_utils.set_ide_os(ide_os)
 
                 cmd = py_db.cmd_factory.make_version_message(seq)
@@ -87,7 +159,14 @@ def process_net_command(py_db, cmd_id, seq, text):
                 cmd = py_db.cmd_factory.make_list_threads_message(seq)
 
             elif cmd_id == CMD_GET_THREAD_STACK:
-                thread_id = text
+                # the text is: thread_id or thread_id\tstart_frame\tlevels (to get only that window of
+                # the stack -- levels may be 0 to get all the frames after start_frame).
+                start_frame = levels = 0
+                if '\t' in text:
+                    thread_id, start_frame, levels = text.split('\t')
+                    start_frame, levels = int(start_frame), int(levels)
+                else:
+                    thread_id = text
             
                 t = pydevd_find_thread_by_id(thread_id)
                 frame = None
@@ -95,7 +174,7 @@ def process_net_command(py_db, cmd_id, seq, text):
                     additional_info = set_additional_thread_info(t)
                     frame = additional_info.get_topmost_frame(t)
                 try:
-                    cmd = py_db.cmd_factory.make_get_thread_stack_message(seq, thread_id, frame)
+                    cmd = py_db.cmd_factory.make_get_thread_stack_message(seq, thread_id, frame, start_frame, levels)
                 finally:
                     frame = None
                     t = None
@@ -126,6 +205,7 @@ def process_net_command(py_db, cmd_id, seq, text):
                     t.additional_info.pydev_step_cmd = -1
                     t.additional_info.pydev_step_stop = None
                     t.additional_info.pydev_state = STATE_RUN
+                    py_db.wake_suspended_thread(text)
 
                 elif text.startswith('__frame__:'):
                     sys.stderr.write("Can't make tasklet run: %s\n" % (text,))
@@ -206,6 +286,25 @@ def process_net_command(py_db, cmd_id, seq, text):
                 except:
                     traceback.print_exc()
 
+            elif cmd_id == CMD_GET_VARIABLE_PAGE:
+                # we received some command to get a page of a variable
+                # the text is: start\tcount\tfilter\tthread_id\tframe_id\tFRAME|GLOBAL\tattributes*
+                # (count may be 0 for the default page size and filter may be 'indexed', 'named' or empty)
+                try:
+                    start, count, filter, thread_id, frame_id, scopeattrs = text.split('\t', 5)
+
+                    if scopeattrs.find('\t') != -1:  # there are attributes beyond scope
+                        scope, attrs = scopeattrs.split('\t', 1)
+                    else:
+                        scope, attrs = (scopeattrs, None)
+
+                    int_cmd = InternalGetVariablePage(
+                        seq, thread_id, frame_id, scope, attrs, int(start), int(count), filter or None)
+                    py_db.post_internal_command(int_cmd, thread_id)
+
+                except:
+                    traceback.print_exc()
+
             elif cmd_id == CMD_GET_ARRAY:
                 # we received some command to get an array variable
                 # the text is: thread_id\tframe_id\tFRAME|GLOBAL\tname\ttemp\troffs\tcoffs\trows\tcols\tformat
@@ -294,13 +393,8 @@ def process_net_command(py_db, cmd_id, seq, text):
                     breakpoint_id = int(breakpoint_id)
                     line = int(line)
 
-                    # We must restore new lines and tabs as done in
-                    # AbstractDebugTarget.breakpointAdded
-                    condition = condition.replace("@_@NEW_LINE_CHAR@_@", '\n').\
-                        replace("@_@TAB_CHAR@_@", '\t').strip()
-
-                    expression = expression.replace("@_@NEW_LINE_CHAR@_@", '\n').\
-                        replace("@_@TAB_CHAR@_@", '\t').strip()
+                    condition = _unescape_breakpoint_text(condition)
+                    expression = _unescape_breakpoint_text(expression)
                 else:
                     # Note: this else should be removed after PyCharm migrates to setting
                     # breakpoints by id (and ideally also provides func_name).
@@ -309,55 +403,13 @@ def process_net_command(py_db, cmd_id, seq, text):
                     # the id to be the line.
                     breakpoint_id = line = int(line)
 
-                    condition = condition.replace("@_@NEW_LINE_CHAR@_@", '\n'). \
-                        replace("@_@TAB_CHAR@_@", '\t').strip()
-
-                    expression = expression.replace("@_@NEW_LINE_CHAR@_@", '\n'). \
-                        replace("@_@TAB_CHAR@_@", '\t').strip()
-
-                if not IS_PY3K:  # In Python 3, the frame object will have unicode for the file, whereas on python 2 it has a byte-array encoded with the filesystem encoding.
-                    file = file.encode(file_system_encoding)
-
-                file = pydevd_file_utils.norm_file_to_server(file)
-
-                if not pydevd_file_utils.exists(file):
-                    sys.stderr.write('pydev debugger: warning: trying to add breakpoint'\
-                        ' to file that does not exist: %s (will have no effect)\n' % (file,))
-                    sys.stderr.flush()
+                    condition = _unescape_breakpoint_text(condition)
+                    expression = _unescape_breakpoint_text(expression)
 
+                file = _norm_breakpoint_file(file)
 
-                if condition is not None and (len(condition) <= 0 or condition == "None"):
-                    condition = None
-
-                if expression is not None and (len(expression) <= 0 or expression == "None"):
-                    expression = None
-
-                if hit_condition is not None and (len(hit_condition) <= 0 or hit_condition == "None"):
-                    hit_condition = None
-
-                if type == 'python-line':
-                    breakpoint = LineBreakpoint(line, condition, func_name, expression, suspend_policy, hit_condition=hit_condition, is_logpoint=is_logpoint)
-                    breakpoints = py_db.breakpoints
-                    file_to_id_to_breakpoint = py_db.file_to_id_to_line_breakpoint
-                    supported_type = True
-                else:
-                    result = None
-                    plugin = py_db.get_plugin_lazy_init()
-                    if plugin is not None:
-                        result = plugin.add_breakpoint('add_line_breakpoint', py_db, type, file, line, condition, expression, func_name, hit_condition=hit_condition, is_logpoint=is_logpoint)
-                    if result is not None:
-                        supported_type = True
-                        breakpoint, breakpoints = result
-                        file_to_id_to_breakpoint = py_db.file_to_id_to_plugin_breakpoint
-                    else:
-                        supported_type = False
-
-                if not supported_type:
-                    raise NameError(type)
-
-                if DebugInfoHolder.DEBUG_TRACE_BREAKPOINTS > 0:
-                    pydev_log.debug('Added breakpoint:%s - line:%s - func_name:%s\n' % (file, line, func_name.encode('utf-8')))
-                    sys.stderr.flush()
+                breakpoint, breakpoints, file_to_id_to_breakpoint = _create_line_breakpoint(
+                    py_db, type, file, line, func_name, condition, expression, suspend_policy, hit_condition, is_logpoint)
 
                 if file in file_to_id_to_breakpoint:
                     id_to_pybreakpoint = file_to_id_to_breakpoint[file]
@@ -372,6 +424,48 @@ def process_net_command(py_db, cmd_id, seq, text):
                 py_db.set_tracing_for_untraced_contexts_if_not_frame_eval(overwrite_prev_trace=True)
                 py_db.enable_tracing_in_frames_while_running_if_frame_eval()
 
+            elif cmd_id == CMD_SET_FILE_BREAKPOINTS:
+                # Replaces all the breakpoints of a type in a file, so, the skip caches are cleared and the
+                # tracing is set for untraced contexts only once for the whole file (and not for each breakpoint).
+                # text is type\tfile and then one line for each breakpoint with:
+                # breakpoint_id\tline\tfunc_name\tcondition\texpression\thit_condition\tis_logpoint\tsuspend_policy
+                lines = text.split('\n')
+                type, file = lines[0].split('\t', 1)
+                file = _norm_breakpoint_file(file)
+
+                id_to_pybreakpoint = {}
+                breakpoints = file_to_id_to_breakpoint = None
+                for breakpoint_text in lines[1:]:
+                    if not breakpoint_text:
+                        continue
+                    breakpoint_id, line, func_name, condition, expression, hit_condition, is_logpoint, suspend_policy = \
+                        breakpoint_text.split('\t', 7)
+                    breakpoint, breakpoints, file_to_id_to_breakpoint = _create_line_breakpoint(
+                        py_db, type, file, int(line), func_name, _unescape_breakpoint_text(condition),
+                        _unescape_breakpoint_text(expression), suspend_policy, _unescape_breakpoint_text(hit_condition),
+                        is_logpoint == 'True')
+                    id_to_pybreakpoint[int(breakpoint_id)] = breakpoint
+
+                if file_to_id_to_breakpoint is None:
+                    # No breakpoints: just remove the existing ones (if any).
+                    if type == 'python-line':
+                        breakpoints = py_db.breakpoints
+                        file_to_id_to_breakpoint = py_db.file_to_id_to_line_breakpoint
+                    elif file in py_db.file_to_id_to_plugin_breakpoint and py_db.get_plugin_lazy_init() is not None:
+                        breakpoints = py_db.plugin.get_breakpoints(py_db, type)
+                        if breakpoints is not None:
+                            file_to_id_to_breakpoint = py_db.file_to_id_to_plugin_breakpoint
+
+                if file_to_id_to_breakpoint is not None:
+                    file_to_id_to_breakpoint[file] = id_to_pybreakpoint
+                    py_db.consolidate_breakpoints(file, id_to_pybreakpoint, breakpoints)
+                    if py_db.plugin is not None:
+                        py_db.has_plugin_line_breaks = py_db.plugin.has_line_breaks()
+
+                    if id_to_pybreakpoint:
+                        py_db.set_tracing_for_untraced_contexts_if_not_frame_eval(overwrite_prev_trace=True)
+                        py_db.enable_tracing_in_frames_while_running_if_frame_eval()
+
             elif cmd_id == CMD_REMOVE_BREAK:
                 #command to remove some breakpoint
                 #text is type\file\tid. Remove from breakpoints dictionary
@@ -2,6 +2,7 @@ try:
     import StringIO
 except:
     import io as StringIO
+import itertools
 import traceback
 from os.path import basename
 
@@ -16,6 +17,17 @@ MAX_ITEMS_TO_HANDLE = 300
 TOO_LARGE_MSG = 'Too large to show contents. Max items to show: ' + str(MAX_ITEMS_TO_HANDLE)
 TOO_LARGE_ATTR = 'Unable to handle:'
 
+
+def _get_slice(var, start, count):
+    '''
+    :return: the items in var[start:start + count] (without copying the items before start
+        for containers which can't be sliced, such as deque or set).
+    '''
+    try:
+        return var[start:start + count]
+    except TypeError:
+        return itertools.islice(var, start, start + count)
+
 #=======================================================================================================================
 # UnableToResolveVariableException
 #=======================================================================================================================
@@ -56,6 +68,13 @@ except:
 
 #=======================================================================================================================
 # See: pydevd_extension_api module for resolver interface
+#
+# Resolvers of containers may also provide (to get the contents a page at a time):
+#
+#     get_indexed_count(var) -> int: the number of indexed items.
+#     get_indexed_items(var, start, count) -> list(tuple(str, object)): the (name, value) of
+#         the indexed items in [start:start + count].
+#     get_named_dictionary(var) -> dict: the fields which aren't indexed items (i.e.: __len__).
 #=======================================================================================================================
 
 
@@ -242,6 +261,20 @@ class DictResolver:
         ret.update(additional_fields)
         return ret
 
+    def get_indexed_count(self, dict):
+        return len(dict)
+
+    def get_indexed_items(self, dict, start, count):
+        return [
+            ('%s (%s)' % (self.key_to_str(key), id(key)), val)
+            for key, val in itertools.islice(dict_iter_items(dict), start, start + count)
+        ]
+
+    def get_named_dictionary(self, dict):
+        ret = {'__len__': len(dict)}
+        ret.update(defaultResolver.get_dictionary(dict))
+        return ret
+
 
 #=======================================================================================================================
 # TupleResolver
@@ -281,6 +314,18 @@ class TupleResolver: #to enumerate tuples and lists
         d.update(additional_fields)
         return d
 
+    def get_indexed_count(self, var):
+        return len(var)
+
+    def get_indexed_items(self, var, start, count):
+        format_str = '%0' + str(int(len(str(len(var))))) + 'd'
+        return [(format_str % i, item) for i, item in enumerate(_get_slice(var, start, count), start)]
+
+    def get_named_dictionary(self, var):
+        d = {'__len__': len(var)}
+        d.update(defaultResolver.get_dictionary(var))
+        return d
+
 
 
 #=======================================================================================================================
@@ -324,6 +369,17 @@ class SetResolver:
         d.update(additional_fields)
         return d
 
+    def get_indexed_count(self, var):
+        return len(var)
+
+    def get_indexed_items(self, var, start, count):
+        return [(str(id(item)), item) for item in _get_slice(var, start, count)]
+
+    def get_named_dictionary(self, var):
+        d = {'__len__': len(var)}
+        d.update(defaultResolver.get_dictionary(var))
+        return d
+
 
 #=======================================================================================================================
 # InstanceResolver
@@ -433,6 +489,11 @@ class DequeResolver(TupleResolver):
         d['maxlen'] = getattr(var, 'maxlen', None)
         return d
 
+    def get_named_dictionary(self, var):
+        d = TupleResolver.get_named_dictionary(self, var)
+        d['maxlen'] = getattr(var, 'maxlen', None)
+        return d
+
 
 #=======================================================================================================================
 # OrderedDictResolver
@@ -13,6 +13,9 @@ if not CYTHON_SUPPORTED or dirname.endswith('.egg'):
     # Do not try to import cython extensions if cython isn't supported
     use_cython = 'NO'
 
+# Whether the cython version of the tracer is the one in use.
+USING_CYTHON = False
+
 
 def delete_old_compiled_extensions():
     import _pydevd_bundle_ext
@@ -41,6 +44,7 @@ if use_cython == 'YES':
     from _pydevd_bundle.pydevd_cython_wrapper import trace_dispatch as _trace_dispatch, global_cache_skips, global_cache_frame_skips
     def trace_dispatch(py_db, frame, event, arg):
         return _trace_dispatch(py_db, frame, event, arg)
+    USING_CYTHON = True
 
 elif use_cython == 'NO':
     # Use the regular version if not forcing cython
@@ -60,6 +64,7 @@ elif use_cython is None:
         if cython_version != regular_version:
             delete_old_compiled_extensions()
             raise ImportError()
+        USING_CYTHON = True
 
     except ImportError:
         from _pydevd_bundle.pydevd_trace_dispatch_regular import trace_dispatch, global_cache_skips, global_cache_frame_skips  # @UnusedImport
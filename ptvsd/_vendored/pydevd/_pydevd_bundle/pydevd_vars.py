@@ -2,10 +2,12 @@
     resolution/conversion to XML.
 """
 import pickle
-from _pydevd_bundle.pydevd_constants import get_frame, get_thread_id, xrange
+import re
+from _pydevd_bundle.pydevd_constants import get_frame, get_thread_id, xrange, MAXIMUM_VARIABLE_REPRESENTATION_SIZE
 
 from _pydevd_bundle.pydevd_custom_frames import get_custom_frame
-from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate, get_type, var_to_xml
+from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate, get_type, var_to_xml, make_valid_xml_value
+from _pydevd_bundle.pydevd_resolver import MAX_ITEMS_TO_HANDLE, TOO_LARGE_ATTR, TOO_LARGE_MSG
 from _pydev_imps._pydev_saved_modules import thread
 
 try:
@@ -257,6 +259,46 @@ def resolve_compound_variable_fields(thread_id, frame_id, scope, attrs):
         traceback.print_exc()
 
 
+def resolve_compound_variable_page(thread_id, frame_id, scope, attrs, start, count, filter):
+    """
+    Same as resolve_compound_variable_fields, but only resolves the requested page of the indexed fields
+    (i.e.: items of a list, dict, set) of the compound variable.
+
+    :param start: the index of the first indexed field to resolve
+    :param count: the number of indexed fields to resolve (if 0, up to MAX_ITEMS_TO_HANDLE)
+    :param filter: 'indexed' or 'named' to resolve only those fields (if None, both are resolved)
+    :return: tuple(type_name, named_fields_dict, indexed_fields_list(tuple(name, value)))
+    """
+
+    var = getVariable(thread_id, frame_id, scope, attrs)
+
+    try:
+        _type, _typeName, resolver = get_type(var)
+        if not hasattr(resolver, 'get_indexed_items'):
+            # Not paged: all the fields are named fields.
+            if filter == 'indexed':
+                return _typeName, {}, []
+            return _typeName, resolver.get_dictionary(var), []
+
+        named = {}
+        if filter != 'indexed':
+            named = resolver.get_named_dictionary(var)
+
+        indexed = []
+        if filter != 'named':
+            if count:
+                indexed = resolver.get_indexed_items(var, start, count)
+            else:
+                indexed = resolver.get_indexed_items(var, start, MAX_ITEMS_TO_HANDLE)
+                if resolver.get_indexed_count(var) - start > MAX_ITEMS_TO_HANDLE:
+                    indexed.append((TOO_LARGE_ATTR, TOO_LARGE_MSG))
+        return _typeName, named, indexed
+    except:
+        sys.stderr.write('Error evaluating: thread_id: %s\nframe_id: %s\nscope: %s\nattrs: %s\n' % (
+            thread_id, frame_id, scope, attrs,))
+        traceback.print_exc()
+
+
 def resolve_var_object(var, attrs):
     """
     Resolve variable's attribute
@@ -461,8 +503,52 @@ def table_like_struct_to_xml(array, name, roffset, coffset, rows, cols, format):
     return "<xml>%s</xml>" % xml
 
 
+def _format_table(table, format):
+    '''
+    :param table: a 2-dimensional array (or list of rows) with the values to show.
+    :return list(list(str)): the values formatted with the given format (all at once, with numpy, if possible).
+    '''
+    try:
+        import numpy
+        formatted = numpy.char.mod(format, numpy.asarray(table))
+        if formatted.ndim == 2:
+            return formatted.tolist()
+    except Exception:
+        pass
+    return [[format % value for value in row] for row in table]
+
+
+# Values which are the same when quoted (i.e.: most formatted numbers).
+_is_quoted_value = re.compile(r'[0-9A-Za-z_.\-]*\Z').match
+
+
+def _table_to_xml(xml, table, row_xml):
+    '''
+    Appends to the xml list the xml for the rows of formatted values (the same as var_to_xml would give
+    for each value, but without getting the information on each value, as all are strings).
+    '''
+    expected_value = ' value="%s" ' % (make_valid_xml_value(quote('str: x', '/>_= ')),)
+    template = var_to_xml('x', '')
+    if expected_value in template:
+        prefix = template[:template.index(expected_value)] + ' value="' + make_valid_xml_value(quote('str: ', '/>_= '))
+        suffix = template[template.index(expected_value) + len(expected_value) - 1:]
+        max_len = MAXIMUM_VARIABLE_REPRESENTATION_SIZE - len('str: ')
+    else:
+        # Some extension changed the representation of strings.
+        prefix = None
+
+    for row, values in enumerate(table):
+        xml.append(row_xml % (row,))
+        for value in values:
+            if prefix is None or len(value) > max_len or value.__class__ != str:
+                xml.append(var_to_xml(value, ''))
+            else:
+                if not _is_quoted_value(value):
+                    value = make_valid_xml_value(quote(value, '/>_= '))
+                xml.append(''.join((prefix, value, '"', suffix)))
+
+
 def array_to_xml(array, roffset, coffset, rows, cols, format):
-    xml = ""
     rows = min(rows, MAXIMUM_ARRAY_SIZE)
     cols = min(cols, MAXIMUM_ARRAY_SIZE)
 
@@ -483,27 +569,26 @@ def array_to_xml(array, roffset, coffset, rows, cols, format):
             array = array[roffset:]
             rows = min(rows, len(array))
 
-    xml += "<arraydata rows=\"%s\" cols=\"%s\"/>" % (rows, cols)
-    for row in xrange(rows):
-        xml += "<row index=\"%s\"/>" % to_string(row)
-        for col in xrange(cols):
-            value = array
-            if rows == 1 or cols == 1:
-                if rows == 1 and cols == 1:
-                    value = array[0]
-                else:
-                    if rows == 1:
-                        dim = col
-                    else:
-                        dim = row
-                    value = array[dim]
-                    if "ndarray" in str(type(value)):
-                        value = value[0]
-            else:
-                value = array[row][col]
-            value = format % value
-            xml += var_to_xml(value, '')
-    return xml
+    if rows == 1 or cols == 1:
+        if rows == 1 and cols == 1:
+            values = [array[0]]
+        else:
+            values = []
+            for dim in xrange(max(rows, cols)):
+                value = array[dim]
+                if "ndarray" in str(type(value)):
+                    value = value[0]
+                values.append(value)
+        if rows == 1:
+            table = [values]
+        else:
+            table = [[value] for value in values]
+    else:
+        table = array[0:rows, 0:cols]
+
+    xml = ["<arraydata rows=\"%s\" cols=\"%s\"/>" % (rows, cols)]
+    _table_to_xml(xml, _format_table(table, format), "<row index=\"%s\"/>")
+    return ''.join(xml)
 
 
 def array_to_meta_xml(array, name, format):
@@ -611,9 +696,9 @@ def dataframe_to_xml(df, name, roffset, coffset, rows, cols, format):
     df = df.iloc[roffset: roffset + rows, coffset: coffset + cols]
     rows, cols = df.shape
 
-    xml += "<headerdata rows=\"%s\" cols=\"%s\">\n" % (rows, cols)
+    xml = [xml, "<headerdata rows=\"%s\" cols=\"%s\">\n" % (rows, cols)]
     format = format.replace('%', '')
-    col_formats = []
+    columns = []
 
     get_label = lambda label: str(label) if not isinstance(label, tuple) else '/'.join(map(str, label))
 
@@ -627,20 +712,16 @@ def dataframe_to_xml(df, name, roffset, coffset, rows, cols, format):
             fmt= 'd'
         else:
             fmt= 's'
-        col_formats.append('%' + fmt)
+        # Each column is formatted at once (the columns may have different types).
+        columns.append([value for value, in _format_table([[value] for value in df.iloc[:, col].values], '%' + fmt)])
         bounds = col_bounds[col]
 
-        xml += '<colheader index=\"%s\" label=\"%s\" type=\"%s\" format=\"%s\" max=\"%s\" min=\"%s\" />\n' % \
-               (str(col), get_label(df.axes[1].values[col]), dtype, fmt, bounds[1], bounds[0])
+        xml.append('<colheader index=\"%s\" label=\"%s\" type=\"%s\" format=\"%s\" max=\"%s\" min=\"%s\" />\n' % \
+               (str(col), get_label(df.axes[1].values[col]), dtype, fmt, bounds[1], bounds[0]))
     for row, label in enumerate(iter(df.axes[0])):
-        xml += "<rowheader index=\"%s\" label = \"%s\"/>\n" % \
-               (str(row), get_label(label))
-    xml += "</headerdata>\n"
-    xml += "<arraydata rows=\"%s\" cols=\"%s\"/>\n" % (rows, cols)
-    for row in xrange(rows):
-        xml += "<row index=\"%s\"/>\n" % str(row)
-        for col in xrange(cols):
-            value = df.iat[row, col]
-            value = col_formats[col] % value
-            xml += var_to_xml(value, '')
-    return xml
+        xml.append("<rowheader index=\"%s\" label = \"%s\"/>\n" % \
+               (str(row), get_label(label)))
+    xml.append("</headerdata>\n")
+    xml.append("<arraydata rows=\"%s\" cols=\"%s\"/>\n" % (rows, cols))
+    _table_to_xml(xml, zip(*columns) if columns else [[]] * rows, "<row index=\"%s\"/>\n")
+    return ''.join(xml)
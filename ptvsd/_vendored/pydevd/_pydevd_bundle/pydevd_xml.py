@@ -271,9 +271,42 @@ def frame_vars_to_xml(frame_f_locals, hidden_ns=None):
     return return_values_xml + xml
 
 
-def var_to_xml(val, name, doTrim=True, additional_in_xml='', evaluate_full_value=True):
-    """ single variable or dictionary to xml representation """
+def frame_vars_to_dicts(frame_f_locals, hidden_ns=None):
+    """ Same as frame_vars_to_xml, but returns a list of dicts (see var_to_dict). """
+    variables = []
+    return_values = []
+
+    for k in sorted(dict_keys(frame_f_locals)):
+        try:
+            v = frame_f_locals[k]
+            eval_full_val = should_evaluate_full_value(v)
+
+            if k == RETURN_VALUES_DICT:
+                for name, val in dict_iter_items(v):
+                    var = var_to_dict(val, name)
+                    var['isRetVal'] = True
+                    return_values.append(var)
+
+            else:
+                var = var_to_dict(v, str(k), evaluate_full_value=eval_full_val)
+                if hidden_ns is not None and k in hidden_ns:
+                    var['isIPythonHidden'] = True
+                variables.append(var)
+        except Exception:
+            traceback.print_exc()
+            pydev_log.error("Unexpected error, recovered safely.\n")
+
+    # Show return values as the first entry.
+    return return_values + variables
+
 
+def _get_var_info(val, evaluate_full_value):
+    """
+    :return tuple(object, str, str, str, bool, object):
+        (value, type_name, type_qualifier, value_str, is_exception_on_eval, resolver)
+
+        resolver != None means that the variable is a container.
+    """
     try:
         # This should be faster than isinstance (but we have to protect against not having a '__class__' attribute).
         is_exception_on_eval = val.__class__ == ExceptionOnEvaluate
@@ -326,6 +359,49 @@ def var_to_xml(val, name, doTrim=True, additional_in_xml='', evaluate_full_value
             except:
                 value = 'Unable to get repr for %s' % v.__class__
 
+    return v, typeName, type_qualifier, value, is_exception_on_eval, resolver
+
+
+def var_to_dict(val, name, doTrim=True, evaluate_full_value=True):
+    """ single variable as a dict with the same information var_to_xml provides:
+
+        {'name': str, 'type': str, 'qualifier': str, 'value': str, 'isContainer': bool, 'isErrorOnEval': bool}
+
+    Containers which can be resolved a page at a time (see: pydevd_resolver) also have 'indexedVariables'
+    with the number of indexed items.
+
+    Nothing is quoted or escaped (the dict is meant to be consumed as is or as json).
+    """
+    v, typeName, type_qualifier, value, is_exception_on_eval, resolver = _get_var_info(
+        val, evaluate_full_value)
+    is_container = resolver is not None and not is_exception_on_eval
+
+    if value and len(value) > MAXIMUM_VARIABLE_REPRESENTATION_SIZE and doTrim:
+        value = value[0:MAXIMUM_VARIABLE_REPRESENTATION_SIZE]
+        value += '...'
+
+    var = {
+        'name': name,
+        'type': typeName,
+        'qualifier': type_qualifier,
+        'value': value or '',
+        'isContainer': is_container,
+        'isErrorOnEval': is_exception_on_eval,
+    }
+    if is_container and hasattr(resolver, 'get_indexed_count'):
+        try:
+            var['indexedVariables'] = resolver.get_indexed_count(v)
+        except:
+            pass
+    return var
+
+
+def var_to_xml(val, name, doTrim=True, additional_in_xml='', evaluate_full_value=True):
+    """ single variable or dictionary to xml representation """
+
+    _v, typeName, type_qualifier, value, is_exception_on_eval, resolver = _get_var_info(
+        val, evaluate_full_value)
+
     try:
         name = quote(name, '/>_= ')  # TODO: Fix PY-5834 without using quote
     except:
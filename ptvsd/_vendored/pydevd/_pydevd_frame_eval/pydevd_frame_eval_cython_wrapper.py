@@ -1,10 +1,10 @@
 try:
     try:
         from _pydevd_frame_eval_ext.pydevd_frame_evaluator import frame_eval_func, stop_frame_eval, \
-            enable_cache_frames_without_breaks, dummy_trace_dispatch
+            enable_cache_frames_without_breaks, dummy_trace_dispatch, clear_frame_eval_cache
     except ImportError:
         from _pydevd_frame_eval.pydevd_frame_evaluator import frame_eval_func, stop_frame_eval, \
-            enable_cache_frames_without_breaks, dummy_trace_dispatch
+            enable_cache_frames_without_breaks, dummy_trace_dispatch, clear_frame_eval_cache
 
 except ImportError:
     try:
@@ -31,7 +31,8 @@ except ImportError:
         check_name = '_pydevd_frame_eval.%s' % (mod_name,)
         mod = __import__(check_name)
         mod = getattr(mod, mod_name)
-        frame_eval_func, stop_frame_eval, enable_cache_frames_without_breaks, dummy_trace_dispatch = \
-            mod.frame_eval_func, mod.stop_frame_eval, mod.enable_cache_frames_without_breaks, mod.dummy_trace_dispatch
+        frame_eval_func, stop_frame_eval, enable_cache_frames_without_breaks, dummy_trace_dispatch, clear_frame_eval_cache = \
+            mod.frame_eval_func, mod.stop_frame_eval, mod.enable_cache_frames_without_breaks, mod.dummy_trace_dispatch, \
+            mod.clear_frame_eval_cache
     except ImportError:
         raise
@@ -9,6 +9,7 @@ frame_eval_func = None
 stop_frame_eval = None
 enable_cache_frames_without_breaks = None
 dummy_trace_dispatch = None
+clear_frame_eval_cache = None
 show_frame_eval_warning = False
 
 # "NO" means we should not use frame evaluation, anythinge else means we should use it.
@@ -21,7 +22,7 @@ else:
     if IS_PY36_OR_GREATER:
         try:
             from _pydevd_frame_eval.pydevd_frame_eval_cython_wrapper import frame_eval_func, stop_frame_eval, enable_cache_frames_without_breaks, \
-                dummy_trace_dispatch
+                dummy_trace_dispatch, clear_frame_eval_cache
         except ImportError:
             from _pydev_bundle.pydev_monkey import log_error_once
 
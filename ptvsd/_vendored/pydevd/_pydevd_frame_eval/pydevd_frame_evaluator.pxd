@@ -45,7 +45,7 @@ cdef extern from "frameobject.h":
         PyObject *f_localsplus[1];
 
 cdef extern from "code.h":
-    ctypedef void freefunc(void *)
+    ctypedef void (*freefunc)(void *)
     int _PyCode_GetExtra(PyObject *code, Py_ssize_t index, void **extra)
     int _PyCode_SetExtra(PyObject *code, Py_ssize_t index, void *extra)
 
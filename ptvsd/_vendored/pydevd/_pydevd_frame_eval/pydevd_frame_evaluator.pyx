@@ -1,5 +1,6 @@
 import dis
-from _pydev_imps._pydev_saved_modules import threading
+import weakref
+from _pydev_imps._pydev_saved_modules import threading, thread
 from _pydevd_bundle.pydevd_additional_thread_info import PyDBAdditionalThreadInfo
 from _pydevd_bundle.pydevd_comm import get_global_debugger
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE
@@ -13,16 +14,37 @@ AVOID_RECURSION = [
     '_weakrefset.py'
 ]
 
+# co_filename -> whether it ends with one of AVOID_RECURSION (computed once per filename).
+_avoid_recursion_cache = {}
+
 get_file_type = DONT_TRACE.get
-NO_BREAKS_IN_FRAME = 1
+get_ident = thread.get_ident
+_active_threads = threading._active
+
+# The verdict for a code object is kept in its co_extra (the pointer itself holds the value, so,
+# nothing is allocated for it and there's nothing to free): either ALWAYS_SKIP_CODE for the code
+# which must never be traced (i.e.: code from pydevd or from AVOID_RECURSION) or the generation of
+# the breakpoints in which the code was found to have no breakpoints (so, all those verdicts become
+# stale when the breakpoints change -- see clear_frame_eval_cache).
+cdef Py_ssize_t ALWAYS_SKIP_CODE = -1
+cdef Py_ssize_t _breakpoints_generation = 1
+# The index of co_extra (requested only once, in frame_eval_func).
+cdef Py_ssize_t _code_extra_index = -1
+
+# code object -> (breakpoints version, code to execute (None if it couldn't be instrumented), has breakpoints)
+# (instrumented code objects are also keys, as a generator frame keeps using it when resumed).
+# The keys are weak (the entries go away with the code of unloaded modules), so, a value never references its
+# key (_SAME_CODE is used instead).
+_instrumented_code_cache = weakref.WeakKeyDictionary()
+_SAME_CODE = object()
+# The version of the breakpoints of a file is (_all_files_version, _file_versions.get(file, 0)).
+_all_files_version = 0
+_file_versions = {}
 
 
 class UseCodeExtraHolder:
     # Use this flag in order to disable co_extra field
     use_code_extra = True
-    # Keep the index of co_extra in a thread-local storage
-    local = threading.local()
-    local.index = -1
 
 
 def is_use_code_extra():
@@ -34,47 +56,96 @@ def enable_cache_frames_without_breaks(new_value):
     UseCodeExtraHolder.use_code_extra = new_value
 
 
+def clear_frame_eval_cache(filename=None):
+    '''
+    Makes the verdicts for code objects without breakpoints stale (must be called when breakpoints change).
+
+    :param filename:
+        If given, only the code instrumented for the breakpoints in that file (as used in
+        main_debugger.breakpoints) must be instrumented again, otherwise all of it.
+    '''
+    global _breakpoints_generation, _all_files_version
+    _breakpoints_generation += 1
+    if filename is None:
+        _all_files_version += 1
+        _instrumented_code_cache.clear()
+    else:
+        _file_versions[filename] = _file_versions.get(filename, 0) + 1
+
+
+cdef _get_instrumented_code(code_object, breakpoints):
+    '''
+    :return tuple(code, bool):
+        The code with the tracing code inserted at the lines with breakpoints (None if it couldn't be
+        instrumented) and whether it has any breakpoint.
+    '''
+    new_code = code_object
+    breakpoints_to_update = []
+    for offset, line in dis.findlinestarts(code_object):
+        if line in breakpoints:
+            breakpoint = breakpoints[line]
+            if breakpoint in breakpoints_to_update:
+                continue
+            success, new_code = insert_code(new_code, pydev_trace_code_wrapper.__code__, line)
+            if not success:
+                return None, True
+            breakpoints_to_update.append(breakpoint)
+
+    for breakpoint in breakpoints_to_update:
+        breakpoint.code_objects.add(new_code)
+    return new_code, len(breakpoints_to_update) > 0
+
+
 cpdef dummy_trace_dispatch(frame, str event, arg):
     return None
 
 
 cdef PyObject* get_bytecode_while_frame_eval(PyFrameObject *frame_obj, int exc):
     frame = <object> frame_obj
-    cdef str filepath = frame.f_code.co_filename
+    cdef str filepath
     cdef bint skip_file = exc
+    cdef bint use_code_extra = False
     cdef void* extra = NULL
-    cdef int* extra_value = NULL
-    cdef int thread_index = -1
+    cdef Py_ssize_t verdict
 
-    if is_use_code_extra is None or AVOID_RECURSION is None:
+    if is_use_code_extra is None or _avoid_recursion_cache is None:
         # Sometimes during process shutdown these global variables become None
         return _PyEval_EvalFrameDefault(frame_obj, exc)
 
-    if is_use_code_extra():
-        extra = PyMem_Malloc(sizeof(int))
-        try:
-            thread_index = UseCodeExtraHolder.local.index
-        except:
-            pass
-        if thread_index != -1:
-            _PyCode_GetExtra(<PyObject*> frame.f_code, thread_index, &extra)
-            if extra is not NULL:
-                extra_value = <int*> extra
-                if extra_value[0] == NO_BREAKS_IN_FRAME:
-                    return _PyEval_EvalFrameDefault(frame_obj, exc)
-
-    for file in AVOID_RECURSION:
-        # we can't call any other function without this check, because we can get stack overflow
-        for path_separator in ('/', '\\'):
-            if filepath.endswith(path_separator + file):
-                skip_file = True
+    # Note: until the verdict is known, nothing which may execute Python code (and thus
+    # recurse in here) may be called.
+    if _code_extra_index != -1 and is_use_code_extra():
+        use_code_extra = True
+        _PyCode_GetExtra(<PyObject*> frame_obj.f_code, _code_extra_index, &extra)
+        if extra is not NULL:
+            verdict = <Py_ssize_t> extra
+            if verdict == ALWAYS_SKIP_CODE or verdict == _breakpoints_generation:
+                return _PyEval_EvalFrameDefault(frame_obj, exc)
+
+    filepath = frame.f_code.co_filename
+    avoid_recursion = _avoid_recursion_cache.get(filepath)
+    if avoid_recursion is None:
+        avoid_recursion = False
+        for file in AVOID_RECURSION:
+            # we can't call any other function without this check, because we can get stack overflow
+            if filepath.endswith(('/' + file, '\\' + file)):
+                avoid_recursion = True
                 break
+        _avoid_recursion_cache[filepath] = avoid_recursion
+
+    if avoid_recursion:
+        if use_code_extra:
+            _PyCode_SetExtra(<PyObject*> frame_obj.f_code, _code_extra_index, <void*> ALWAYS_SKIP_CODE)
+        return _PyEval_EvalFrameDefault(frame_obj, exc)
 
     if not skip_file:
-        try:
-            t = threading.currentThread()
-        except:
-            skip_file = True
+        # Get the thread from the active threads (threading.currentThread() would be a Python call).
+        t = _active_threads.get(get_ident())
+        if t is None:
+            try:
+                t = threading.currentThread()
+            except:
+                skip_file = True
 
     if not skip_file:
         try:
@@ -83,9 +154,6 @@ cdef PyObject* get_bytecode_while_frame_eval(PyFrameObject *frame_obj, int exc):
                 raise AttributeError()
         except:
             additional_info = t.additional_info = PyDBAdditionalThreadInfo()
-            # request `co_extra` inside every new thread
-            thread_index = _PyEval_RequestCodeExtraIndex(PyMem_Free)
-            UseCodeExtraHolder.local.index = thread_index
 
         if additional_info.is_tracing or getattr(t, 'pydev_do_not_trace', None):
             return _PyEval_EvalFrameDefault(frame_obj, exc)
@@ -98,35 +166,46 @@ cdef PyObject* get_bytecode_while_frame_eval(PyFrameObject *frame_obj, int exc):
 
         file_type = get_file_type(abs_path_real_path_and_base[-1])  #we don't want to debug anything related to pydevd
         if file_type is not None:
+            if use_code_extra:
+                _PyCode_SetExtra(<PyObject*> frame_obj.f_code, _code_extra_index, <void*> ALWAYS_SKIP_CODE)
             additional_info.is_tracing = False
             return _PyEval_EvalFrameDefault(frame_obj, exc)
 
         was_break = False
         main_debugger = get_global_debugger()
-        breakpoints = main_debugger.breakpoints.get(abs_path_real_path_and_base[1])
+        filename = abs_path_real_path_and_base[1]
+        breakpoints = main_debugger.breakpoints.get(filename)
         code_object = frame.f_code
         if breakpoints:
-            breakpoints_to_update = []
-            for offset, line in dis.findlinestarts(code_object):
-                if line in breakpoints:
-                    breakpoint = breakpoints[line]
-                    if code_object not in breakpoint.code_objects:
-                        # This check is needed for generator functions, because after each yield the new frame is created
-                        # but the former code object is used
-                        success, new_code = insert_code(frame.f_code, pydev_trace_code_wrapper.__code__, line)
-                        if success:
-                            breakpoints_to_update.append(breakpoint)
-                            Py_INCREF(new_code)
-                            frame_obj.f_code = <PyCodeObject *> new_code
-                            was_break = True
-                        else:
-                            main_debugger.set_trace_for_frame_and_parents(frame)
-                            was_break = False
-                            break
-            if was_break:
-                update_globals_dict(frame.f_globals)
-                for bp in breakpoints_to_update:
-                    bp.code_objects.add(frame.f_code)
+            # The code is instrumented only once for each version of the breakpoints in its file (and
+            # then reused by any call in any thread).
+            version = (_all_files_version, _file_versions.get(filename, 0))
+            cached = _instrumented_code_cache.get(code_object)
+            if cached is None or cached[0] != version:
+                new_code, has_breaks = _get_instrumented_code(code_object, breakpoints)
+                if new_code is code_object:
+                    cached = (version, _SAME_CODE, has_breaks)
+                else:
+                    cached = (version, new_code, has_breaks)
+                    if new_code is not None:
+                        # This is needed for generator functions, because after each yield the new frame is
+                        # created but the former (instrumented) code object is used.
+                        _instrumented_code_cache[new_code] = (version, _SAME_CODE, True)
+                _instrumented_code_cache[code_object] = cached
+
+            new_code = cached[1]
+            if new_code is _SAME_CODE:
+                new_code = code_object
+            if new_code is None:
+                main_debugger.set_trace_for_frame_and_parents(frame)
+                # Not really a break, but the verdict must not be to skip this code.
+                was_break = True
+            elif cached[2]:
+                if new_code is not code_object:
+                    Py_INCREF(new_code)
+                    frame_obj.f_code = <PyCodeObject *> new_code
+                    update_globals_dict(frame.f_globals)
+                was_break = True
         else:
             if main_debugger.has_plugin_line_breaks:
                 can_not_skip = main_debugger.plugin.can_not_skip(main_debugger, None, frame)
@@ -135,21 +214,19 @@ cdef PyObject* get_bytecode_while_frame_eval(PyFrameObject *frame_obj, int exc):
                     main_debugger.SetTrace(main_debugger.trace_dispatch)
                     main_debugger.set_trace_for_frame_and_parents(frame)
 
-        if not was_break:
-            extra_value = <int*> PyMem_Malloc(sizeof(int))
-            extra_value[0] = NO_BREAKS_IN_FRAME
-            try:
-                thread_index = UseCodeExtraHolder.local.index
-            except:
-                pass
-            if thread_index != -1:
-                _PyCode_SetExtra(<PyObject*> code_object, thread_index, extra_value)
+        if not was_break and use_code_extra:
+            _PyCode_SetExtra(<PyObject*> code_object, _code_extra_index, <void*> _breakpoints_generation)
 
         additional_info.is_tracing = False
     return _PyEval_EvalFrameDefault(frame_obj, exc)
 
 def frame_eval_func():
+    global _code_extra_index
     cdef PyThreadState *state = PyThreadState_Get()
+    if _code_extra_index == -1:
+        # Requested only once (the number of indexes is limited). As the values kept in co_extra
+        # aren't allocated, there's no function to free them.
+        _code_extra_index = _PyEval_RequestCodeExtraIndex(NULL)
     state.interp.eval_frame = get_bytecode_while_frame_eval
     global dummy_tracing_holder
     dummy_tracing_holder.set_trace_func(dummy_trace_dispatch)
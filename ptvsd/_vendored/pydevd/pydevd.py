@@ -13,7 +13,7 @@ import os
 import traceback
 
 from _pydevd_bundle.pydevd_constants import IS_JYTH_LESS25, IS_PYCHARM, get_thread_id, \
-    dict_keys, dict_iter_items, DebugInfoHolder, PYTHON_SUSPEND, STATE_SUSPEND, STATE_RUN, get_frame, xrange, \
+    dict_keys, dict_values, dict_iter_items, DebugInfoHolder, PYTHON_SUSPEND, STATE_SUSPEND, STATE_RUN, get_frame, xrange, \
     clear_cached_thread_id, INTERACTIVE_MODE_AVAILABLE, SHOW_DEBUG_INFO_ENV, IS_PY34_OR_GREATER, IS_PY2, NULL
 from _pydev_bundle import fix_getpass
 from _pydev_bundle import pydev_imports, pydev_log
@@ -32,18 +32,19 @@ from _pydevd_bundle.pydevd_comm import CMD_SET_BREAK, CMD_SET_NEXT_STATEMENT, CM
     CMD_STEP_RETURN, CMD_STEP_INTO_MY_CODE, CMD_THREAD_SUSPEND, CMD_RUN_TO_LINE, \
     CMD_ADD_EXCEPTION_BREAK, CMD_SMART_STEP_INTO, InternalConsoleExec, NetCommandFactory, \
     PyDBDaemonThread, _queue, ReaderThread, GetGlobalDebugger, get_global_debugger, \
-    set_global_debugger, WriterThread, pydevd_find_thread_by_id, pydevd_log, \
+    set_global_debugger, WriterThread, OutputBuffer, pydevd_find_thread_by_id, pydevd_log, \
     start_client, start_server, InternalGetBreakpointException, InternalSendCurrExceptionTrace, \
     InternalSendCurrExceptionTraceProceeded
 from _pydevd_bundle.pydevd_custom_frames import CustomFramesContainer, custom_frames_container_init
 from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, remove_exception_from_frame
 from _pydevd_bundle.pydevd_kill_all_pydevd_threads import kill_all_pydev_threads
 from _pydevd_bundle.pydevd_trace_dispatch import trace_dispatch as _trace_dispatch, global_cache_skips, global_cache_frame_skips
-from _pydevd_frame_eval.pydevd_frame_eval_main import frame_eval_func, stop_frame_eval, enable_cache_frames_without_breaks, dummy_trace_dispatch
+from _pydevd_frame_eval.pydevd_frame_eval_main import frame_eval_func, stop_frame_eval, enable_cache_frames_without_breaks, dummy_trace_dispatch, \
+    clear_frame_eval_cache
 from _pydevd_bundle.pydevd_utils import save_main_module
 from pydevd_concurrency_analyser.pydevd_concurrency_logger import ThreadingLogger, AsyncioLogger, send_message, cur_time
 from pydevd_concurrency_analyser.pydevd_thread_wrappers import wrap_threads
-from pydevd_file_utils import get_fullname, rPath, get_package_dir
+from pydevd_file_utils import get_fullname, rPath, get_package_dir, NORM_PATHS_AND_BASE_CONTAINER
 import pydev_ipython  # @UnusedImport
 
 __version_info__ = (1, 2, 0)
@@ -70,6 +71,14 @@ if SUPPORT_PLUGINS:
 threadingEnumerate = threading.enumerate
 threadingCurrentThread = threading.currentThread
 
+# Threads are tracked as they start and finish (see: pydev_monkey), so, all the threads are only checked at this
+# interval (in seconds) to find the threads which weren't started through the patched functions.
+CHECK_THREADS_INTERVAL = 0.5
+
+# The debugging session is only finished because no program threads are alive after this time (in seconds) since the
+# command thread started (while starting, there may not be any non-daemon threads yet).
+NO_THREADS_ALIVE_GRACE_PERIOD = 4.5
+
 try:
     'dummy'.encode('utf-8') # Added because otherwise Jython 2.2.1 wasn't finding the encoding (if it wasn't loaded in the main thread).
 except:
@@ -97,11 +106,7 @@ class PyDBCommandThread(PyDBDaemonThread):
         self.setName('pydevd.CommandThread')
 
     def _on_run(self):
-        for i in xrange(1, 10):
-            time.sleep(0.5) #this one will only start later on (because otherwise we may not have any non-daemon threads
-            if self.killReceived:
-                return
-
+        self.py_db._finish_if_no_threads_alive_time = time.time() + NO_THREADS_ALIVE_GRACE_PERIOD
         if self.pydev_do_not_trace:
             self.py_db.SetTrace(None) # no debugging on this thread
 
@@ -112,7 +117,8 @@ class PyDBCommandThread(PyDBDaemonThread):
                 except:
                     pydevd_log(0, 'Finishing debug communication...(2)')
                 self._py_db_command_thread_event.clear()
-                self._py_db_command_thread_event.wait(0.5)
+                # Posting a command wakes this thread (the timeout is for checking the threads).
+                self._py_db_command_thread_event.wait(CHECK_THREADS_INTERVAL)
         except:
             pydev_log.debug(sys.exc_info()[0])
 
@@ -191,10 +197,16 @@ class PyDB:
         pydevd_tracing.replace_sys_set_trace_func()
         self.reader = None
         self.writer = None
+        self.output_buffer = None  # redirected output is coalesced before being sent (see: OutputBuffer)
         self.output_checker = None
         self.quitting = None
         self.cmd_factory = NetCommandFactory()
         self._cmd_queue = {}  # the hash of Queues. Key is thread id, value is thread
+        self._thread_ids_with_commands = set()  # the thread ids whose queue may have commands
+        self._lock_thread_ids_with_commands = thread.allocate_lock()
+        self._next_check_threads_time = 0
+        self._finish_if_no_threads_alive_time = 0
+        self._suspended_thread_events = {}  # Key is thread id, value is the Event it waits on while suspended
 
         self.breakpoints = {}
 
@@ -304,6 +316,8 @@ class PyDB:
 
     def finish_debugging_session(self):
         self._finish_debugging_session = True
+        self.wake_suspended_thread('*')
+        self.flush_output()
 
 
     def initialize_network(self, sock):
@@ -312,6 +326,7 @@ class PyDB:
         except:
             pass
         self.writer = WriterThread(sock)
+        self.output_buffer = OutputBuffer(self.writer, self.cmd_factory)
         self.reader = ReaderThread(sock)
         self.writer.start()
         self.reader.start()
@@ -338,6 +353,37 @@ class PyDB:
             return self._cmd_queue.setdefault(thread_id, _queue.Queue()) #@UndefinedVariable
 
 
+    def get_suspended_thread_event(self, thread_id):
+        """ returns the event the given thread waits on while it's suspended (see: do_wait_suspend) """
+        if thread_id.startswith('__frame__'):
+            thread_id = thread_id[thread_id.rfind('|') + 1:]
+        try:
+            return self._suspended_thread_events[thread_id]
+        except KeyError:
+            return self._suspended_thread_events.setdefault(thread_id, threading.Event())
+
+    def wake_suspended_thread(self, thread_id):
+        """ wakes up the given thread if it's suspended so that it processes its internal commands and
+        checks whether it should resume (if thread_id is *, wakes up all) """
+        if thread_id == "*":
+            for event in dict_values(self._suspended_thread_events):
+                event.set()
+        else:
+            if thread_id.startswith('__frame__'):
+                thread_id = thread_id[thread_id.rfind('|') + 1:]
+            # If it has no event it's not suspended (and it checks its state after getting the event).
+            event = self._suspended_thread_events.get(thread_id)
+            if event is not None:
+                event.set()
+
+    def _add_thread_with_commands(self, thread_id):
+        """ marks the queue of the given thread to be visited in process_internal_commands (must be called
+        after the command is added to it) """
+        if thread_id.startswith('__frame__'):
+            thread_id = thread_id[thread_id.rfind('|') + 1:]
+        with self._lock_thread_ids_with_commands:
+            self._thread_ids_with_commands.add(thread_id)
+
     def post_internal_command(self, int_cmd, thread_id):
         """ if thread_id is *, post to all """
         if thread_id == "*":
@@ -346,10 +392,16 @@ class PyDB:
                 thread_id = get_thread_id(t)
                 queue = self.get_internal_queue(thread_id)
                 queue.put(int_cmd)
+                self._add_thread_with_commands(thread_id)
+            self.wake_suspended_thread("*")
 
         else:
             queue = self.get_internal_queue(thread_id)
             queue.put(int_cmd)
+            self._add_thread_with_commands(thread_id)
+            self.wake_suspended_thread(thread_id)
+        # Commands which any thread can execute are executed right away by the command thread.
+        self._py_db_command_thread_event.set()
 
     def enable_output_redirection(self, redirect_stdout, redirect_stderr):
         global bufferStdOutToServer
@@ -363,6 +415,11 @@ class PyDB:
         if bufferStdErrToServer:
             init_stderr_redirect()
 
+    def flush_output(self):
+        """ sends the buffered redirected output without waiting for more (see: OutputBuffer) """
+        if self.output_buffer is not None:
+            self.output_buffer.flush()
+
     def check_output_redirect(self):
         global bufferStdOutToServer
         global bufferStdErrToServer
@@ -460,6 +517,12 @@ class PyDB:
 
             self._running_thread_ids[thread_id] = thread
 
+            queue = self._cmd_queue.get(thread_id)
+            if queue is not None and not queue.empty():
+                # Commands posted before it was notified (process_internal_commands only keeps the ids of
+                # the threads already notified).
+                self._add_thread_with_commands(thread_id)
+
         self.writer.add_command(self.cmd_factory.make_thread_created_message(thread))
 
     def notify_thread_not_alive(self, thread_id, use_lock=True):
@@ -476,101 +539,136 @@ class PyDB:
             if not was_notified:
                 thread.additional_info.pydev_notify_kill = True
 
+        with self._lock_thread_ids_with_commands:
+            self._thread_ids_with_commands.discard(thread_id)
+        self._suspended_thread_events.pop(thread_id, None)
+
         self.writer.add_command(self.cmd_factory.make_thread_killed_message(thread_id))
 
+    def _check_threads(self):
+        '''
+        Notifies about the threads created or finished (which weren't notified as they started/finished).
+
+        :return dict(thread_id->thread):
+            The program threads alive.
+        '''
+        program_threads_alive = {}
+        all_threads = threadingEnumerate()
+        program_threads_dead = []
+        with self._lock_running_thread_ids:
+            for t in all_threads:
+                if getattr(t, 'is_pydev_daemon_thread', False):
+                    pass # I.e.: skip the DummyThreads created from pydev daemon threads
+                elif isinstance(t, PyDBDaemonThread):
+                    pydev_log.error_once('Error in debugger: Found PyDBDaemonThread not marked with is_pydev_daemon_thread=True.\n')
+
+                elif is_thread_alive(t):
+                    if not self._running_thread_ids:
+                        # Fix multiprocessing debug with breakpoints in both main and child processes
+                        # (https://youtrack.jetbrains.com/issue/PY-17092) When the new process is created, the main
+                        # thread in the new process already has the attribute 'pydevd_id', so the new thread doesn't
+                        # get new id with its process number and the debugger loses access to both threads.
+                        # Therefore we should update thread_id for every main thread in the new process.
+
+                        # Fix it for all existing threads.
+                        for existing_thread in all_threads:
+                            old_thread_id = get_thread_id(existing_thread)
+                            clear_cached_thread_id(t)
+
+                            thread_id = get_thread_id(t)
+                            if thread_id != old_thread_id:
+                                if pydevd_vars.has_additional_frames_by_id(old_thread_id):
+                                    frames_by_id = pydevd_vars.get_additional_frames_by_id(old_thread_id)
+                                    pydevd_vars.add_additional_frame_by_id(thread_id, frames_by_id)
+
+                    thread_id = get_thread_id(t)
+                    program_threads_alive[thread_id] = t
+
+                    self.notify_thread_created(thread_id, t, use_lock=False)
+
+            # Compute and notify about threads which are no longer alive.
+            thread_ids = list(self._running_thread_ids.keys())
+            for thread_id in thread_ids:
+                if thread_id not in program_threads_alive:
+                    program_threads_dead.append(thread_id)
+
+            for thread_id in program_threads_dead:
+                self.notify_thread_not_alive(thread_id, use_lock=False)
+
+        return program_threads_alive
+
     def process_internal_commands(self):
         '''This function processes internal commands
         '''
         with self._main_lock:
             self.check_output_redirect()
 
-            program_threads_alive = {}
-            all_threads = threadingEnumerate()
-            program_threads_dead = []
-            with self._lock_running_thread_ids:
-                for t in all_threads:
-                    if getattr(t, 'is_pydev_daemon_thread', False):
-                        pass # I.e.: skip the DummyThreads created from pydev daemon threads
-                    elif isinstance(t, PyDBDaemonThread):
-                        pydev_log.error_once('Error in debugger: Found PyDBDaemonThread not marked with is_pydev_daemon_thread=True.\n')
-
-                    elif is_thread_alive(t):
-                        if not self._running_thread_ids:
-                            # Fix multiprocessing debug with breakpoints in both main and child processes
-                            # (https://youtrack.jetbrains.com/issue/PY-17092) When the new process is created, the main
-                            # thread in the new process already has the attribute 'pydevd_id', so the new thread doesn't
-                            # get new id with its process number and the debugger loses access to both threads.
-                            # Therefore we should update thread_id for every main thread in the new process.
-
-                            # Fix it for all existing threads.
-                            for existing_thread in all_threads:
-                                old_thread_id = get_thread_id(existing_thread)
-                                clear_cached_thread_id(t)
-
-                                thread_id = get_thread_id(t)
-                                if thread_id != old_thread_id:
-                                    if pydevd_vars.has_additional_frames_by_id(old_thread_id):
-                                        frames_by_id = pydevd_vars.get_additional_frames_by_id(old_thread_id)
-                                        pydevd_vars.add_additional_frame_by_id(thread_id, frames_by_id)
-
-                        thread_id = get_thread_id(t)
-                        program_threads_alive[thread_id] = t
-
-                        self.notify_thread_created(thread_id, t, use_lock=False)
-
-                # Compute and notify about threads which are no longer alive.
-                thread_ids = list(self._running_thread_ids.keys())
-                for thread_id in thread_ids:
-                    if thread_id not in program_threads_alive:
-                        program_threads_dead.append(thread_id)
-
-                for thread_id in program_threads_dead:
-                    self.notify_thread_not_alive(thread_id, use_lock=False)
-
-            # Without self._lock_running_thread_ids
-            if len(program_threads_alive) == 0:
-                self.finish_debugging_session()
-                for t in all_threads:
-                    if hasattr(t, 'do_kill_pydev_thread'):
-                        t.do_kill_pydev_thread()
-            else:
-                # Actually process the commands now (make sure we don't have a lock for _lock_running_thread_ids
-                # acquired at this point as it could lead to a deadlock if some command evaluated tried to
-                # create a thread and wait for it -- which would try to notify about it getting that lock).
-                curr_thread_id = None
-                for thread_id in program_threads_alive:
-                    queue = self.get_internal_queue(thread_id)
-                    cmdsToReadd = []  # some commands must be processed by the thread itself... if that's the case,
-                                        # we will re-add the commands to the queue after executing.
-                    try:
-                        while True:
-                            int_cmd = queue.get(False)
-
-                            if not self.mpl_hooks_in_debug_console and isinstance(int_cmd, InternalConsoleExec):
-                                # add import hooks for matplotlib patches if only debug console was started
-                                try:
-                                    self.init_matplotlib_in_debug_console()
-                                    self.mpl_in_use = True
-                                except:
-                                    pydevd_log(2, "Matplotlib support in debug console failed", traceback.format_exc())
-                                self.mpl_hooks_in_debug_console = True
-
-                            if curr_thread_id is None:
-                                # Lazily get the current thread id.
-                                curr_thread_id = get_thread_id(threadingCurrentThread())
-
-                            if int_cmd.can_be_executed_by(curr_thread_id):
-                                pydevd_log(2, "processing internal command ", str(int_cmd))
-                                int_cmd.do_it(self)
-                            else:
-                                pydevd_log(2, "NOT processing internal command ", str(int_cmd))
-                                cmdsToReadd.append(int_cmd)
-
-
-                    except _queue.Empty: #@UndefinedVariable
-                        # this is how we exit
-                        for int_cmd in cmdsToReadd:
-                            queue.put(int_cmd)
+            curr_time = time.time()
+            if curr_time >= self._next_check_threads_time:
+                self._next_check_threads_time = curr_time + CHECK_THREADS_INTERVAL
+                # Without self._lock_running_thread_ids
+                if len(self._check_threads()) == 0 and curr_time >= self._finish_if_no_threads_alive_time:
+                    self.finish_debugging_session()
+                    for t in threadingEnumerate():
+                        if hasattr(t, 'do_kill_pydev_thread'):
+                            t.do_kill_pydev_thread()
+                    return
+
+            # Actually process the commands now (make sure we don't have a lock for _lock_running_thread_ids
+            # acquired at this point as it could lead to a deadlock if some command evaluated tried to
+            # create a thread and wait for it -- which would try to notify about it getting that lock).
+            # Only the queues which had commands added are visited.
+            with self._lock_thread_ids_with_commands:
+                thread_ids = self._thread_ids_with_commands
+                self._thread_ids_with_commands = set()
+
+            thread_ids_with_commands = []
+            curr_thread_id = None
+            for thread_id in thread_ids:
+                if thread_id not in self._running_thread_ids:
+                    # Not alive (if it's just starting, notify_thread_created() marks it again).
+                    continue
+
+                queue = self._cmd_queue.get(thread_id)
+                if queue is None:
+                    continue
+                cmdsToReadd = []  # some commands must be processed by the thread itself... if that's the case,
+                                    # we will re-add the commands to the queue after executing.
+                try:
+                    while True:
+                        int_cmd = queue.get(False)
+
+                        if not self.mpl_hooks_in_debug_console and isinstance(int_cmd, InternalConsoleExec):
+                            # add import hooks for matplotlib patches if only debug console was started
+                            try:
+                                self.init_matplotlib_in_debug_console()
+                                self.mpl_in_use = True
+                            except:
+                                pydevd_log(2, "Matplotlib support in debug console failed", traceback.format_exc())
+                            self.mpl_hooks_in_debug_console = True
+
+                        if curr_thread_id is None:
+                            # Lazily get the current thread id.
+                            curr_thread_id = get_thread_id(threadingCurrentThread())
+
+                        if int_cmd.can_be_executed_by(curr_thread_id):
+                            pydevd_log(2, "processing internal command ", str(int_cmd))
+                            int_cmd.do_it(self)
+                        else:
+                            pydevd_log(2, "NOT processing internal command ", str(int_cmd))
+                            cmdsToReadd.append(int_cmd)
+
+
+                except _queue.Empty: #@UndefinedVariable
+                    # this is how we exit
+                    for int_cmd in cmdsToReadd:
+                        queue.put(int_cmd)
+                    if cmdsToReadd:
+                        thread_ids_with_commands.append(thread_id)
+
+            if thread_ids_with_commands:
+                with self._lock_thread_ids_with_commands:
+                    self._thread_ids_with_commands.update(thread_ids_with_commands)
 
     def disable_tracing_while_running_if_frame_eval(self):
         pydevd_tracing.settrace_while_running_if_frame_eval(self, self.dummy_trace_dispatch)
@@ -614,11 +712,54 @@ class PyDB:
             break_dict[pybreakpoint.line] = pybreakpoint
 
         breakpoints[file] = break_dict
-        self.clear_skip_caches()
+        if breakpoints is self.breakpoints:
+            # Line breakpoints only change how the code in that file is traced (plugin breakpoints
+            # affect the code of the plugin, so, everything must be cleared for those).
+            self.clear_skip_caches(file)
+        else:
+            self.clear_skip_caches()
+
+    def clear_skip_caches(self, filename=None):
+        '''
+        :param filename:
+            If given, only the entries for the code in that file (as used in self.breakpoints) are
+            cleared, otherwise all the entries are cleared.
+        '''
+        if clear_frame_eval_cache is not None:
+            clear_frame_eval_cache(filename)
+
+        if filename is None:
+            global_cache_skips.clear()
+            global_cache_frame_skips.clear()
+            return
 
-    def clear_skip_caches(self):
-        global_cache_skips.clear()
-        global_cache_frame_skips.clear()
+        # The caches are keyed by the code (first line, name and co_filename) -- and lines in the
+        # frame cache -- so, map each co_filename to the file it represents.
+        co_filename_matches = {}
+
+        def is_from_file(co_filename):
+            try:
+                return co_filename_matches[co_filename]
+            except KeyError:
+                try:
+                    matches = NORM_PATHS_AND_BASE_CONTAINER[co_filename][1] == filename
+                except KeyError:
+                    matches = True  # Unable to know which file it is: just clear it.
+                co_filename_matches[co_filename] = matches
+                return matches
+
+        for frame_cache_key in dict_keys(global_cache_skips):
+            if is_from_file(frame_cache_key[2]):
+                global_cache_skips.pop(frame_cache_key, None)
+
+        for cache_key in dict_keys(global_cache_frame_skips):
+            if len(cache_key) == 2:
+                # line cache key: (frame_cache_key, line)
+                co_filename = cache_key[0][2]
+            else:
+                co_filename = cache_key[2]
+            if is_from_file(co_filename):
+                global_cache_frame_skips.pop(cache_key, None)
 
     def add_break_on_exception(
         self,
@@ -764,6 +905,7 @@ class PyDB:
                                 # can retrieve it later.
         
         if send_suspend_message:
+            self.flush_output()
             message = thread.additional_info.pydev_message
             cmd = self.cmd_factory.make_thread_suspend_message(get_thread_id(thread), frame, thread.stop_reason, message, suspend_type)
             thread_stack_str = cmd.thread_stack_str
@@ -786,13 +928,23 @@ class PyDB:
             # before every stop check if matplotlib modules were imported inside script code
             self._activate_mpl_if_needed()
 
+        # Instead of polling, wait until a command is posted for this thread, it's resumed or the
+        # debugging session finishes (the event is cleared before the state is checked so that no
+        # wake up is lost).
+        suspended_thread_event = self.get_suspended_thread_event(get_thread_id(thread))
         while info.pydev_state == STATE_SUSPEND and not self._finish_debugging_session:
             if self.mpl_in_use:
                 # call input hooks if only matplotlib is in use
                 self._call_mpl_hook()
 
+            suspended_thread_event.clear()
             self.process_internal_commands()
-            time.sleep(0.01)
+            if info.pydev_state == STATE_SUSPEND and not self._finish_debugging_session:
+                if self.mpl_in_use:
+                    # the input hooks must still be called periodically
+                    suspended_thread_event.wait(0.01)
+                else:
+                    suspended_thread_event.wait()
 
         self.cancel_async_evaluation(get_thread_id(thread), str(id(frame)))
 
@@ -1102,6 +1254,7 @@ class PyDB:
     def exiting(self):
         sys.stdout.flush()
         sys.stderr.flush()
+        self.flush_output()
         self.check_output_redirect()
         cmd = self.cmd_factory.make_exit_message()
         self.writer.add_command(cmd)
@@ -1202,6 +1355,11 @@ class _CustomWriter(object):
 
             py_db = get_global_debugger()
             if py_db is not None:
+                output_buffer = getattr(py_db, 'output_buffer', None)
+                if output_buffer is not None:
+                    # Coalesced with other writes and sent by the writer thread.
+                    output_buffer.write(s, str(self._out_ctx))
+                    return
                 # Note that the actual message contents will be a xml with utf-8, although
                 # the entry is str on py3 and bytes on py2.
                 cmd = py_db.cmd_factory.make_io_message(s, self._out_ctx)
@@ -2,10 +2,14 @@
 # Licensed under the MIT License. See LICENSE in the project root
 # for license information.
 
-from ptvsd._remote import (
-    enable_attach as ptvsd_enable_attach, _pydevd_settrace,
-)
-from ptvsd.wrapper import debugger_attached
+import select
+import threading
+
+from ptvsd._util import new_hidden_thread
+from ptvsd.socket import create_server
+
+# Note: the debugger itself (pydevd and "ptvsd._remote") is only imported
+# when needed, so importing this module is cheap.
 
 WAIT_TIMEOUT = 1.0
 
@@ -15,6 +19,12 @@ DEFAULT_PORT = 5678
 _debug_current_thread = None
 _pending_threads = set()
 
+debugger_attached = threading.Event()
+
+# Whether the debugger is only loaded when a client connects (in which case
+# the threads which were already running must enable tracing themselves).
+_lazy = False
+
 
 def wait_for_attach(timeout=None):
     """If a remote debugger is attached, returns immediately. Otherwise,
@@ -27,9 +37,12 @@ def wait_for_attach(timeout=None):
         The timeout for the operation in seconds (or fractions thereof).
     """
     debugger_attached.wait(timeout)
+    if _lazy and is_attached():
+        _pydevd_settrace(suspend=False)
 
 
-def enable_attach(address=(DEFAULT_HOST, DEFAULT_PORT), redirect_output=True):
+def enable_attach(address=(DEFAULT_HOST, DEFAULT_PORT),
+                  redirect_output=True, lazy=False):
     """Enables a client to attach to this process remotely to debug Python code.
 
     Parameters
@@ -44,6 +57,12 @@ def enable_attach(address=(DEFAULT_HOST, DEFAULT_PORT), redirect_output=True):
     redirect_output : bool, optional
         Specifies whether any output (on both `stdout` and `stderr`) produced
         by this program should be sent to the debugger. Default is ``True``.
+    lazy : bool, optional
+        Specifies whether the debugger should only be loaded when a client
+        connects, so that processes which are never attached don't pay for
+        it. In that case, threads which are already running are only traced
+        once they call `ptvsd.wait_for_attach` or
+        `ptvsd.break_into_debugger`. Default is ``False``.
 
     Notes
     -----
@@ -65,12 +84,36 @@ def enable_attach(address=(DEFAULT_HOST, DEFAULT_PORT), redirect_output=True):
     port = address[1]
     address = (address[0], port if type(port) is int else int(port))
 
+    if lazy:
+        _enable_attach_on_connection(address, redirect_output)
+        return
+
+    from ptvsd._remote import enable_attach as ptvsd_enable_attach
     ptvsd_enable_attach(
         address,
         redirect_output=redirect_output,
     )
 
 
+def _enable_attach_on_connection(address, redirect_output):
+    global _lazy
+    server = create_server(*address)
+    _lazy = True
+
+    def wait_for_connection():
+        # The connection is accepted by the debugger (once it's loaded).
+        select.select([server], [], [])
+        from ptvsd._remote import enable_attach as ptvsd_enable_attach
+        ptvsd_enable_attach(
+            address,
+            redirect_output=redirect_output,
+            server=server,
+        )
+
+    t = new_hidden_thread('lazy_attach', wait_for_connection)
+    t.start()
+
+
 # TODO: Add disable_attach()?
 
 
@@ -89,7 +132,15 @@ def break_into_debugger():
     import sys
     _pydevd_settrace(
         suspend=True,
+        stop_at_frame=sys._getframe().f_back,
+    )
+
+
+def _pydevd_settrace(**kwargs):
+    # Only called once attached (so, pydevd is already loaded).
+    from ptvsd._remote import _pydevd_settrace
+    _pydevd_settrace(
         trace_only_current_thread=True,
         patch_multiprocessing=False,
-        stop_at_frame=sys._getframe().f_back,
+        **kwargs
     )
@@ -144,13 +144,19 @@ class DaemonBase(object):
         self._sock = sock
         return sock
 
-    def start_server(self, addr, hidebadsessions=True):
-        """Return ("socket", next_session) with a new server socket."""
+    def start_server(self, addr, hidebadsessions=True, server=None):
+        """Return ("socket", next_session) with a new server socket.
+
+        If "server" is provided then it is used (as-is) instead of
+        creating a new server socket.
+        """
         addr = Address.from_raw(addr)
         with self.started():
             assert self._sessionlock is None
             assert self.session is None
-            self._server = create_server(addr.host, addr.port)
+            if server is None:
+                server = create_server(addr.host, addr.port)
+            self._server = server
             debug('server socket created')
             self._sessionlock = threading.Lock()
         sock = self._sock
@@ -401,7 +407,10 @@ class DaemonBase(object):
 
     def _install_exit_handlers(self):
         """Set the placeholder handlers."""
-        self._exithandlers.install()
+        # Signal handlers may only be set in the main thread (the
+        # debugger may be loaded in another one, see enable_attach()).
+        ismain = isinstance(threading.current_thread(), threading._MainThread)
+        self._exithandlers.install(signals=ismain)
 
         try:
             self._exithandlers.add_atexit_handler(self._handle_atexit)
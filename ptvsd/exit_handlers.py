@@ -38,6 +38,7 @@ class ExitHandlers(object):
                                  for sig in self.SIGNALS}
         self._atexit_handlers = []
         self._installed = False
+        self._pid = None
 
     @property
     def supported_signals(self):
@@ -47,15 +48,18 @@ class ExitHandlers(object):
     def installed(self):
         return self._installed
 
-    def install(self):
+    def install(self, signals=True):
         """Set the parent handlers.
 
-        This must be called in the main thread.
+        This must be called in the main thread (unless "signals" is False,
+        in which case only the atexit handler is set).
         """
         if self._installed:
             raise AlreadyInstalledError('exit handlers already installed')
         self._installed = True
-        self._install_signal_handler()
+        self._pid = os.getpid()
+        if signals:
+            self._install_signal_handler()
         self._install_atexit_handler()
 
     # TODO: Add uninstall()?
@@ -102,6 +106,9 @@ class ExitHandlers(object):
             raise
 
     def _signal_handler(self, signum, frame):
+        if os.getpid() != self._pid:
+            # The handlers of a parent don't apply to forked processes.
+            return
         for handle_signal in self._signal_handlers.get(signum, ()):
             handle_signal(signum, frame)
 
@@ -110,5 +117,7 @@ class ExitHandlers(object):
         atexit.register(self._atexit_handler)
 
     def _atexit_handler(self):
+        if os.getpid() != self._pid:
+            return
         for handle_atexit in self._atexit_handlers:
             handle_atexit()
@@ -4,11 +4,24 @@
 
 from __future__ import print_function, with_statement, absolute_import
 
+import heapq
 import sys
 import threading
+import time
 import traceback
 from ptvsd.reraise import reraise
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+# The timers must not be affected by changes of the system time.
+try:
+    _monotonic = time.monotonic
+except AttributeError:
+    _monotonic = time.time
+
 
 class Future(object):
     # TODO: docstring
@@ -87,14 +100,45 @@ class Future(object):
             self._done_callbacks.remove(callback)
 
 
-class EventLoop(object):
-    # TODO: docstring
+class TimerHandle(object):
+    """A callback scheduled with EventLoop.call_later().
+
+    Calling cancel() before the delay is over prevents the callback
+    from running.
+    """
+
+    def __init__(self, when, f, args):
+        self.when = when
+        self._f = f
+        self._args = args
+        self._cancelled = False
+
+    def __lt__(self, other):
+        return self.when < other.when
+
+    def cancel(self):
+        self._cancelled = True
+
+    def cancelled(self):
+        return self._cancelled
+
+    def _run(self):
+        if not self._cancelled:
+            self._f(*self._args)
+
+
+class _ThreadingEventLoop(object):
+    """An event loop built on threading primitives only.
+
+    The loop thread blocks until a callback is scheduled, the next
+    timer is due or the loop is stopped.
+    """
 
     def __init__(self):
         self._queue = []
+        self._timers = []
         self._lock = threading.Lock()
-        self._event = threading.Event()
-        self._event.set()
+        self._wakeup = threading.Condition(self._lock)
 
         self._stop = False
 
@@ -102,27 +146,99 @@ class EventLoop(object):
         return Future(self)
 
     def run_forever(self):
-        while not self._stop:
-            if not self._event.wait(timeout=0.1):
-                continue
+        while True:
             with self._lock:
+                while not self._stop and not self._queue:
+                    if not self._timers:
+                        self._wakeup.wait()
+                        continue
+                    timeout = self._timers[0].when - _monotonic()
+                    if timeout <= 0:
+                        break
+                    self._wakeup.wait(timeout)
+                if self._stop:
+                    break
                 queue = self._queue
                 self._queue = []
-                self._event.clear()
+                now = _monotonic()
+                while self._timers and self._timers[0].when <= now:
+                    handle = heapq.heappop(self._timers)
+                    queue.append((handle._run, ()))
             for (f, args) in queue:
                 f(*args)
 
     def stop(self):
-        self._stop = True
+        with self._lock:
+            self._stop = True
+            self._wakeup.notify()
 
     def call_soon(self, f, *args):
         with self._lock:
             self._queue.append((f, args))
-            self._event.set()
+            self._wakeup.notify()
+
+    def call_soon_threadsafe(self, f, *args):
+        return self.call_soon(f, *args)
+
+    def call_later(self, delay, f, *args):
+        handle = TimerHandle(_monotonic() + delay, f, args)
+        with self._lock:
+            heapq.heappush(self._timers, handle)
+            self._wakeup.notify()
+        return handle
+
+
+class _AsyncioEventLoop(object):
+    """An event loop running on top of an asyncio loop.
+
+    Unlike with asyncio itself, callbacks may be scheduled from any
+    thread.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    def create_future(self):
+        return Future(self)
+
+    def run_forever(self):
+        self._thread = threading.current_thread()
+        try:
+            self._loop.run_forever()
+        finally:
+            with self._lock:
+                self._closed = True
+                self._loop.close()
+
+    def stop(self):
+        self.call_soon(self._loop.stop)
+
+    def call_soon(self, f, *args):
+        if threading.current_thread() is self._thread:
+            self._loop.call_soon(f, *args)
+            return
+        with self._lock:
+            if not self._closed:
+                self._loop.call_soon_threadsafe(f, *args)
 
     def call_soon_threadsafe(self, f, *args):
         return self.call_soon(f, *args)
 
+    def call_later(self, delay, f, *args):
+        handle = TimerHandle(_monotonic() + delay, f, args)
+        self.call_soon(self._loop.call_later, delay, handle._run)
+        return handle
+
+
+# Prefer asyncio where it is available (Python 3).
+if asyncio is None:
+    EventLoop = _ThreadingEventLoop
+else:
+    EventLoop = _AsyncioEventLoop
+
 
 class Result(object):
     # TODO: docstring
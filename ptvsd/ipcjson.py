@@ -11,6 +11,7 @@ from __future__ import print_function, with_statement, absolute_import
 # the main thread. This will cause issues when the thread goes away
 # after attach completes.
 
+import contextlib
 import errno
 import itertools
 import json
@@ -21,6 +22,9 @@ import sys
 import time
 import traceback
 
+from ptvsd._vendored import force_pydevd  # noqa
+from _pydev_bundle.pydev_read_buffer import ReadBuffer
+
 from .socket import TimeoutError, convert_eof
 
 
@@ -92,7 +96,7 @@ class SocketIO(object):
             own_socket = True
         super(SocketIO, self).__init__(*args, **kwargs)
 
-        self.__buffer = to_bytes('')
+        self.__buffer = ReadBuffer(socket)
         self.__port = port
         self.__socket = socket
         self.__own_socket = own_socket
@@ -100,17 +104,24 @@ class SocketIO(object):
 
     def _send(self, **payload):
         # TODO: docstring
-        content = json.dumps(payload).encode('utf-8')
-        headers = ('Content-Length: {}\r\n\r\n'.format(len(content))
-                   ).encode('ascii')
-        # TODO: We never actually use a logfile...
-        if self.__logfile is not None:
-            self.__logfile.write(content)
-            self.__logfile.write('\n'.encode('utf-8'))
-            self.__logfile.flush()
+        self._send_all([payload])
+
+    def _send_all(self, payloads):
+        """Send the given messages with a single write."""
+        data = []
+        for payload in payloads:
+            content = json.dumps(payload).encode('utf-8')
+            headers = ('Content-Length: {}\r\n\r\n'.format(len(content))
+                       ).encode('ascii')
+            # TODO: We never actually use a logfile...
+            if self.__logfile is not None:
+                self.__logfile.write(content)
+                self.__logfile.write('\n'.encode('utf-8'))
+                self.__logfile.flush()
+            data.append(headers)
+            data.append(content)
         try:
-            self.__socket.send(headers)
-            self.__socket.send(content)
+            self.__socket.sendall(b''.join(data))
         except BrokenPipeError:
             pass
         except OSError as exc:
@@ -127,38 +138,19 @@ class SocketIO(object):
         Blocks until: newline chars are read OR socket is closed.
         """
         newline = '\r\n'.encode('ascii')
-        while newline not in self.__buffer:
-            temp = self.__socket.recv(1024)
-            if not temp:
-                break
-            self.__buffer += temp
-
-        if not self.__buffer:
-            return None
-
-        try:
-            index = self.__buffer.index(newline)
-        except ValueError:
+        line = self.__buffer.read_line(newline)
+        if line is None:
+            if not len(self.__buffer):
+                return None
             raise InvalidHeaderError('Header line not terminated')
-
-        line = self.__buffer[:index]
-        self.__buffer = self.__buffer[index+len(newline):]
         return line.decode('ascii', 'replace')
 
     def _buffered_read_as_utf8(self, length):
         # TODO: docstring
-        while len(self.__buffer) < length:
-            temp = self.__socket.recv(1024)
-            if not temp:
-                break
-            self.__buffer += temp
-
-        if len(self.__buffer) < length:
+        content = self.__buffer.read(length)
+        if content is None:
             raise InvalidContentError(
                     'Expected to read {} bytes of content, but only read {} bytes.'.format(length, len(self.__buffer)))  # noqa
-
-        content = self.__buffer[:length]
-        self.__buffer = self.__buffer[length:]
         return content.decode('utf-8', 'replace')
 
     def _wait_for_message(self):
@@ -229,7 +221,11 @@ class StandardIO(object):
             self.__stdout = stdout
 
     def _send(self, **payload):
-        data = json.dumps(payload).encode('utf-8') + NEWLINE_BYTES
+        self._send_all([payload])
+
+    def _send_all(self, payloads):
+        data = b''.join(json.dumps(payload).encode('utf-8') + NEWLINE_BYTES
+                        for payload in payloads)
         self.__stdout.write(data)
         self.__stdout.flush()
 
@@ -262,6 +258,8 @@ class IpcChannel(object):
         self.__exit = False
         self.__lock = thread.allocate_lock()
         self.__message = []
+        self.__batch = None
+        self.__batchdepth = 0
         self._timeout = timeout
         self._fail_after = None
 
@@ -269,10 +267,38 @@ class IpcChannel(object):
         # TODO: docstring
         self._close()
 
+    @contextlib.contextmanager
+    def batched(self):
+        """Send the messages sent in the block (by any thread) at once.
+
+        This is meant for bursts of messages (e.g. many "thread" or
+        "module" events), which are then written with a single send.
+        """
+        with self.__lock:
+            if self.__batchdepth == 0:
+                self.__batch = []
+            self.__batchdepth += 1
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__batchdepth -= 1
+                if self.__batchdepth == 0:
+                    batch, self.__batch = self.__batch, None
+                    if batch:
+                        self._send_all(batch)
+
+    def __send(self, **payload):
+        # This must be called with the lock held.
+        if self.__batch is not None:
+            self.__batch.append(payload)
+        else:
+            self._send(**payload)
+
     def send_event(self, _name, **kwargs):
         # TODO: docstring
         with self.__lock:
-            self._send(
+            self.__send(
                 type='event',
                 seq=next(self.__seq),
                 event=_name,
@@ -282,7 +308,7 @@ class IpcChannel(object):
     def send_response(self, request, success=True, message=None, **kwargs):
         # TODO: docstring
         with self.__lock:
-            self._send(
+            self.__send(
                 type='response',
                 seq=next(self.__seq),
                 request_seq=int(request.get('seq', 0)),
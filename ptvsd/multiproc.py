@@ -0,0 +1,218 @@
+import json
+import os
+import threading
+
+from ptvsd._util import debug, new_hidden_thread
+from ptvsd.socket import Address, close_socket, create_client, create_server
+
+# When debugging with --multiprocess, the processes started by the debuggee
+# (with subprocess, os.exec*(), os.spawn*() or os.fork()) are debugged too:
+# each one waits for the client to attach on a port of its own, which it
+# sends to the root process (the one started by the client).  The root
+# process then reports it to the client with a "ptvsd_subprocess" event.
+
+SUBPROCESS_HOST = 'localhost'
+
+# The process which reports the subprocesses to the client.
+root_process_id = None
+
+# The port on which the root process listens for the subprocesses.
+notification_port = None
+
+_lock = threading.Lock()
+_listener = None
+_subprocess_handler = None
+# None once a handler was set (i.e. the client was told about them).
+_pending_subprocesses = []
+
+
+def is_subprocess():
+    """Return True if the current process was started by a debugged one."""
+    return root_process_id is not None and root_process_id != os.getpid()
+
+
+def init_subprocess(root_pid, port):
+    """Set the root process to which the current process reports itself."""
+    global root_process_id, notification_port
+    root_process_id = root_pid
+    notification_port = port
+
+
+def enable():
+    """Debug the processes started from now on by the current one.
+
+    This must be called before pydevd patches the functions which start
+    processes (see pydev_monkey.patch_new_process_functions()).
+    """
+    from _pydev_bundle import pydev_monkey
+
+    if root_process_id is None:
+        listen_for_subprocesses()
+    pydev_monkey.patch_args = patch_args
+    pydev_monkey._on_forked_process = _on_forked_process
+
+
+def listen_for_subprocesses():
+    """Start listening for the subprocesses (in the root process)."""
+    global _listener
+    server = create_server(SUBPROCESS_HOST, 0)
+    init_subprocess(os.getpid(), server.getsockname()[1])
+
+    t = new_hidden_thread('subprocess_listener', _listen, args=(server,))
+    t.start()
+    _listener = (server, t)
+
+
+def stop_listening():
+    """Stop listening for the subprocesses."""
+    global _listener
+    if _listener is None:
+        return
+    server, t = _listener
+    _listener = None
+    close_socket(server)
+    t.join()
+
+
+def set_subprocess_handler(handler):
+    """Set the function called with the info on each subprocess.
+
+    Subprocesses which are reported before the first handler is set (i.e.
+    before the client is done configuring the debugger) are kept until
+    then.  Once the handler is cleared (i.e. the session has ended), they
+    are dropped.
+    """
+    global _subprocess_handler, _pending_subprocesses
+    with _lock:
+        _subprocess_handler = handler
+        if handler is None or _pending_subprocesses is None:
+            return
+        pending = _pending_subprocesses
+        _pending_subprocesses = None
+        for info in pending:
+            handler(info)
+
+
+def notify_root(port):
+    """Send the port on which the current process waits for the client."""
+    info = {
+        'rootProcessId': root_process_id,
+        'parentProcessId': os.getppid(),
+        'processId': os.getpid(),
+        'host': SUBPROCESS_HOST,
+        'port': port,
+    }
+    sock = create_client()
+    try:
+        sock.connect((SUBPROCESS_HOST, notification_port))
+        sock.sendall(json.dumps(info).encode('utf-8') + b'\n')
+    finally:
+        close_socket(sock)
+
+
+def patch_args(args):
+    """Return the command line to start a process under ptvsd.
+
+    This replaces pydev_monkey.patch_args() (which would start the process
+    under pydevd) for the Python command lines which run a script or a
+    module.  Others (e.g. "python -c ...") are left as they are.
+    """
+    from _pydev_bundle import pydev_monkey
+
+    args = pydev_monkey.remove_quotes_from_args(args)
+    if not args or not pydev_monkey.is_python(args[0]):
+        return args
+
+    # Skip the options for the interpreter.
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg == '-m' or not arg.startswith('-') or arg == '-':
+            break
+        if arg == '-c':
+            return args
+        i += 2 if arg in ('-W', '-X', '-Q') else 1
+    if i >= len(args) or args[i] == '-':
+        return args
+    if args[i] == '-m':
+        if args[i + 1:i + 2] == ['ptvsd']:
+            return args
+    elif args[i].rsplit('.')[-1] in ('zip', 'pyz', 'pyzw'):
+        return args
+
+    # The process waits for the client on a port of its own (see
+    # listen_for_client()).
+    ptvsd_args = [
+        '-m', 'ptvsd',
+        '--multiprocess',
+        '--subprocess-of', str(root_process_id),
+        '--subprocess-notify', str(notification_port),
+    ]
+    return pydev_monkey.quote_args(args[:i] + ptvsd_args + args[i:])
+
+
+def listen_for_client():
+    """Bind the port on which the current subprocess waits for the client.
+
+    Return its address and the function which starts the server on it
+    (for pydevd_hooks.install()).  The port is bound here rather than
+    chosen by the parent, so no other process can take it in between.
+    """
+    server = create_server(SUBPROCESS_HOST, 0)
+    port = server.getsockname()[1]
+
+    def start_server(daemon, host, _port, **kwargs):
+        from ptvsd import pydevd_hooks
+        return pydevd_hooks.start_server(daemon, host, port, server=server,
+                                         **kwargs)
+
+    return Address.as_server(SUBPROCESS_HOST, port), start_server
+
+
+def _on_forked_process():
+    # This replaces pydev_monkey._on_forked_process().  The threads of the
+    # debugger (and of the adapter) don't survive the fork, so the child
+    # gets a new debugger, which waits for the client on a port of its own.
+    # What the parent already loaded and cached (e.g. the normalized paths
+    # of the files) is reused as is.
+    import pydevd
+    from ptvsd import pydevd_hooks
+
+    pydevd.threadingCurrentThread().__pydevd_main_thread = True
+
+    addr, start_server = listen_for_client()
+    pydevd_hooks.install(pydevd, addr, start_client=start_server)
+
+    # pydevd.settrace_forked() connects to the address in the setup.
+    setup = pydevd.SetupHolder.setup
+    setup['client'] = addr.host
+    setup['port'] = addr.port
+    pydevd.settrace_forked()
+
+
+def _listen(server):
+    while True:
+        try:
+            client, _ = server.accept()
+        except Exception:
+            return
+        try:
+            client.settimeout(5)
+            line = client.makefile('rb').readline()
+            info = json.loads(line.decode('utf-8'))
+        except Exception as exc:
+            debug('bad subprocess notification:', exc)
+            continue
+        finally:
+            close_socket(client)
+        _handle_subprocess(info)
+
+
+def _handle_subprocess(info):
+    with _lock:
+        if _subprocess_handler is not None:
+            _subprocess_handler(info)
+        elif _pending_subprocesses is not None:
+            _pending_subprocesses.append(info)
+        else:
+            debug('no session for subprocess', info['processId'])
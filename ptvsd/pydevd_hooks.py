@@ -1,13 +1,15 @@
 import sys
 
+from ptvsd._vendored import force_pydevd  # noqa
 from _pydevd_bundle import pydevd_comm
 
+from ptvsd import multiproc
 from ptvsd.socket import Address
 from ptvsd.daemon import Daemon, DaemonStoppedError, DaemonClosedError
 from ptvsd._util import debug, new_hidden_thread
 
 
-def start_server(daemon, host, port, **kwargs):
+def start_server(daemon, host, port, server=None, **kwargs):
     """Return a socket to a (new) local pydevd-handling daemon.
 
     The daemon supports the pydevd client wire protocol, sending
@@ -15,7 +17,10 @@ def start_server(daemon, host, port, **kwargs):
 
     This is a replacement for _pydevd_bundle.pydevd_comm.start_server.
     """
-    sock, next_session = daemon.start_server((host, port))
+    sock, next_session = daemon.start_server((host, port), server=server)
+    if multiproc.is_subprocess():
+        # The client may attach as soon as the root process reports it.
+        multiproc.notify_root(port)
 
     def handle_next():
         try:
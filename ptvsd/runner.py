@@ -2,6 +2,7 @@
 # Licensed under the MIT License. See LICENSE in the project root
 # for license information.
 
+from ptvsd._vendored import force_pydevd  # noqa
 import pydevd
 import threading
 
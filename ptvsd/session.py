@@ -1,4 +1,4 @@
-from .socket import is_socket, close_socket
+from .socket import is_socket, close_socket, set_nodelay
 from .wrapper import VSCodeMessageProcessor
 from ._util import TimeoutError, ClosedError, Closeable, Startable, debug
 
@@ -28,6 +28,7 @@ class DebugSession(Startable, Closeable):
     def from_server_socket(cls, server, **kwargs):
         """Return a session for the next connection to the given socket."""
         client, _ = server.accept()
+        set_nodelay(client)
         return cls(client, ownsock=True, **kwargs)
 
     def __init__(self, sock,
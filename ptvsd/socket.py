@@ -157,7 +157,22 @@ class KeepAlive(namedtuple('KeepAlive', 'interval idle maxfails')):
             pass
 
 
-def connect(sock, addr, keepalive=None):
+def set_nodelay(sock, nodelay=True):
+    """Enable (or disable) TCP_NODELAY on the socket.
+
+    The DAP messages are small and each one is written with a single
+    send, so Nagle's algorithm only adds latency to them.
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP,
+                        socket.TCP_NODELAY,
+                        1 if nodelay else 0)
+    except (AttributeError, OSError, socket.error):
+        # Not a TCP socket.
+        pass
+
+
+def connect(sock, addr, keepalive=None, nodelay=True):
     """Return the client socket for the next connection."""
     if addr is None:
         if keepalive is None or keepalive is True:
@@ -167,11 +182,15 @@ def connect(sock, addr, keepalive=None):
         client, _ = sock.accept()
         if keepalive:
             keepalive.apply(client)
+        if nodelay:
+            set_nodelay(client)
         return client
     else:
         if keepalive:
             raise NotImplementedError
         sock.connect(addr)
+        if nodelay:
+            set_nodelay(sock)
         return sock
 
 
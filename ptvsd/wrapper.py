@@ -4,12 +4,18 @@
 
 from __future__ import print_function, absolute_import
 
+from ptvsd._vendored import force_pydevd  # noqa
+
 import contextlib
-import errno
 import io
+import json
 import os
 import platform
 import pydevd_file_utils
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # noqa
 import re
 import site
 import socket
@@ -34,21 +40,27 @@ import _pydevd_bundle.pydevd_extension_utils as pydevd_extutil  # noqa
 import _pydevd_bundle.pydevd_frame as pydevd_frame # noqa
 #from _pydevd_bundle.pydevd_comm import pydevd_log
 from _pydevd_bundle.pydevd_additional_thread_info import PyDBAdditionalThreadInfo # noqa
+from _pydevd_bundle.pydevd_trace_dispatch import USING_CYTHON # noqa
+from _pydevd_frame_eval.pydevd_frame_eval_main import frame_eval_func # noqa
 
 from ptvsd import _util
+from ptvsd import multiproc
 import ptvsd.ipcjson as ipcjson  # noqa
 import ptvsd.futures as futures  # noqa
 import ptvsd.untangle as untangle  # noqa
 from ptvsd.pathutils import PathUnNormcase  # noqa
 from ptvsd.safe_repr import SafeRepr  # noqa
 from ptvsd.version import __version__  # noqa
+from ptvsd.attach_server import debugger_attached  # noqa
 from ptvsd.socket import TimeoutError  # noqa
 
 WAIT_FOR_THREAD_FINISH_TIMEOUT = 1  # seconds
+# pydevd answers the requests which only inspect a suspended thread
+# (e.g. for its stack or variables) right away, unless it's hung.
+INSPECT_REQUEST_TIMEOUT = 30  # seconds
 
 
 debug = _util.debug
-debugger_attached = threading.Event()
 
 #def ipcjson_trace(s):
 #    print(s)
@@ -115,8 +127,10 @@ class SafeReprPresentationProvider(pydevd_extapi.StrPresentationProvider):
         """
         old_repr = self._repr
         self.set_format(fmt)
-        yield
-        self._repr = old_repr
+        try:
+            yield
+        finally:
+            self._repr = old_repr
 
 
 # Do not access directly - use safe_repr_provider() instead!
@@ -172,6 +186,15 @@ class UnsupportedPyDevdCommandError(Exception):
         self.cmdid = cmdid
 
 
+class PydevdRequestTimeoutError(Exception):
+
+    def __init__(self, cmdid, timeout):
+        msg = 'no response to pydevd command {} after {} seconds'.format(
+            cmdid, timeout)
+        super(PydevdRequestTimeoutError, self).__init__(msg)
+        self.cmdid = cmdid
+
+
 def unquote(s):
     if s is None:
         return None
@@ -271,6 +294,114 @@ class IDMap(object):
         return ids
 
 
+class ThreadScopedIDMap(IDMap):
+    """An IDMap for pydevd IDs which start with the thread ID.
+
+    Frame and variable IDs are only valid while their thread is
+    suspended, so the IDs are kept per thread and all the IDs of a
+    thread are invalidated at once (in constant time) with
+    invalidate_thread().
+
+    Each thread gets a new generation whenever its IDs are invalidated.
+    The VSCode ID keeps the generation it was created in, so stale IDs
+    are rejected when they're looked up (and only dropped once they're
+    a large part of the map).
+    """
+
+    def __init__(self):
+        super(ThreadScopedIDMap, self).__init__()
+        # pydevd thread ID -> (generation, {pydevd ID: VSCode ID})
+        self._threads = {}
+        # VSCode ID -> (pydevd ID, generation)
+        self._vscode_to_pydevd = {}
+        self._next_generation = 1
+        self._stale = 0
+
+    def _is_live(self, pydevd_id, generation):
+        try:
+            return self._threads[pydevd_id[0]][0] == generation
+        except KeyError:
+            return False
+
+    def _get_thread_ids(self, pyd_tid):
+        try:
+            return self._threads[pyd_tid]
+        except KeyError:
+            generation = self._next_generation
+            self._next_generation += 1
+            ids = self._threads[pyd_tid] = (generation, {})
+            return ids
+
+    def invalidate_thread(self, pyd_tid):
+        """Invalidate all the IDs for the given pydevd thread."""
+        with self._lock:
+            try:
+                _, ids = self._threads.pop(pyd_tid)
+            except KeyError:
+                return
+            self._stale += len(ids)
+            if self._stale * 2 > len(self._vscode_to_pydevd):
+                self._vscode_to_pydevd = dict(
+                    (vscode_id, entry)
+                    for vscode_id, entry in self._vscode_to_pydevd.items()
+                    if self._is_live(*entry))
+                self._stale = 0
+
+    def pairs(self):
+        # TODO: docstring
+        with self._lock:
+            return [pair
+                    for _, ids in self._threads.values()
+                    for pair in ids.items()]
+
+    def add(self, pydevd_id):
+        # TODO: docstring
+        with self._lock:
+            vscode_id = self._next_id
+            if callable(pydevd_id):
+                pydevd_id = pydevd_id(vscode_id)
+            self._next_id += 1
+            generation, ids = self._get_thread_ids(pydevd_id[0])
+            self._vscode_to_pydevd[vscode_id] = (pydevd_id, generation)
+            ids[pydevd_id] = vscode_id
+        return vscode_id
+
+    def remove(self, pydevd_id=None, vscode_id=None):
+        # TODO: docstring
+        with self._lock:
+            if pydevd_id is None:
+                pydevd_id = self.to_pydevd(vscode_id)
+            elif vscode_id is None:
+                vscode_id = self._threads[pydevd_id[0]][1][pydevd_id]
+            del self._vscode_to_pydevd[vscode_id]
+            del self._threads[pydevd_id[0]][1][pydevd_id]
+
+    def to_pydevd(self, vscode_id):
+        # TODO: docstring
+        pydevd_id, generation = self._vscode_to_pydevd[vscode_id]
+        if not self._is_live(pydevd_id, generation):
+            raise KeyError(vscode_id)
+        return pydevd_id
+
+    def to_vscode(self, pydevd_id, autogen):
+        # TODO: docstring
+        try:
+            return self._threads[pydevd_id[0]][1][pydevd_id]
+        except KeyError:
+            if autogen:
+                return self.add(pydevd_id)
+            else:
+                raise
+
+    def pydevd_ids(self):
+        # TODO: docstring
+        return [pydevd_id for pydevd_id, _ in self.pairs()]
+
+    def vscode_ids(self):
+        # TODO: docstring
+        return [vscode_id for _, vscode_id in self.pairs()]
+
+
 class PydevdSocket(object):
     """A dummy socket-like object for communicating with pydevd.
 
@@ -278,6 +409,11 @@ class PydevdSocket(object):
     callback.  It also provides an interface to send notifications and
     requests to pydevd; for requests, the reply can be asynchronously
     awaited.
+
+    When pydevd runs in-process its reader and writer threads use
+    recv_command() and send_command(), exchanging (cmd_id, seq, text)
+    tuples directly.  The byte-oriented socket methods (recv(), send(),
+    makefile()) still speak the pydevd line protocol.
     """
 
     def __init__(self, handle_msg, handle_close, getpeername, getsockname):
@@ -289,8 +425,9 @@ class PydevdSocket(object):
 
         self.lock = threading.Lock()
         self.seq = 1000000000
-        self.pipe_r, self.pipe_w = os.pipe()
+        self.commands = queue.Queue()
         self.requests = {}
+        self._recv_buffer = b''
 
         self._closed = False
         self._closing = False
@@ -305,22 +442,11 @@ class PydevdSocket(object):
                 return
             self._closing = True
 
-            if self.pipe_w is not None:
-                pipe_w = self.pipe_w
-                self.pipe_w = None
-                try:
-                    os.close(pipe_w)
-                except OSError as exc:
-                    if exc.errno != errno.EBADF:
-                        raise
-            if self.pipe_r is not None:
-                pipe_r = self.pipe_r
-                self.pipe_r = None
-                try:
-                    os.close(pipe_r)
-                except OSError as exc:
-                    if exc.errno != errno.EBADF:
-                        raise
+            if self.commands is not None:
+                commands = self.commands
+                self.commands = None
+                # Wake up any reader blocked in recv_command().
+                commands.put(None)
             self._handle_close()
             self._closed = True
             self._closing = False
@@ -337,25 +463,42 @@ class PydevdSocket(object):
         """Return the socket's own address."""
         return self._getsockname()
 
+    def recv_command(self):
+        """Return the next (cmd_id, seq, text) to send to pydevd.
+
+        This blocks until a command is available.  None is returned
+        once the socket has been closed.
+        """
+        commands = self.commands
+        if commands is None:
+            return None
+        command = commands.get()
+        if command is None:
+            # Let any other reader see the end too.
+            commands.put(None)
+        return command
+
     def recv(self, count):
         """Return the requested number of bytes.
 
         This is where the "socket" sends requests to pydevd.  The data
         must follow the pydevd line protocol.
         """
-        pipe_r = self.pipe_r
-        if pipe_r is None:
-            return b''
-        data = os.read(pipe_r, count)
+        data = self._recv_buffer
+        if not data:
+            command = self.recv_command()
+            if command is None:
+                return b''
+            data = u'{}\t{}\t{}\n'.format(*command).encode('utf8')
+        data, self._recv_buffer = data[:count], data[count:]
         #self.log.write('>>>[' + data.decode('utf8') + ']\n\n')
         #self.log.flush()
         return data
 
     def recv_into(self, buf):
-        pipe_r = self.pipe_r
-        if pipe_r is None:
-            return 0
-        return os.readv(pipe_r, [buf])
+        data = self.recv(len(buf))
+        buf[:len(data)] = data
+        return len(data)
 
     # In Python 2, we must unquote before we decode, because UTF-8 codepoints
     # are encoded first and then quoted as individual bytes. In Python 3,
@@ -380,8 +523,24 @@ class PydevdSocket(object):
         #self.log.write('<<<[' + data + ']\n\n')
         #self.log.flush()
         cmd_id, seq, args = data.split('\t', 2)
+        self.send_command(cmd_id, seq, args)
+        return result
+
+    def send_command(self, cmd_id, seq, args):
+        """Handle the given pydevd response or event.
+
+        Unlike send(), the message has already been split up, so there
+        is nothing to decode or unquote.
+        """
+        # pydevd isn't consistent about the type of the ID (e.g. see
+        # NetCommandFactory.make_io_message()).
         cmd_id = int(cmd_id)
         seq = int(seq)
+        if isinstance(args, bytes):
+            args = args.decode('utf8')
+        elif not isinstance(args, (type(u''), dict, list)):
+            # Structured payloads (dicts and lists) are passed as-is.
+            args = str(args)
         _util.log_pydevd_msg(cmd_id, seq, args, inbound=True)
         with self.lock:
             loop, fut = self.requests.pop(seq, (None, None))
@@ -389,40 +548,73 @@ class PydevdSocket(object):
             self._handle_msg(cmd_id, seq, args)
         else:
             loop.call_soon_threadsafe(fut.set_result, (cmd_id, seq, args))
-        return result
 
     def makefile(self, *args, **kwargs):
         """Return a file-like wrapper around the socket."""
-        return os.fdopen(self.pipe_r)
+        return io.BufferedReader(_PydevdSocketReader(self))
 
-    def make_packet(self, cmd_id, args):
-        # TODO: docstring
+    def _next_seq(self):
         with self.lock:
             seq = self.seq
             self.seq += 1
-        s = u'{}\t{}\t{}\n'.format(cmd_id, seq, args)
-        return seq, s
+        return seq
 
     def pydevd_notify(self, cmd_id, args):
         # TODO: docstring
-        if self.pipe_w is None:
+        commands = self.commands
+        if commands is None:
             raise EOFError
-        seq, s = self.make_packet(cmd_id, args)
+        seq = self._next_seq()
         _util.log_pydevd_msg(cmd_id, seq, args, inbound=False)
-        os.write(self.pipe_w, s.encode('utf8'))
+        commands.put((cmd_id, seq, args))
 
-    def pydevd_request(self, loop, cmd_id, args):
-        # TODO: docstring
-        if self.pipe_w is None:
+    def pydevd_request(self, loop, cmd_id, args, timeout=None):
+        """Send a request to pydevd and return a future for its response.
+
+        If a timeout (in seconds) is given and pydevd doesn't respond in
+        time, the request is dropped and the future fails with
+        PydevdRequestTimeoutError.
+        """
+        commands = self.commands
+        if commands is None:
             raise EOFError
-        seq, s = self.make_packet(cmd_id, args)
+        seq = self._next_seq()
         _util.log_pydevd_msg(cmd_id, seq, args, inbound=False)
         fut = loop.create_future()
         with self.lock:
             self.requests[seq] = loop, fut
-            os.write(self.pipe_w, s.encode('utf8'))
+        if timeout is not None:
+            timer = loop.call_later(timeout, self._expire_request, seq,
+                                    cmd_id, timeout)
+            fut.add_done_callback(lambda _: timer.cancel())
+        commands.put((cmd_id, seq, args))
         return fut
 
+    def _expire_request(self, seq, cmd_id, timeout):
+        with self.lock:
+            _, fut = self.requests.pop(seq, (None, None))
+        if fut is None:
+            # It got its response already.
+            return
+        try:
+            raise PydevdRequestTimeoutError(cmd_id, timeout)
+        except PydevdRequestTimeoutError:
+            fut.set_exc_info(sys.exc_info())
+
+
+class _PydevdSocketReader(io.RawIOBase):
+    """A raw stream over the bytes PydevdSocket.recv() produces."""
+
+    def __init__(self, sock):
+        super(_PydevdSocketReader, self).__init__()
+        self._sock = sock
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        return self._sock.recv_into(buf)
+
 
 class ExceptionsManager(object):
     def __init__(self, proc):
@@ -546,8 +738,10 @@ class VariablesSorter(object):
         self.single_underscore = []  # variables beginning with underscores
         self.double_underscore = []  # variables beginning with two underscores
         self.dunder = []  # variables that begin & end with double underscores
+        self._all = []
 
     def append(self, var):
+        self._all.append(var)
         var_name = var['name']
         if var_name.startswith('__'):
             if var_name.endswith('__'):
@@ -559,6 +753,10 @@ class VariablesSorter(object):
         else:
             self.variables.append(var)
 
+    def get_unsorted_variables(self):
+        # The variables in the order they were appended.
+        return self._all
+
     def get_sorted_variables(self):
         def get_sort_key(o):
             return o['name']
@@ -569,6 +767,38 @@ class VariablesSorter(object):
         return self.variables + self.single_underscore + self.double_underscore + self.dunder  # noqa
 
 
+class _ImportCounter(object):
+    """A sys.meta_path finder which only counts the imports.
+
+    It's called for each module which isn't in sys.modules yet, so a
+    module replaced by another one under the same name (which doesn't
+    change the size of sys.modules) is noticed.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def find_spec(self, fullname, path, target=None):
+        self.count += 1
+        return None
+
+    def find_module(self, fullname, path=None):
+        # Python 2
+        self.count += 1
+        return None
+
+
+_import_counter = None
+
+
+def _get_import_counter():
+    global _import_counter
+    if _import_counter is None:
+        _import_counter = _ImportCounter()
+        sys.meta_path.insert(0, _import_counter)
+    return _import_counter
+
+
 class ModulesManager(object):
     def __init__(self, proc):
         self.module_id_to_details = {}
@@ -576,6 +806,13 @@ class ModulesManager(object):
         self._lock = threading.Lock()
         self.proc = proc
         self._next_id = 1
+        # Index of sys.modules: name -> (module, path) and path -> names.
+        self._indexed_modules = {}
+        self._path_to_names = {}
+        self._import_counter = _get_import_counter()
+        self._indexed_generation = None
+        # Names of the modules reported to VSC.
+        self._name_to_module_id = {}
 
     def add_or_get_from_path(self, module_path):
         with self._lock:
@@ -586,39 +823,99 @@ class ModulesManager(object):
                 pass
 
             search_path = self._get_platform_file_path(module_path)
-            for _, value in list(sys.modules.items()):
-                try:
-                    path = self._get_platform_file_path(value.__file__)
-                except AttributeError:
-                    path = None
+            # Files which aren't modules (e.g. "<string>") aren't looked
+            # up again until sys.modules changes.
+            self._update_index()
+            names = self._path_to_names.get(search_path)
+            if names is None:
+                return None
+            name = names[0]
+            try:
+                value = sys.modules[name]
+            except KeyError:
+                return None
 
-                if path and search_path == path:
-                    module_id = self._next_id
-                    self._next_id += 1
+            module_id = self._next_id
+            self._next_id += 1
 
-                    module = {
-                        'id': module_id,
-                        'package': value.__package__,
-                        'path': module_path,
-                    }
+            module = {
+                'id': module_id,
+                'package': value.__package__,
+                'path': module_path,
+            }
 
-                    try:
-                        module['name'] = value.__qualname__
-                    except AttributeError:
-                        module['name'] = value.__name__
+            try:
+                module['name'] = value.__qualname__
+            except AttributeError:
+                module['name'] = value.__name__
 
-                    try:
-                        module['version'] = value.__version__
-                    except AttributeError:
-                        pass
+            try:
+                module['version'] = value.__version__
+            except AttributeError:
+                pass
 
-                    self.path_to_module_id[module_path] = module_id
-                    self.module_id_to_details[module_id] = module
+            self.path_to_module_id[module_path] = module_id
+            self.module_id_to_details[module_id] = module
+            self._name_to_module_id[name] = module_id
 
-                    self.proc.send_event('module', reason='new', module=module)
-                    return module
+            self.proc.send_event('module', reason='new', module=module)
+            return module
 
-        return None
+    def _update_index(self):
+        # This must be called with the lock held.  sys.modules is only
+        # scanned if its size changed or modules were imported since.
+        generation = (len(sys.modules), self._import_counter.count)
+        if generation == self._indexed_generation:
+            return
+        self._indexed_generation = generation
+        self._scan_modules()
+
+    def _scan_modules(self):
+        items = list(sys.modules.items())
+
+        names = set()
+        for name, value in items:
+            names.add(name)
+            try:
+                indexed, _ = self._indexed_modules[name]
+            except KeyError:
+                pass
+            else:
+                if indexed is value:
+                    continue
+                # Replaced (e.g. removed and imported again).
+                self._remove_from_index(name)
+            try:
+                path = self._get_platform_file_path(value.__file__)
+            except (AttributeError, TypeError):
+                path = None
+            self._indexed_modules[name] = (value, path)
+            if path:
+                self._path_to_names.setdefault(path, []).append(name)
+
+        for name in list(self._indexed_modules):
+            if name not in names:
+                self._remove_from_index(name)
+
+    def _remove_from_index(self, name):
+        _, path = self._indexed_modules.pop(name)
+        names = self._path_to_names.get(path, []) if path else []
+        if name in names:
+            names.remove(name)
+            if not names:
+                del self._path_to_names[path]
+
+        try:
+            module_id = self._name_to_module_id.pop(name)
+        except KeyError:
+            return
+        if names:
+            # The file is still loaded under another name.
+            self._name_to_module_id[names[0]] = module_id
+            return
+        module = self.module_id_to_details.pop(module_id)
+        self.path_to_module_id.pop(module['path'], None)
+        self.proc.send_event('module', reason='removed', module=module)
 
     def _get_platform_file_path(self, path):
         if platform.system() == 'Windows':
@@ -629,8 +926,10 @@ class ModulesManager(object):
         with self._lock:
             return list(self.module_id_to_details.values())
 
-    def check_unloaded_modules(self, module_event):
-        pass
+    def check_unloaded_modules(self):
+        """Send "removed" events for the modules no longer loaded."""
+        with self._lock:
+            self._update_index()
 
 
 class InternalsFilter(object):
@@ -1062,8 +1361,9 @@ class VSCLifecycleMsgProcessor(VSCodeMessageProcessorBase):
         # TODO: docstring
         self._restart_debugger = False
         self.is_process_created = False
-        self.send_response(request, **INITIALIZE_RESPONSE)
-        self.send_event('initialized')
+        with self.batched():
+            self.send_response(request, **INITIALIZE_RESPONSE)
+            self.send_event('initialized')
 
     def on_attach(self, request, args):
         # TODO: docstring
@@ -1084,6 +1384,7 @@ class VSCLifecycleMsgProcessor(VSCodeMessageProcessorBase):
         # TODO: docstring
         debugger_attached.set()
         self.send_response(request)
+        self._handle_configured()
         self._process_debug_options(self.debug_options)
         self._handle_configurationDone(args)
         self._notify_ready()
@@ -1163,6 +1464,9 @@ class VSCLifecycleMsgProcessor(VSCodeMessageProcessorBase):
     def _handle_configurationDone(self, args):
         pass
 
+    def _handle_configured(self):
+        pass
+
     def _handle_attach(self, args):
         pass
 
@@ -1202,9 +1506,13 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         # debugger state
         self.is_process_created = False
         self.is_process_created_lock = threading.Lock()
+        # Threads which pydevd reports before the configurationDone
+        # request are only reported once it's handled.
+        self.is_configuration_done = False
+        self._pending_thread_creates = []
         self.thread_map = IDMap()
-        self.frame_map = IDMap()
-        self.var_map = IDMap()
+        self.frame_map = ThreadScopedIDMap()
+        self.var_map = ThreadScopedIDMap()
         self.bp_map = IDMap()
         self.source_map = IDMap()
         self.enable_source_references = False
@@ -1214,6 +1522,8 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         self.modules_mgr = ModulesManager(self)
         self.internals_filter = InternalsFilter()
         self.new_thread_lock = threading.Lock()
+        # pydevd leaves the frames which aren't shown out of the stacks.
+        pydevd_comm.thread_stack_frame_filter = self._is_user_frame
 
         # adapter state
         self.path_casing = PathUnNormcase()
@@ -1227,6 +1537,14 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         )
         self.event_loop_thread.start()
 
+    def close(self):
+        """Stop the message processor and release its resources."""
+        # The subprocesses started from now on aren't reported.
+        multiproc.set_subprocess_handler(None)
+        if pydevd_comm.thread_stack_frame_filter == self._is_user_frame:
+            pydevd_comm.thread_stack_frame_filter = None
+        super(VSCodeMessageProcessor, self).close()
+
     def _stop_event_loop(self):
         self.loop.stop()
         self.event_loop_thread.join(WAIT_FOR_THREAD_FINISH_TIMEOUT)
@@ -1274,9 +1592,11 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
             traceback.print_exc(file=sys.__stderr__)
             raise
 
-    def pydevd_request(self, cmd_id, args):
+    def pydevd_request(self, cmd_id, args, timeout=None):
         # TODO: docstring
-        return self._pydevd_request(self.loop, cmd_id, args)
+        if timeout is None:
+            return self._pydevd_request(self.loop, cmd_id, args)
+        return self._pydevd_request(self.loop, cmd_id, args, timeout=timeout)
 
     # Instances of this class provide decorators to mark methods as
     # handlers for various # pydevd messages - a decorated method is
@@ -1306,6 +1626,92 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
     def parse_xml_response(args):
         return untangle.parse(io.BytesIO(args.encode('utf8'))).xml
 
+    @classmethod
+    def parse_structured_response(cls, args):
+        """Return the structured (dict/list) form of a pydevd payload.
+
+        Once structured payloads have been negotiated (see
+        _send_cmd_version_command()) pydevd passes dicts and lists
+        as-is (or as JSON text over a real socket).  None is
+        returned for XML payloads.
+
+        Raise ValueError for malformed payloads.
+        """
+        if not isinstance(args, (dict, list)):
+            if args.lstrip().startswith('<'):
+                return None
+            args = json.loads(args)
+        return args
+
+    # The parse_*_response() methods below convert XML payloads into the
+    # structured form, so handlers only have to deal with that one.
+    # They raise ValueError or SAXParseException for malformed payloads.
+
+    @classmethod
+    def parse_threads_response(cls, args):
+        """Return the list of threads in the given payload."""
+        payload = cls.parse_structured_response(args)
+        if payload is not None:
+            return payload['threads']
+        xml = cls.parse_xml_response(args)
+        try:
+            xthreads = xml.thread
+        except AttributeError:
+            return []
+        threads = []
+        for xthread in xthreads:
+            try:
+                name = unquote(xthread['name'])
+            except KeyError:
+                name = None
+            threads.append({'id': xthread['id'], 'name': name})
+        return threads
+
+    @classmethod
+    def parse_thread_response(cls, args):
+        """Return the thread (with its frames) in the given payload."""
+        payload = cls.parse_structured_response(args)
+        if payload is not None:
+            return payload
+        xthread = cls.parse_xml_response(args).thread
+        thread = {'id': xthread['id']}
+        for attr in ('stop_reason', 'exc_type', 'exc_desc'):
+            if xthread[attr] is not None:
+                thread[attr] = xthread[attr]
+        if xthread['totalFrames'] is not None:
+            thread['totalFrames'] = int(xthread['totalFrames'])
+        try:
+            xframes = list(xthread.frame)
+        except AttributeError:
+            xframes = []
+        thread['frames'] = [{
+            'id': int(xframe['id']),
+            'name': unquote(xframe['name']),
+            # pydevd encodes if necessary and then uses urllib.quote.
+            'file': unquote(str(xframe['file'])),
+            'line': int(xframe['line']),
+        } for xframe in xframes]
+        return thread
+
+    @classmethod
+    def parse_vars_response(cls, args):
+        """Return the list of variables in the given payload."""
+        payload = cls.parse_structured_response(args)
+        if payload is not None:
+            return payload
+        xml = cls.parse_xml_response(args)
+        try:
+            xvars = xml.var
+        except AttributeError:
+            return []
+        return [{
+            'name': unquote(xvar['name']),
+            'type': unquote(xvar['type']),
+            'value': unquote(xvar['value']),
+            'isContainer': bool(xvar['isContainer']),
+            'isErrorOnEval': xvar['isErrorOnEval'] == 'True',
+        } for xvar in xvars]
+
     @async_method
     def using_format(self, fmt):
         while not SafeReprPresentationProvider._lock.acquire(False):
@@ -1314,9 +1720,11 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
         @contextlib.contextmanager
         def context():
-            with provider.using_format(fmt):
-                yield
-            provider._lock.release()
+            try:
+                with provider.using_format(fmt):
+                    yield
+            finally:
+                provider._lock.release()
         yield futures.Result(context())
 
     def _wait_for_pydevd_ready(self):
@@ -1339,15 +1747,28 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         self._wait_for_pydevd_ready()
         self._notify_debugger_ready()
 
-        if self.start_reason == 'attach':
-            # Send event notifying the creation of the process.
-            # If we do not do this and try to pause, VSC throws errors,
-            # complaining about debugger still initializing.
-            with self.is_process_created_lock:
+    def _handle_configured(self):
+        with self.is_process_created_lock:
+            self.is_configuration_done = True
+            pending = self._pending_thread_creates
+            self._pending_thread_creates = []
+            if self.start_reason == 'attach':
+                # Send event notifying the creation of the process.
+                # If we do not do this and try to pause, VSC throws errors,
+                # complaining about debugger still initializing.
                 if not self.is_process_created:
                     self.is_process_created = True
                     self.send_process_event(self.start_reason)
 
+        for _, args in pending:
+            self.on_pydevd_thread_create(None, args)
+
+        # The client attaches to the subprocesses when it's told about them.
+        multiproc.set_subprocess_handler(self._send_subprocess_event)
+
+    def _send_subprocess_event(self, info):
+        self.send_event('ptvsd_subprocess', **info)
+
     def _process_debug_options(self, opts):
         """Process the launch arguments to configure the debugger."""
         if opts.get('FIX_FILE_PATH_CASE', False):
@@ -1426,7 +1847,9 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         client_os_type = self.debug_options.get(
             'CLIENT_OS_TYPE', default_os_type)
         os_id = client_os_type
-        msg = '1.1\t{}\tID'.format(os_id)
+        # Ask for structured (non-XML) payloads; see
+        # parse_structured_response().
+        msg = '1.1\t{}\tID\tJSON'.format(os_id)
         return self.pydevd_request(cmd, msg)
 
     @async_handler
@@ -1458,12 +1881,15 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         pass
 
     def _clear_breakpoints(self):
-        cmd = pydevd_comm.CMD_REMOVE_BREAK
+        # Setting no breakpoints for a file removes all of them at once.
+        cmd = pydevd_comm.CMD_SET_FILE_BREAKPOINTS
+        paths = set()
         for pyd_bpid, vsc_bpid in self.bp_map.pairs():
-            bp_type = self._get_bp_type(pyd_bpid[0])
-            msg = '{}\t{}\t{}'.format(bp_type, pyd_bpid[0], vsc_bpid)
-            self.pydevd_notify(cmd, msg)
+            paths.add(pyd_bpid[0])
             self.bp_map.remove(pyd_bpid, vsc_bpid)
+        for path in paths:
+            msg = '{}\t{}'.format(self._get_bp_type(path), path)
+            self.pydevd_notify(cmd, msg)
         # TODO: Wait until the last request has been handled?
 
     def _resume_all_threads(self):
@@ -1488,26 +1914,20 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         _, _, resp_args = yield self.pydevd_request(cmd, '')
 
         try:
-            xml = self.parse_xml_response(resp_args)
-        except SAXParseException as ex:
+            pyd_threads = self.parse_threads_response(resp_args)
+        except (SAXParseException, ValueError):
             self.send_error_response(request)
             return
 
-        try:
-            xthreads = xml.thread
-        except AttributeError:
-            xthreads = []
-
         threads = []
-        with self.new_thread_lock:
-            for xthread in xthreads:
-                try:
-                    name = unquote(xthread['name'])
-                except KeyError:
-                    name = None
-
-                if not is_debugger_internal_thread(name):
-                    pyd_tid = xthread['id']
+        # The "thread" events for new threads go out with the response.
+        with self.batched():
+            with self.new_thread_lock:
+                for pyd_thread in pyd_threads:
+                    name = pyd_thread['name']
+                    if is_debugger_internal_thread(name):
+                        continue
+                    pyd_tid = pyd_thread['id']
                     try:
                         vsc_tid = self.thread_map.to_vscode(pyd_tid,
                                                             autogen=False)
@@ -1520,7 +1940,7 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
                     threads.append({'id': vsc_tid, 'name': name})
 
-        self.send_response(request, threads=threads)
+            self.send_response(request, threads=threads)
 
     @async_handler
     def on_source(self, request, args):
@@ -1576,39 +1996,37 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
             self.send_error_response(request)
             return
 
+        # pydevd only walks the frames which are shown (see
+        # _is_user_frame()), so the window and totalFrames are exact.
+        msg = '{}\t{}\t{}'.format(pyd_tid, startFrame, levels)
         try:
             cmd = pydevd_comm.CMD_GET_THREAD_STACK
-            _, _, resp_args = yield self.pydevd_request(cmd, pyd_tid)
-            xml = self.parse_xml_response(resp_args)
-            xframes = list(xml.thread.frame)
+            _, _, resp_args = yield self.pydevd_request(
+                cmd, msg, timeout=INSPECT_REQUEST_TIMEOUT)
+            pyd_thread = self.parse_thread_response(resp_args)
+            pyd_frames = pyd_thread['frames']
+        except PydevdRequestTimeoutError as exc:
+            self.send_error_response(request, str(exc))
+            return
         except Exception:
-            xframes = []
+            pyd_thread = {}
+            pyd_frames = []
 
-        totalFrames = len(xframes)
-        if levels == 0:
-            levels = totalFrames
+        user_pyd_frames = []
+        for pyd_frame in pyd_frames:
+            norm_path = self.path_casing.un_normcase(pyd_frame['file'])
+            user_pyd_frames.append((pyd_frame, norm_path))
+        totalFrames = pyd_thread.get('totalFrames', len(user_pyd_frames))
 
+        self.modules_mgr.check_unloaded_modules()
         stackFrames = []
-        for xframe in xframes:
-            if startFrame > 0:
-                startFrame -= 1
-                continue
-
-            if levels <= 0:
-                break
-            levels -= 1
-
-            key = (pyd_tid, int(xframe['id']))
+        for pyd_frame, norm_path in user_pyd_frames:
+            key = (pyd_tid, pyd_frame['id'])
             fid = self.frame_map.to_vscode(key, autogen=True)
-            name = unquote(xframe['name'])
-            # pydevd encodes if necessary and then uses urllib.quote.
-            norm_path = self.path_casing.un_normcase(unquote(str(xframe['file'])))  # noqa
+            name = pyd_frame['name']
             source_reference = self.get_source_reference(norm_path)
-            if not self.internals_filter.is_internal_path(norm_path):
-                module = self.modules_mgr.add_or_get_from_path(norm_path)
-            else:
-                module = None
-            line = int(xframe['line'])
+            module = self.modules_mgr.add_or_get_from_path(norm_path)
+            line = pyd_frame['line']
             frame_name = self._format_frame_name(
                 fmt,
                 name,
@@ -1626,18 +2044,14 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
                 'line': line, 'column': 1,
             })
 
-        user_frames = []
-        for frame in stackFrames:
-            path = frame['source']['path']
-            if not self.internals_filter.is_internal_path(path) and \
-                self._should_debug(path):
-                user_frames.append(frame)
-
-        totalFrames = len(user_frames)
         self.send_response(request,
-                           stackFrames=user_frames,
+                           stackFrames=stackFrames,
                            totalFrames=totalFrames)
 
+    def _is_user_frame(self, path):
+        return not self.internals_filter.is_internal_path(path) and \
+            self._should_debug(path)
+
     def _format_frame_name(self, fmt, name, module, line, path):
         frame_name = name
         if fmt.get('module', False):
@@ -1679,6 +2093,9 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
         vsc_var = int(args['variablesReference'])
         fmt = args.get('format', {})
+        start = int(args.get('start', 0))
+        count = int(args.get('count', 0))
+        var_filter = args.get('filter', '')
 
         try:
             pyd_var = self.var_map.to_pydevd(vsc_var)
@@ -1688,29 +2105,32 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
         if len(pyd_var) == 3:
             cmd = pydevd_comm.CMD_GET_FRAME
+            cmdargs = pyd_var
         else:
-            cmd = pydevd_comm.CMD_GET_VARIABLE
-        cmdargs = (str(s) for s in pyd_var)
-        msg = '\t'.join(cmdargs)
-        with (yield self.using_format(fmt)):
-            _, _, resp_args = yield self.pydevd_request(cmd, msg)
-
+            # Only the requested page of indexed items (e.g. list items)
+            # is resolved by pydevd.
+            cmd = pydevd_comm.CMD_GET_VARIABLE_PAGE
+            cmdargs = (start, count, var_filter) + pyd_var
+        msg = '\t'.join(str(s) for s in cmdargs)
         try:
-            xml = self.parse_xml_response(resp_args)
-        except SAXParseException as ex:
-            self.send_error_response(request)
+            with (yield self.using_format(fmt)):
+                _, _, resp_args = yield self.pydevd_request(
+                    cmd, msg, timeout=INSPECT_REQUEST_TIMEOUT)
+        except PydevdRequestTimeoutError as exc:
+            self.send_error_response(request, str(exc))
             return
 
         try:
-            xvars = xml.var
-        except AttributeError:
-            xvars = []
+            pyd_vars = self.parse_vars_response(resp_args)
+        except (SAXParseException, ValueError):
+            self.send_error_response(request)
+            return
 
         variables = VariablesSorter()
-        for xvar in xvars:
-            var_name = unquote(xvar['name'])
-            var_type = unquote(xvar['type'])
-            var_value = unquote(xvar['value'])
+        for pyd_var_info in pyd_vars:
+            var_name = pyd_var_info['name']
+            var_type = pyd_var_info['type']
+            var_value = pyd_var_info['value']
             var = {
                 'name': var_name,
                 'type': var_type,
@@ -1720,10 +2140,12 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
             if self._is_raw_string(var_type):
                 var['presentationHint'] = {'attributes': ['rawString']}
 
-            if bool(xvar['isContainer']):
+            if pyd_var_info['isContainer']:
                 pyd_child = pyd_var + (var_name,)
                 var['variablesReference'] = self.var_map.to_vscode(
                     pyd_child, autogen=True)
+                if 'indexedVariables' in pyd_var_info:
+                    var['indexedVariables'] = pyd_var_info['indexedVariables']
 
             eval_name = self._get_variable_evaluate_name(pyd_var, var_name)
             if eval_name:
@@ -1731,7 +2153,12 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
             variables.append(var)
 
-        self.send_response(request, variables=variables.get_sorted_variables())
+        if var_filter == 'indexed':
+            # Keep the order of the items (and of the pages).
+            variables = variables.get_unsorted_variables()
+        else:
+            variables = variables.get_sorted_variables()
+        self.send_response(request, variables=variables)
 
     def _is_raw_string(self, var_type):
         return var_type in ('str', 'unicode', 'bytes', 'bytearray')
@@ -1822,22 +2249,21 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
             )
 
         try:
-            xml = self.parse_xml_response(resp_args)
-        except SAXParseException as ex:
+            pyd_vars = self.parse_vars_response(resp_args)
+        except (SAXParseException, ValueError):
             self.send_error_response(request)
             return
 
-        try:
-            xvar = xml.var
-        except AttributeError:
+        if not pyd_vars:
             self.send_response(request, success=False)
             return
+        pyd_var_info = pyd_vars[0]
 
         response = {
-            'type': unquote(xvar['type']),
-            'value': unquote(xvar['value']),
+            'type': pyd_var_info['type'],
+            'value': pyd_var_info['value'],
         }
-        if bool(xvar['isContainer']):
+        if pyd_var_info['isContainer']:
             response['variablesReference'] = vsc_var
 
         self.send_response(request, **response)
@@ -1861,41 +2287,40 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
                 msg)
 
         try:
-            xml = self.parse_xml_response(resp_args)
-        except SAXParseException as ex:
+            pyd_vars = self.parse_vars_response(resp_args)
+        except (SAXParseException, ValueError):
             self.send_error_response(request)
             return
 
-        try:
-            xvar = xml.var
-        except AttributeError:
+        if not pyd_vars:
             self.send_response(request, success=False)
             return
+        pyd_var_info = pyd_vars[0]
 
         context = args.get('context', '')
-        is_eval_error = xvar['isErrorOnEval']
-        if context == 'hover' and is_eval_error == 'True':
+        is_eval_error = pyd_var_info['isErrorOnEval']
+        if context == 'hover' and is_eval_error:
             self.send_response(
                 request,
                 result=None,
                 variablesReference=0)
             return
 
-        if context == 'repl' and is_eval_error == 'True':
+        if context == 'repl' and is_eval_error:
             # try exec for repl requests
             with (yield self.using_format(fmt)):
                 _, _, resp_args = yield self.pydevd_request(
                     pydevd_comm.CMD_EXEC_EXPRESSION,
                     msg)
             try:
-                xml2 = self.parse_xml_response(resp_args)
-                xvar2 = xml2.var
-                result_type = unquote(xvar2['type'])
-                result = unquote(xvar2['value'])
+                pyd_var_info2 = self.parse_vars_response(resp_args)[0]
+                result_type = pyd_var_info2['type']
+                result = pyd_var_info2['value']
             except Exception:
-                # if resp_args is not xml then it contains the error traceback
-                result_type = unquote(xvar['type'])
-                result = unquote(xvar['value'])
+                # if resp_args is not a variable then it contains the
+                # error traceback
+                result_type = pyd_var_info['type']
+                result = pyd_var_info['value']
             self.send_response(
                 request,
                 result=(None
@@ -1908,8 +2333,8 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
         pyd_var = (pyd_tid, pyd_fid, 'EXPRESSION', expr)
         vsc_var = self.var_map.to_vscode(pyd_var, autogen=True)
-        var_type = unquote(xvar['type'])
-        var_value = unquote(xvar['value'])
+        var_type = pyd_var_info['type']
+        var_value = pyd_var_info['value']
         response = {
             'type': var_type,
             'result': var_value,
@@ -1918,7 +2343,7 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         if self._is_raw_string(var_type):
             response['presentationHint'] = {'attributes': ['rawString']}
 
-        if bool(xvar['isContainer']):
+        if pyd_var_info['isContainer']:
             response['variablesReference'] = vsc_var
 
         self.send_response(request, **response)
@@ -1952,6 +2377,7 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
     @async_handler
     def on_modules(self, request, args):
+        self.modules_mgr.check_unloaded_modules()
         modules = list(self.modules_mgr.get_all())
         user_modules = []
         for module in modules:
@@ -2052,6 +2478,30 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
                 bp_type = 'jinja2-line'
         return bp_type
 
+    def _escape_breakpoint_text(self, text):
+        # Each breakpoint takes a single line in CMD_SET_FILE_BREAKPOINTS
+        # (pydevd restores the new lines and tabs).
+        if text is None:
+            return None
+        return text.replace('\n', '@_@NEW_LINE_CHAR@_@').replace(
+            '\t', '@_@TAB_CHAR@_@')
+
+    def _get_breakpoint_expression_error(self, expression):
+        """Return why the given breakpoint expression can't be compiled.
+
+        None is returned if the expression is valid (or there is none).
+        """
+        if expression is None:
+            return None
+        expression = expression.replace('@HIT@', '0')
+        try:
+            compile(expression, '<breakpoint expression>', 'eval')
+        except SyntaxError as ex:
+            return 'Invalid expression: {}'.format(ex.msg)
+        except Exception as ex:
+            return 'Invalid expression: {}'.format(ex)
+        return None
+
     @async_handler
     def on_setBreakpoints(self, request, args):
         # TODO: docstring
@@ -2062,19 +2512,19 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
         bp_type = self._get_bp_type(path)
 
-        # First, we must delete all existing breakpoints in that source.
-        # TODO: Call self._clear_breakpoints(path) instead?
-        cmd = pydevd_comm.CMD_REMOVE_BREAK
+        # All the breakpoints in that source are replaced at once by
+        # pydevd, so the existing ones are just forgotten here.
         for pyd_bpid, vsc_bpid in self.bp_map.pairs():
             if pyd_bpid[0] == path:
-                msg = '{}\t{}\t{}'.format(bp_type, path, vsc_bpid)
-                self.pydevd_notify(cmd, msg)
                 self.bp_map.remove(pyd_bpid, vsc_bpid)
 
-        cmd = pydevd_comm.CMD_SET_BREAK
-        msgfmt = '{}\t{}\t{}\t{}\tNone\t{}\t{}\t{}\t{}\tALL'
+        cmd = pydevd_comm.CMD_SET_FILE_BREAKPOINTS
+        msgfmt = '{}\t{}'
+        bpfmt = '{}\t{}\tNone\t{}\t{}\t{}\t{}\tALL'
         if needs_unicode(path):
             msgfmt = unicode(msgfmt)   # noqa
+            bpfmt = unicode(bpfmt)   # noqa
+        msg_lines = [msgfmt.format(bp_type, path)]
         for src_bp in src_bps:
             line = src_bp['line']
             vsc_bpid = self.bp_map.add(
@@ -2100,14 +2550,31 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
                     expression_list = ', '.join([s.strip('{').strip('}').strip() for s in expressions]) # noqa
                     expression = '"{}".format({})'.format(raw_text, expression_list) # noqa
 
-            msg = msgfmt.format(vsc_bpid, bp_type, path, line, condition,
-                                expression, hit_condition, is_logpoint)
-            self.pydevd_notify(cmd, msg)
+            # pydevd compiles these once; catch syntax errors up front.
+            error = self._get_breakpoint_expression_error(condition) or \
+                self._get_breakpoint_expression_error(expression) or \
+                self._get_breakpoint_expression_error(hit_condition)
+            if error is not None:
+                bps.append({
+                    'id': vsc_bpid,
+                    'verified': False,
+                    'message': error,
+                    'line': line,
+                })
+                continue
+
+            msg_lines.append(bpfmt.format(
+                vsc_bpid, line,
+                self._escape_breakpoint_text(condition),
+                self._escape_breakpoint_text(expression),
+                self._escape_breakpoint_text(hit_condition),
+                is_logpoint))
             bps.append({
                 'id': vsc_bpid,
                 'verified': True,
                 'line': line,
             })
+        self.pydevd_notify(cmd, '\n'.join(msg_lines))
         yield self._ensure_pydevd_requests_handled()
 
         if request is not None:
@@ -2140,24 +2607,24 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         exc_source = None
         exc_stack = None
         try:
-            xml = self.parse_xml_response(exc_xml)
+            thread = self.parse_thread_response(exc_xml)
             re_name = r"[\'\"](.*)[\'\"]"
-            exc_type = xml.thread['exc_type']
-            exc_desc = xml.thread['exc_desc']
+            exc_type = thread['exc_type']
+            exc_desc = thread['exc_desc']
             try:
                 exc_name = re.findall(re_name, exc_type)[0]
             except IndexError:
                 exc_name = exc_type
 
             if include_stack:
-                xframes = list(xml.thread.frame)
+                frames = thread['frames']
                 frame_data = []
-                for f in xframes:
-                    file_path = unquote(f['file'])
+                for f in frames:
+                    file_path = f['file']
                     if not self.internals_filter.is_internal_path(file_path) \
                        and self._should_debug(file_path):
-                        line_no = int(f['line'])
-                        func_name = unquote(f['name'])
+                        line_no = f['line']
+                        func_name = f['name']
                         if _util.is_py34():
                             # NOTE: In 3.4.* format_list requires the text
                             # to be passed in the tuple list.
@@ -2170,7 +2637,7 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
                                                func_name, None))
 
                 exc_stack = ''.join(traceback.format_list(frame_data))
-                exc_source = unquote(xframes[0]['file'])
+                exc_source = frames[0]['file']
                 if self.internals_filter.is_internal_path(exc_source) or \
                     not self._should_debug(exc_source):
                     exc_source = None
@@ -2254,6 +2721,10 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
                 'executable': sys.executable,
                 'bitness': 64 if sys.maxsize > 2**32 else 32,
             },
+            'debugger': {
+                'tracer': 'cython' if USING_CYTHON else 'python',
+                'frameEval': frame_eval_func is not None,
+            },
         }
         self.send_response(request, **sys_info)
 
@@ -2280,21 +2751,22 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
     @pydevd_events.handler(pydevd_comm.CMD_THREAD_CREATE)
     def on_pydevd_thread_create(self, seq, args):
+        pyd_thread = self.parse_threads_response(args)[0]
+
         # If this is the first thread reported, report process creation
         # as well.
         with self.is_process_created_lock:
+            if not self.is_configuration_done:
+                self._pending_thread_creates.append((pyd_thread['id'], args))
+                return
             if not self.is_process_created:
                 self.is_process_created = True
                 self.send_process_event(self.start_reason)
 
-        xml = self.parse_xml_response(args)
-        try:
-            name = unquote(xml.thread['name'])
-        except KeyError:
-            name = None
+        name = pyd_thread['name']
         if not is_debugger_internal_thread(name):
             with self.new_thread_lock:
-                pyd_tid = xml.thread['id']
+                pyd_tid = pyd_thread['id']
                 # Any internal pydevd or ptvsd threads will be ignored
                 # everywhere
                 try:
@@ -2309,6 +2781,13 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
     def on_pydevd_thread_kill(self, seq, args):
         # TODO: docstring
         pyd_tid = args.strip()
+        with self.is_process_created_lock:
+            if not self.is_configuration_done:
+                self._pending_thread_creates = [
+                    (tid, create_args)
+                    for tid, create_args in self._pending_thread_creates
+                    if tid != pyd_tid
+                ]
         try:
             vsc_tid = self.thread_map.to_vscode(pyd_tid, autogen=False)
         except KeyError:
@@ -2321,9 +2800,9 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
     @async_handler
     def on_pydevd_thread_suspend(self, seq, args):
         # TODO: docstring
-        xml = self.parse_xml_response(args)
-        pyd_tid = xml.thread['id']
-        reason = int(xml.thread['stop_reason'])
+        thread = self.parse_thread_response(args)
+        pyd_tid = thread['id']
+        reason = int(thread['stop_reason'])
         STEP_REASONS = {
                 pydevd_comm.CMD_STEP_INTO,
                 pydevd_comm.CMD_STEP_OVER,
@@ -2338,9 +2817,7 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
         # This is needed till https://github.com/Microsoft/ptvsd/issues/477
         # is done. Remove this after adding the appropriate pydevd commands to
         # do step over and step out
-        xframes = list(xml.thread.frame)
-        xframe = xframes[0]
-        filepath = unquote(xframe['file'])
+        filepath = thread['frames'][0]['file']
         if reason in STEP_REASONS or reason in EXCEPTION_REASONS:
             if self.internals_filter.is_internal_path(filepath) or \
                 not self._should_debug(filepath):
@@ -2386,13 +2863,8 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
 
         # All frames, and variables for
         # this thread are now invalid; clear their IDs.
-        for pyd_fid, vsc_fid in self.frame_map.pairs():
-            if pyd_fid[0] == pyd_tid:
-                self.frame_map.remove(pyd_fid, vsc_fid)
-
-        for pyd_var, vsc_var in self.var_map.pairs():
-            if pyd_var[0] == pyd_tid:
-                self.var_map.remove(pyd_var, vsc_var)
+        self.frame_map.invalidate_thread(pyd_tid)
+        self.var_map.invalidate_thread(pyd_tid)
 
         try:
             vsc_tid = self.thread_map.to_vscode(pyd_tid, autogen=False)
@@ -2414,8 +2886,13 @@ class VSCodeMessageProcessor(VSCLifecycleMsgProcessor):
     @pydevd_events.handler(pydevd_comm.CMD_WRITE_TO_CONSOLE)
     def on_pydevd_cmd_write_to_console2(self, seq, args):
         """Handle console output"""
-        xml = self.parse_xml_response(args)
-        ctx = xml.io['ctx']
+        output = self.parse_structured_response(args)
+        if output is not None:
+            ctx = output['ctx']
+            content = output['output']
+        else:
+            xml = self.parse_xml_response(args)
+            ctx = xml.io['ctx']
+            content = unquote(xml.io['s'])
         category = 'stdout' if ctx == '1' else 'stderr'
-        content = unquote(xml.io['s'])
         self.send_event('output', category=category, output=content)
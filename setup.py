@@ -22,12 +22,21 @@ PTVSD_ROOT = os.path.dirname(os.path.abspath(ptvsd.__file__))
 
 def cython_build():
     print('Compiling extension modules (set SKIP_CYTHON_BUILD=1 to omit)')
-    subprocess.call([
+    args = [
         sys.executable,
         os.path.join(PYDEVD_ROOT, 'setup_cython.py'),
         'build_ext',
         '-i',
-    ])
+    ]
+    try:
+        import Cython  # noqa
+    except ImportError:
+        # The generated .c files are compiled as-is.
+        pass
+    else:
+        # Generate the .c files from the (possibly newer) .pyx files.
+        args.append('--force-cython')
+    subprocess.call(args)
 
 
 def iter_vendored_files():
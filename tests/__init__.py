@@ -5,9 +5,9 @@ import os.path
 import sys
 import unittest
 
-# Importing "ptvsd" here triggers the vendoring code before any vendored
-# code ever gets imported.
-import ptvsd  # noqa
+# Importing "force_pydevd" here triggers the vendoring code before any
+# vendored code ever gets imported.
+from ptvsd._vendored import force_pydevd  # noqa
 from ptvsd._vendored import list_all as vendored
 
 
@@ -123,6 +123,9 @@ class Connection(namedtuple('Connection', 'client server')):
     def send(self, *args, **kwargs):
         return self.client.send(*args, **kwargs)
 
+    def sendall(self, *args, **kwargs):
+        return self.client.sendall(*args, **kwargs)
+
     def recv(self, *args, **kwargs):
         return self.client.recv(*args, **kwargs)
 
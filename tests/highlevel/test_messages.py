@@ -12,13 +12,12 @@ from _pydevd_bundle.pydevd_comm import (
     CMD_EXIT,
     CMD_GET_BREAKPOINT_EXCEPTION,
     CMD_GET_FRAME,
-    CMD_GET_VARIABLE,
+    CMD_GET_VARIABLE_PAGE,
     CMD_LIST_THREADS,
     CMD_PROCESS_CREATED,
-    CMD_REMOVE_BREAK,
     CMD_REMOVE_EXCEPTION_BREAK,
     CMD_RETURN,
-    CMD_SET_BREAK,
+    CMD_SET_FILE_BREAKPOINTS,
     CMD_SHOW_CONSOLE,
     CMD_STEP_CAUGHT_EXCEPTION,
     CMD_STEP_INTO,
@@ -98,7 +97,7 @@ class LifecycleTest(RunningTest):
 
 def _get_cmd_version():
     plat = 'WINDOWS' if platform.system() == 'Windows' else 'UNIX'
-    return '1.1\t%s\tID' % plat
+    return '1.1\t%s\tID\tJSON' % plat
 
 
 class InitializeTests(LifecycleTest, unittest.TestCase):
@@ -436,7 +435,7 @@ class VariablesTests(NormalRequestTest, unittest.TestCase):
     COMMAND = 'variables'
     PYDEVD_CMD = [
         CMD_GET_FRAME,
-        CMD_GET_VARIABLE,
+        CMD_GET_VARIABLE_PAGE,
     ]
 
     def pydevd_payload(self, *variables):
@@ -548,7 +547,7 @@ class VariablesTests(NormalRequestTest, unittest.TestCase):
                 self.send_request(
                     variablesReference=1,  # matches frame locals
                 )
-            self.PYDEVD_CMD = CMD_GET_VARIABLE
+            self.PYDEVD_CMD = CMD_GET_VARIABLE_PAGE
             self.set_debugger_response(
                 # (var, value)
                 ('x', 1),
@@ -587,7 +586,7 @@ class VariablesTests(NormalRequestTest, unittest.TestCase):
         ])
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '{}\t2\tFRAME\tspam'.format(thread.id)),
+                '0\t0\t\t{}\t2\tFRAME\tspam'.format(thread.id)),
         ])
 
 
@@ -1031,10 +1030,7 @@ class GotoTests(NormalRequestTest, unittest.TestCase):
 class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
 
     COMMAND = 'setBreakpoints'
-    PYDEVD_CMD = [
-        [CMD_REMOVE_BREAK],
-        [CMD_SET_BREAK],
-    ]
+    PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
     PYDEVD_RESP = None
 
     def test_initial(self):
@@ -1062,12 +1058,12 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
             # no events
         ])
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
-            self.expected_pydevd_request(
-                '2\tpython-line\tspam.py\t15\tNone\ti == 3\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\tNone\tNone\tALL\n'
+                '2\t15\tNone\ti == 3\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1112,18 +1108,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
             # no events
         ])
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\t@HIT@ == 5\tNone\tALL'), # noqa
-            self.expected_pydevd_request(
-                '2\tpython-line\tspam.py\t15\tNone\tNone\tNone\t@HIT@ ==5\tNone\tALL'), # noqa
-            self.expected_pydevd_request(
-                '3\tpython-line\tspam.py\t20\tNone\tNone\tNone\t@HIT@ > 5\tNone\tALL'), # noqa
-            self.expected_pydevd_request(
-             '4\tpython-line\tspam.py\t25\tNone\tNone\tNone\t@HIT@ % 5 == 0\tNone\tALL'), # noqa
-            self.expected_pydevd_request(
-                '5\tpython-line\tspam.py\t30\tNone\tNone\tNone\tx\tNone\tALL'),
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\t@HIT@ == 5\tNone\tALL\n'
+                '2\t15\tNone\tNone\tNone\t@HIT@ ==5\tNone\tALL\n'
+                '3\t20\tNone\tNone\tNone\t@HIT@ > 5\tNone\tALL\n'
+                '4\t25\tNone\tNone\tNone\t@HIT@ % 5 == 0\tNone\tALL\n'
+                '5\t30\tNone\tNone\tNone\tx\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1163,27 +1156,25 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
             # no events
         ])
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\t' + repr("5") + '\tNone\tTrue\tALL'), # noqa
-            self.expected_pydevd_request(
-                '2\tpython-line\tspam.py\t15\tNone\tNone\t' + repr("Hello World") + '\tNone\tTrue\tALL'), # noqa
-            self.expected_pydevd_request(
-                '3\tpython-line\tspam.py\t20\tNone\tNone\t"{}".format(a)\tNone\tTrue\tALL'), # noqa
-            self.expected_pydevd_request(
-             '4\tpython-line\tspam.py\t25\tNone\tNone\t"{}+{}=Something".format(a, b)\tNone\tTrue\tALL'), # noqa
+                'python-line\tspam.py\n'
+                "1\t10\tNone\tNone\t'5'\tNone\tTrue\tALL\n"
+                "2\t15\tNone\tNone\t'Hello World'\tNone\tTrue\tALL\n"
+                '3\t20\tNone\tNone\t"{}".format(a)\tNone\tTrue\tALL\n'
+                '4\t25\tNone\tNone\t"{}+{}=Something".format(a, b)\tNone\tTrue\tALL'),  # noqa
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
     def test_with_existing(self):
         with self.launched():
             with self.hidden():
-                self.PYDEVD_CMD = CMD_SET_BREAK
+                self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
                 p1 = self.expected_pydevd_request(
-                    '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL') # noqa
-                p2 = self.expected_pydevd_request(
-                    '2\tpython-line\tspam.py\t17\tNone\tNone\tNone\tNone\tNone\tALL') # noqa
+                    'python-line\tspam.py\n'
+                    '1\t10\tNone\tNone\tNone\tNone\tNone\tALL\n'
+                    '2\t17\tNone\tNone\tNone\tNone\tNone\tALL')
                 with self.expect_debugger_command(CMD_VERSION):
                     self.fix.send_request('setBreakpoints', dict(
                         source={'path': 'spam.py'},
@@ -1192,7 +1183,7 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
                             {'line': '17'},
                         ],
                     ))
-                self.wait_for_pydevd(p1, p2)
+                self.wait_for_pydevd(p1)
             self.send_request(
                 source={'path': 'spam.py'},
                 breakpoints=[
@@ -1219,25 +1210,14 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
             # no events
         ])
-        self.PYDEVD_CMD = CMD_REMOVE_BREAK
-        if self.debugger.received[0].payload.endswith('1'):
-            removed = [
-                self.expected_pydevd_request('python-line\tspam.py\t1'),
-                self.expected_pydevd_request('python-line\tspam.py\t2'),
-            ]
-        else:
-            removed = [
-                self.expected_pydevd_request('python-line\tspam.py\t2'),
-                self.expected_pydevd_request('python-line\tspam.py\t1'),
-            ]
-        self.PYDEVD_CMD = CMD_SET_BREAK
-        self.assert_received(self.debugger, removed + [
-            self.expected_pydevd_request(
-                '3\tpython-line\tspam.py\t113\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
-            self.expected_pydevd_request(
-                '4\tpython-line\tspam.py\t2\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+        # The existing breakpoints are replaced along with the new ones.
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
+        self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '5\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '3\t113\tNone\tNone\tNone\tNone\tNone\tALL\n'
+                '4\t2\tNone\tNone\tNone\tNone\tNone\tALL\n'
+                '5\t10\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1271,13 +1251,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             # no events
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tpython-line\teggs.py\t17\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\teggs.py\n'
+                '2\t17\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1310,13 +1292,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tdjango-line\teggs.html\t17\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'django-line\teggs.html\n'
+                '2\t17\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1349,13 +1333,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\t' + repr("Hello World") + '\tNone\tTrue\tALL'), # noqa
+                'python-line\tspam.py\n'
+                "1\t10\tNone\tNone\t'Hello World'\tNone\tTrue\tALL"),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tdjango-line\teggs.html\t17\tNone\tNone\t' + repr("Hello Django World") + '\tNone\tTrue\tALL'), # noqa
+                'django-line\teggs.html\n'
+                "2\t17\tNone\tNone\t'Hello Django World'\tNone\tTrue\tALL"),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1388,13 +1374,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tjinja2-line\teggs.html\t17\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'jinja2-line\teggs.html\n'
+                '2\t17\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1427,13 +1415,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\t' + repr("Hello World") + '\tNone\tTrue\tALL'), # noqa
+                'python-line\tspam.py\n'
+                "1\t10\tNone\tNone\t'Hello World'\tNone\tTrue\tALL"),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tjinja2-line\teggs.html\t17\tNone\tNone\t' + repr("Hello Jinja World") + '\tNone\tTrue\tALL'), # noqa
+                'jinja2-line\teggs.html\n'
+                "2\t17\tNone\tNone\t'Hello Jinja World'\tNone\tTrue\tALL"),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1466,13 +1456,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tjinja2-line\teggs.html\t17\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'jinja2-line\teggs.html\n'
+                '2\t17\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -1505,13 +1497,15 @@ class SetBreakpointsTests(NormalRequestTest, unittest.TestCase):
             ),
         ])
 
-        self.PYDEVD_CMD = CMD_SET_BREAK
+        self.PYDEVD_CMD = CMD_SET_FILE_BREAKPOINTS
         self.assert_received(self.debugger, [
             self.expected_pydevd_request(
-                '1\tpython-line\tspam.py\t10\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'python-line\tspam.py\n'
+                '1\t10\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
             self.expected_pydevd_request(
-                '2\tjinja2-line\teggs.html\t17\tNone\tNone\tNone\tNone\tNone\tALL'), # noqa
+                'jinja2-line\teggs.html\n'
+                '2\t17\tNone\tNone\tNone\tNone\tNone\tALL'),
             self.debugger_msgs.new_request(CMD_VERSION, _get_cmd_version()),
         ])
 
@@ -294,6 +294,34 @@ class ParseArgsTests(unittest.TestCase):
                     'spam.py',
                 ])
 
+    def test_missing_port(self):
+        with self.assertRaises(SystemExit):
+            with captured_stdio():
+                parse_args([
+                    'eggs',
+                    'spam.py',
+                ])
+
+    def test_subprocess(self):
+        args, extra = parse_args([
+            'eggs',
+            '--multiprocess',
+            '--subprocess-of', '1234',
+            '--subprocess-notify', '5678',
+            'spam.py',
+        ])
+
+        self.assertEqual(vars(args), {
+            'kind': 'script',
+            'name': 'spam.py',
+            'address': None,
+            'nodebug': False,
+            'single_session': False,
+            'subprocess_of': 1234,
+            'subprocess_notify': 5678,
+        })
+        self.assertEqual(extra, ['--multiprocess'] + self.EXPECTED_EXTRA)
+
     def test_backward_compatibility_host(self):
         args, extra = parse_args([
             'eggs',
@@ -0,0 +1,153 @@
+import sys
+import unittest
+
+from _pydevd_bundle.pydevd_breakpoints import (
+    LineBreakpoint, compile_hit_condition)
+from _pydevd_bundle.pydevd_condition_compiler import compile_condition
+from _pydevd_bundle.pydevd_frame_utils import (
+    get_code_lines, has_breakpoint_in_code)
+
+
+class LineBreakpointTests(unittest.TestCase):
+
+    def test_precompiled(self):
+        bp = LineBreakpoint(1, 'x > 1', None, '"{}".format(x)')
+
+        x = 2  # noqa
+        frame = sys._getframe()
+        self.assertTrue(eval(bp.condition_code, frame.f_globals,
+                             frame.f_locals))
+        self.assertEqual(eval(bp.expression_code, frame.f_globals,
+                              frame.f_locals), '2')
+
+    def test_invalid_condition(self):
+        bp = LineBreakpoint(1, 'x >', None, None)
+
+        self.assertEqual(bp.condition_code, 'x >')
+
+    def test_hit_condition(self):
+        bp = LineBreakpoint(1, None, None, None,
+                            hit_condition='@HIT@ % 2 == 0')
+        frame = sys._getframe()
+
+        hits = [bp.handle_hit_condition(frame) for _ in range(4)]
+
+        self.assertEqual(hits, [False, True, False, True])
+
+    def test_native_hit_condition(self):
+        for hit_condition, expected in [
+                ('@HIT@ == 2', [False, True, False, False]),
+                ('@HIT@ >= 3', [False, False, True, True]),
+                ('@HIT@ < 2', [True, False, False, False]),
+                ('@HIT@ % 3 == 0', [False, False, True, False]),
+        ]:
+            with self.subTest(hit_condition):
+                bp = LineBreakpoint(1, None, None, None,
+                                    hit_condition=hit_condition)
+                frame = sys._getframe()
+
+                hits = [bp.handle_hit_condition(frame) for _ in range(4)]
+
+                self.assertEqual(hits, expected)
+                self.assertIsNone(bp._hit_condition_code)
+
+    def test_compile_hit_condition(self):
+        self.assertTrue(compile_hit_condition(' @HIT@ >= 100 ')(100))
+        self.assertFalse(compile_hit_condition('@HIT@ % 10 == 0')(15))
+        for hit_condition in [None, '@HIT@ == x', '@HIT@ % 0 == 0',
+                              '@HIT@ % 2 == 1', '@HIT@ > 1 and x']:
+            with self.subTest(hit_condition):
+                self.assertIsNone(compile_hit_condition(hit_condition))
+
+    def test_hit_condition_with_locals(self):
+        bp = LineBreakpoint(1, None, None, None, hit_condition='@HIT@ == x')
+        x = 2  # noqa
+        frame = sys._getframe()
+
+        hits = [bp.handle_hit_condition(frame) for _ in range(3)]
+
+        self.assertEqual(hits, [False, True, False])
+        self.assertNotIn('__pydevd_hit_count__', frame.f_locals)
+
+
+GLOBAL = 3
+
+
+class ConditionCompilerTests(unittest.TestCase):
+
+    def _evaluate(self, condition, frame):
+        try:
+            return eval(condition, frame.f_globals, frame.f_locals)
+        except Exception as exc:
+            return type(exc)
+
+    def test_same_as_eval(self):
+        i = 5000  # noqa
+        text = 'spam'  # noqa
+        done = False  # noqa
+        frame = sys._getframe()
+
+        for condition in ['i == 5000',
+                          'i != 5000',
+                          ' i > 10 and i < 100',
+                          'i < 10 or text == "spam"',
+                          '0 < i <= 5000 < 6000',
+                          'not done',
+                          'text in "spam and eggs" and "x" not in text',
+                          'done is False and text is not None',
+                          'i > -1',
+                          'i == GLOBAL',
+                          'done or missing > 1',
+                          'missing > 1',
+                          ]:
+            with self.subTest(condition):
+                evaluate = compile_condition(condition)
+                expected = self._evaluate(condition, frame)
+                try:
+                    actual = evaluate(frame)
+                except Exception as exc:
+                    actual = type(exc)
+
+                self.assertEqual(actual, expected)
+
+    def test_not_simple(self):
+        for condition in ['x.y == 1', 'len(x) == 4', 'x[0]', 'x + 1 > 2',
+                          'x in (1, 2)', 'x >', 'lambda: 1']:
+            with self.subTest(condition):
+                self.assertIsNone(compile_condition(condition))
+
+    def test_breakpoint(self):
+        self.assertIsNotNone(
+            LineBreakpoint(1, 'x > 1', None, None).condition_evaluator)
+        self.assertIsNone(
+            LineBreakpoint(1, None, None, None).condition_evaluator)
+
+
+def _outer():
+    x = 1
+
+    def inner():
+        return x
+    return inner
+
+
+class CodeLinesTests(unittest.TestCase):
+
+    def test_code_lines(self):
+        code = _outer.__code__
+        inner = _outer().__code__
+        lines = get_code_lines(code)
+
+        self.assertIn(code.co_firstlineno, lines)
+        self.assertIn(code.co_firstlineno + 1, lines)
+        self.assertNotIn(inner.co_firstlineno + 1, lines)
+        self.assertIs(get_code_lines(code), lines)
+
+    def test_has_breakpoint_in_code(self):
+        code = _outer.__code__
+        inner = _outer().__code__
+        breakpoints = {inner.co_firstlineno + 1: None}
+
+        self.assertFalse(has_breakpoint_in_code(code, breakpoints))
+        self.assertTrue(has_breakpoint_in_code(inner, breakpoints))
+        self.assertFalse(has_breakpoint_in_code(inner, {}))
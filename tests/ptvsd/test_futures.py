@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from ptvsd import futures
+
+
+class EventLoopTestsMixin(object):
+
+    LOOP = None
+
+    def setUp(self):
+        super(EventLoopTestsMixin, self).setUp()
+        self.loop = self.LOOP()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.loop.stop()
+        self.thread.join(5)
+        super(EventLoopTestsMixin, self).tearDown()
+
+    def test_call_soon(self):
+        done = threading.Event()
+        calls = []
+
+        def f(x):
+            calls.append((x, threading.current_thread()))
+            done.set()
+        self.loop.call_soon(f, 'spam')
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(calls, [('spam', self.thread)])
+
+    def test_call_later(self):
+        done = threading.Event()
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            if x == 'eggs':
+                done.set()
+        cancelled = self.loop.call_later(0.01, f, 'spam')
+        self.loop.call_later(0.05, f, 'eggs')
+        cancelled.cancel()
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(calls, ['eggs'])
+
+    def test_stop(self):
+        self.loop.stop()
+        self.thread.join(5)
+
+        self.assertFalse(self.thread.is_alive())
+
+    def test_future(self):
+        done = threading.Event()
+        results = []
+        fut = self.loop.create_future()
+
+        def callback(fut):
+            results.append(fut.result())
+            done.set()
+        fut.add_done_callback(callback)
+        fut.set_result('spam')
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(results, ['spam'])
+
+
+class EventLoopTests(EventLoopTestsMixin, unittest.TestCase):
+
+    LOOP = futures.EventLoop
+
+
+class ThreadingEventLoopTests(EventLoopTestsMixin, unittest.TestCase):
+
+    LOOP = futures._ThreadingEventLoop
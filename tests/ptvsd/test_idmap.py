@@ -0,0 +1,51 @@
+import unittest
+
+from ptvsd.wrapper import ThreadScopedIDMap
+
+
+class ThreadScopedIDMapTests(unittest.TestCase):
+
+    def test_invalidate_thread(self):
+        idmap = ThreadScopedIDMap()
+        frame1 = idmap.to_vscode(('1', 10), autogen=True)
+        var1 = idmap.to_vscode(('1', 10, 'FRAME'), autogen=True)
+        frame2 = idmap.to_vscode(('2', 10), autogen=True)
+
+        idmap.invalidate_thread('1')
+
+        with self.assertRaises(KeyError):
+            idmap.to_pydevd(frame1)
+        with self.assertRaises(KeyError):
+            idmap.to_pydevd(var1)
+        with self.assertRaises(KeyError):
+            idmap.to_vscode(('1', 10), autogen=False)
+        self.assertEqual(idmap.to_pydevd(frame2), ('2', 10))
+        self.assertEqual(idmap.pairs(), [(('2', 10), frame2)])
+
+        # New IDs are generated for the same frame once it's suspended again.
+        frame1_again = idmap.to_vscode(('1', 10), autogen=True)
+        self.assertNotEqual(frame1_again, frame1)
+        self.assertEqual(idmap.to_pydevd(frame1_again), ('1', 10))
+        with self.assertRaises(KeyError):
+            idmap.to_pydevd(frame1)
+
+    def test_stale_ids_dropped(self):
+        idmap = ThreadScopedIDMap()
+        for i in range(10):
+            idmap.to_vscode(('1', i), autogen=True)
+        kept = idmap.to_vscode(('2', 0), autogen=True)
+
+        idmap.invalidate_thread('1')
+
+        self.assertEqual(idmap.vscode_ids(), [kept])
+        self.assertEqual(list(idmap._vscode_to_pydevd), [kept])
+
+    def test_remove(self):
+        idmap = ThreadScopedIDMap()
+        frame = idmap.to_vscode(('1', 10), autogen=True)
+
+        idmap.remove(vscode_id=frame)
+
+        self.assertEqual(idmap.pairs(), [])
+        with self.assertRaises(KeyError):
+            idmap.to_pydevd(frame)
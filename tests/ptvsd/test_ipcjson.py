@@ -0,0 +1,62 @@
+import json
+import unittest
+
+from ptvsd.ipcjson import IpcChannel, SocketIO
+
+
+class FakeSocket(object):
+
+    def __init__(self):
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+
+class Channel(SocketIO, IpcChannel):
+
+    def __init__(self):
+        self.sock = FakeSocket()
+        super(Channel, self).__init__(socket=self.sock, own_socket=False)
+
+
+def _parse(data):
+    messages = []
+    while data:
+        header, _, data = data.partition(b'\r\n\r\n')
+        length = int(header.split(b':')[1])
+        messages.append(json.loads(data[:length].decode('utf-8')))
+        data = data[length:]
+    return messages
+
+
+class SocketIOTests(unittest.TestCase):
+
+    def test_single_write(self):
+        channel = Channel()
+
+        channel.send_event('spam', x=1)
+
+        data, = channel.sock.sent
+        msg, = _parse(data)
+        self.assertEqual(msg['event'], 'spam')
+        self.assertEqual(msg['body'], {'x': 1})
+
+    def test_batched(self):
+        channel = Channel()
+
+        with channel.batched():
+            channel.send_event('spam')
+            with channel.batched():
+                channel.send_event('eggs')
+            self.assertEqual(channel.sock.sent, [])
+            channel.send_event('ham')
+
+        data, = channel.sock.sent
+        msgs = _parse(data)
+        self.assertEqual([msg['event'] for msg in msgs],
+                         ['spam', 'eggs', 'ham'])
+        self.assertEqual([msg['seq'] for msg in msgs], [0, 1, 2])
+
+        channel.send_event('done')
+        self.assertEqual(len(channel.sock.sent), 2)
@@ -1,6 +1,11 @@
+import importlib
+import os.path
+import shutil
 import sys
+import tempfile
 import threading
 import time
+import types
 import unittest
 import ptvsd.untangle
 
@@ -112,3 +117,116 @@ class ModulesManagerTests(unittest.TestCase):
         self.assertEqual(1, len(sink.event_data))
         self.assertEqual([expected_module],
                          self.mgr.get_all())
+
+    def test_new_and_removed_modules(self):
+        sink = ModulesEventSink()
+        mgr = ModulesManager(sink)
+        mgr.add_or_get_from_path(ptvsd.untangle.__file__)
+
+        module = types.ModuleType('ptvsd_test_spam')
+        module.__file__ = '/abc/ptvsd_test_spam.py'
+        sys.modules['ptvsd_test_spam'] = module
+        try:
+            spam = mgr.add_or_get_from_path('/abc/ptvsd_test_spam.py')
+            self.assertEqual(spam['name'], 'ptvsd_test_spam')
+        finally:
+            del sys.modules['ptvsd_test_spam']
+
+        mgr.check_unloaded_modules()
+
+        self.assertEqual(
+            [(data['args']['reason'], data['args']['module']['path'])
+             for data in sink.event_data],
+            [
+                ('new', ptvsd.untangle.__file__),
+                ('new', '/abc/ptvsd_test_spam.py'),
+                ('removed', '/abc/ptvsd_test_spam.py'),
+            ])
+        self.assertEqual([m['path'] for m in mgr.get_all()],
+                         [ptvsd.untangle.__file__])
+        self.assertIsNone(mgr.add_or_get_from_path('/abc/ptvsd_test_spam.py'))
+
+    def test_module_replaced(self):
+        sink = ModulesEventSink()
+        mgr = ModulesManager(sink)
+        tempdir = tempfile.mkdtemp()
+        spam_path = os.path.join(tempdir, 'ptvsd_test_spam.py')
+        eggs_path = os.path.join(tempdir, 'ptvsd_test_eggs.py')
+        for path in (spam_path, eggs_path):
+            with open(path, 'w'):
+                pass
+        sys.path.insert(0, tempdir)
+        try:
+            importlib.import_module('ptvsd_test_spam')
+            mgr.add_or_get_from_path(spam_path)
+            # The same number of modules as before.
+            del sys.modules['ptvsd_test_spam']
+            importlib.import_module('ptvsd_test_eggs')
+
+            module = mgr.add_or_get_from_path(eggs_path)
+        finally:
+            sys.path.remove(tempdir)
+            sys.modules.pop('ptvsd_test_spam', None)
+            sys.modules.pop('ptvsd_test_eggs', None)
+            shutil.rmtree(tempdir)
+
+        self.assertEqual(module['name'], 'ptvsd_test_eggs')
+        self.assertEqual(
+            [(data['args']['reason'], data['args']['module']['path'])
+             for data in sink.event_data],
+            [
+                ('new', spam_path),
+                ('removed', spam_path),
+                ('new', eggs_path),
+            ])
+
+    def test_not_rescanned(self):
+        sink = ModulesEventSink()
+        mgr = ModulesManager(sink)
+        scans = []
+        scan_modules = mgr._scan_modules
+
+        def count_scans():
+            scans.append(len(sys.modules))
+            scan_modules()
+        mgr._scan_modules = count_scans
+
+        for _ in range(3):
+            self.assertIsNone(mgr.add_or_get_from_path('<string>'))
+            mgr.add_or_get_from_path(ptvsd.untangle.__file__)
+            mgr.check_unloaded_modules()
+        self.assertEqual(len(scans), 1)
+
+        module = types.ModuleType('ptvsd_test_spam')
+        sys.modules['ptvsd_test_spam'] = module
+        try:
+            mgr.check_unloaded_modules()
+        finally:
+            del sys.modules['ptvsd_test_spam']
+        self.assertEqual(len(scans), 2)
+
+    def test_module_with_several_names(self):
+        sink = ModulesEventSink()
+        mgr = ModulesManager(sink)
+
+        module = types.ModuleType('ptvsd_test_spam')
+        module.__file__ = '/abc/ptvsd_test_spam.py'
+        sys.modules['ptvsd_test_spam'] = module
+        sys.modules['ptvsd_test_eggs'] = module
+        try:
+            mgr.add_or_get_from_path('/abc/ptvsd_test_spam.py')
+            del sys.modules['ptvsd_test_spam']
+            mgr.check_unloaded_modules()
+            still_loaded = mgr.get_all()
+            del sys.modules['ptvsd_test_eggs']
+            mgr.check_unloaded_modules()
+        finally:
+            sys.modules.pop('ptvsd_test_spam', None)
+            sys.modules.pop('ptvsd_test_eggs', None)
+
+        self.assertEqual([m['path'] for m in still_loaded],
+                         ['/abc/ptvsd_test_spam.py'])
+        self.assertEqual(
+            [data['args']['reason'] for data in sink.event_data],
+            ['new', 'removed'])
+        self.assertEqual(mgr.get_all(), [])
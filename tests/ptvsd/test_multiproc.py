@@ -0,0 +1,106 @@
+import os
+import sys
+import threading
+import unittest
+
+from ptvsd import multiproc
+
+
+class PatchArgsTests(unittest.TestCase):
+
+    def setUp(self):
+        super(PatchArgsTests, self).setUp()
+        self._root = (multiproc.root_process_id, multiproc.notification_port)
+        multiproc.init_subprocess(1234, 5678)
+
+    def tearDown(self):
+        multiproc.init_subprocess(*self._root)
+        super(PatchArgsTests, self).tearDown()
+
+    def _ptvsd_args(self, patched):
+        """Return the original args and the ones added for ptvsd."""
+        i = patched.index('ptvsd') - 1
+        j = patched.index('--subprocess-notify') + 2
+        return patched[:i] + patched[j:], patched[i:j]
+
+    def test_script(self):
+        args = [sys.executable, '-u', 'spam.py', '--eggs']
+        patched = multiproc.patch_args(args)
+        unpatched, ptvsd_args = self._ptvsd_args(patched)
+
+        self.assertEqual(unpatched, args)
+        self.assertEqual(patched[:2], [sys.executable, '-u'])
+        self.assertEqual(ptvsd_args[:2], ['-m', 'ptvsd'])
+        self.assertEqual(ptvsd_args[-4:], [
+            '--subprocess-of', '1234',
+            '--subprocess-notify', '5678',
+        ])
+        self.assertIn('--multiprocess', ptvsd_args)
+        # The subprocess binds its own port.
+        self.assertNotIn('--port', ptvsd_args)
+
+    def test_module(self):
+        args = [sys.executable, '-W', 'ignore', '-m', 'spam', 'eggs']
+        patched = multiproc.patch_args(args)
+        unpatched, _ = self._ptvsd_args(patched)
+
+        self.assertEqual(unpatched, args)
+        self.assertEqual(patched[:3], args[:3])
+        self.assertEqual(patched[-3:], args[-3:])
+
+    def test_not_patched(self):
+        for args in ([sys.executable, '-c', 'pass'],
+                     [sys.executable],
+                     [sys.executable, '-'],
+                     [sys.executable, 'app.pyz'],
+                     [sys.executable, '-m', 'ptvsd', '--port', '1', 'x.py'],
+                     ['/bin/ls', 'spam.py']):
+            with self.subTest(args):
+                self.assertEqual(multiproc.patch_args(args), args)
+
+
+class NotificationTests(unittest.TestCase):
+
+    def setUp(self):
+        super(NotificationTests, self).setUp()
+        self._root = (multiproc.root_process_id, multiproc.notification_port)
+        multiproc.listen_for_subprocesses()
+
+    def tearDown(self):
+        multiproc.stop_listening()
+        multiproc.set_subprocess_handler(None)
+        multiproc._pending_subprocesses = []
+        multiproc.init_subprocess(*self._root)
+        super(NotificationTests, self).tearDown()
+
+    def test_notify_root(self):
+        received = []
+        done = threading.Event()
+
+        def handle(info):
+            received.append(info)
+            if len(received) == 2:
+                done.set()
+
+        # The first one is kept until there is a handler.
+        multiproc.notify_root(1111)
+        multiproc.set_subprocess_handler(handle)
+        multiproc.notify_root(2222)
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual([info['port'] for info in received], [1111, 2222])
+        self.assertEqual(received[0]['rootProcessId'], os.getpid())
+        self.assertEqual(received[0]['processId'], os.getpid())
+        self.assertFalse(multiproc.is_subprocess())
+
+    def test_not_kept_after_session(self):
+        received = []
+        multiproc.set_subprocess_handler(received.append)
+        multiproc.set_subprocess_handler(None)
+
+        # Nobody is told about this one.
+        multiproc._handle_subprocess({'processId': 1111})
+        multiproc.set_subprocess_handler(received.append)
+
+        self.assertEqual(received, [])
+        self.assertIsNone(multiproc._pending_subprocesses)
@@ -0,0 +1,96 @@
+import unittest
+
+from _pydevd_bundle import pydevd_comm
+
+from ptvsd.wrapper import VSCodeMessageProcessor
+
+
+class FakeWriter(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def add_command(self, cmd):
+        self.commands.append(cmd)
+
+
+class OutputBufferTests(unittest.TestCase):
+
+    def setUp(self):
+        super(OutputBufferTests, self).setUp()
+        self.writer = FakeWriter()
+        self.factory = pydevd_comm.NetCommandFactory()
+        self.factory.structured_payloads = True
+        self.buffer = pydevd_comm.OutputBuffer(self.writer, self.factory)
+
+    def _outputs(self, cmds):
+        return [(cmd.text['ctx'], cmd.text['output']) for cmd in cmds]
+
+    def test_coalesced(self):
+        for i in range(100):
+            self.buffer.write('line %s\n' % i, '1')
+        self.buffer.write('error\n', '2')
+        self.buffer.write('done\n', '1')
+
+        self.assertEqual(len(self.writer.commands), 1)
+        cmds = self.buffer.pop_commands()
+        self.assertEqual(self._outputs(cmds), [
+            ('1', ''.join('line %s\n' % i for i in range(100))),
+            ('2', 'error\n'),
+            ('1', 'done\n'),
+        ])
+
+        self.buffer.write('more\n', '1')
+        self.assertEqual(len(self.writer.commands), 2)
+        self.assertEqual(self._outputs(self.buffer.pop_commands()),
+                         [('1', 'more\n')])
+
+    def test_partial_lines(self):
+        for s in ('spam', '\n', 'eggs', 'no newline', 'ham\n'):
+            self.buffer.write(s, '1')
+
+        self.assertEqual(self._outputs(self.buffer.pop_commands()), [
+            ('1', 'spam\neggs'),
+            ('1', 'no newline'),
+            ('1', 'ham\n'),
+        ])
+
+    def test_large_batch(self):
+        s = 'x' * (pydevd_comm.MAX_IO_MSG_SIZE - 1) + '\n'
+        count = 2 * pydevd_comm.MAX_IO_BATCH_SIZE // len(s) + 1
+        for _ in range(count):
+            self.buffer.write(s, '1')
+
+        cmds = self.buffer.pop_commands()
+        self.assertEqual(len(cmds), 3)
+        self.assertEqual(''.join(output for _, output in self._outputs(cmds)),
+                         s * count)
+
+    def test_dropped(self):
+        s = 'x' * pydevd_comm.MAX_IO_MSG_SIZE
+        count = pydevd_comm.MAX_IO_PENDING_SIZE // len(s)
+        for _ in range(count + 2):
+            self.buffer.write(s, '1')
+
+        outputs = self._outputs(self.buffer.pop_commands())
+        self.assertEqual(outputs[-1], (
+            '1', '\n[%s characters of output were dropped]\n' % (2 * len(s))))
+        self.assertEqual(self.buffer.dropped_chars, 2 * len(s))
+
+    def test_adapter_output(self):
+        self.buffer.write('spam & <eggs>\n', '2')
+        cmd, = self.buffer.pop_commands()
+        events = []
+
+        class Processor(object):
+            parse_structured_response = \
+                VSCodeMessageProcessor.parse_structured_response
+
+            def send_event(self, event, **body):
+                events.append((event, body))
+        handler = VSCodeMessageProcessor.on_pydevd_cmd_write_to_console2
+        handler(Processor(), cmd.seq, cmd.text)
+
+        self.assertEqual(events, [
+            ('output', {'category': 'stderr', 'output': 'spam & <eggs>\n'}),
+        ])
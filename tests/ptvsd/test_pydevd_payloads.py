@@ -0,0 +1,329 @@
+import json
+import os.path
+import sys
+import threading
+import unittest
+
+from _pydevd_bundle import pydevd_comm
+from _pydevd_bundle import pydevd_xml
+
+from ptvsd import futures
+from ptvsd import wrapper
+from ptvsd.wrapper import VSCodeMessageProcessor
+
+
+def _factories():
+    xml_factory = pydevd_comm.NetCommandFactory()
+    structured_factory = pydevd_comm.NetCommandFactory()
+    structured_factory.structured_payloads = True
+    return xml_factory, structured_factory
+
+
+class StructuredPayloadTests(unittest.TestCase):
+
+    def test_threads(self):
+        xml_factory, structured_factory = _factories()
+        thread = threading.current_thread()
+
+        xml_cmd = xml_factory.make_thread_created_message(thread)
+        cmd = structured_factory.make_thread_created_message(thread)
+
+        expected = VSCodeMessageProcessor.parse_threads_response(xml_cmd.text)
+        self.assertEqual(
+            VSCodeMessageProcessor.parse_threads_response(cmd.text),
+            expected)
+        self.assertEqual(expected, [{
+            'id': pydevd_comm.get_thread_id(thread),
+            'name': thread.name,
+        }])
+
+    def test_thread_suspend(self):
+        xml_factory, structured_factory = _factories()
+        frame = sys._getframe()
+
+        xml_cmd = xml_factory.make_thread_suspend_message(
+            'tid', frame, pydevd_comm.CMD_SET_BREAK, None, 'trace')
+        cmd = structured_factory.make_thread_suspend_message(
+            'tid', frame, pydevd_comm.CMD_SET_BREAK, None, 'trace')
+        xml_thread = VSCodeMessageProcessor.parse_thread_response(
+            xml_cmd.text)
+        thread = VSCodeMessageProcessor.parse_thread_response(cmd.text)
+
+        self.assertEqual(thread['id'], 'tid')
+        self.assertEqual(int(thread['stop_reason']),
+                         int(xml_thread['stop_reason']))
+        # The current line differs between both calls (and the XML
+        # payload escapes pseudo-files like "<string>" twice).
+        self.assertEqual(
+            [(f['id'], f['name'], f['line']) for f in thread['frames'][1:]],
+            [(f['id'], f['name'], f['line'])
+             for f in xml_thread['frames'][1:]])
+        self.assertEqual(thread['frames'][0]['name'], 'test_thread_suspend')
+        self.assertEqual(thread['frames'][0]['file'],
+                         xml_thread['frames'][0]['file'])
+
+    def test_thread_stack_window(self):
+        xml_factory, structured_factory = _factories()
+        frame = sys._getframe()
+        full = xml_factory.make_thread_stack_list(frame)
+
+        for factory in (xml_factory, structured_factory):
+            cmd = factory.make_get_thread_stack_message(
+                'tid', 'tid', frame, 1, 2)
+            thread = VSCodeMessageProcessor.parse_thread_response(cmd.text)
+
+            self.assertEqual(thread['totalFrames'], len(full))
+            self.assertEqual([f['id'] for f in thread['frames']],
+                             [f['id'] for f in full[1:3]])
+
+    def test_thread_stack_filtered_window(self):
+        xml_factory, structured_factory = _factories()
+        frame = sys._getframe()
+        hidden = xml_factory.make_thread_stack_list(frame)[0]['file']
+        pydevd_comm.thread_stack_frame_filter = lambda f: f != hidden
+        try:
+            # The stack of a suspended thread isn't filtered.
+            full = xml_factory.make_thread_stack_list(frame)
+            shown = [f for f in full if f['file'] != hidden]
+
+            for factory in (xml_factory, structured_factory):
+                cmd = factory.make_get_thread_stack_message(
+                    'tid', 'tid', frame, 1, 2)
+                thread = VSCodeMessageProcessor.parse_thread_response(
+                    cmd.text)
+
+                self.assertEqual(thread['totalFrames'], len(shown))
+                self.assertEqual([f['id'] for f in thread['frames']],
+                                 [f['id'] for f in shown[1:3]])
+        finally:
+            pydevd_comm.thread_stack_frame_filter = None
+        self.assertEqual(full[0]['file'], hidden)
+
+    def test_vars(self):
+        values = {'a': 1, 'b': [1, 2], 'c': 'spam & <eggs>'}
+        xml = '<xml>' + pydevd_xml.frame_vars_to_xml(values) + '</xml>'
+        variables = pydevd_xml.frame_vars_to_dicts(values)
+
+        expected = VSCodeMessageProcessor.parse_vars_response(xml)
+        actual = [
+            dict((k, v[k]) for k in expected[0])
+            for v in VSCodeMessageProcessor.parse_vars_response(variables)
+        ]
+        self.assertEqual(actual, expected)
+        self.assertEqual([v['isContainer'] for v in actual],
+                         [False, True, False])
+
+    def test_json_text(self):
+        _, structured_factory = _factories()
+        cmd = structured_factory.make_thread_created_message(
+            threading.current_thread())
+
+        text = json.dumps(cmd.text)
+        self.assertEqual(
+            VSCodeMessageProcessor.parse_threads_response(text),
+            cmd.text['threads'])
+        self.assertIn('%7B', cmd.outgoing)
+
+
+class ImmediateLoop(object):
+
+    def call_soon(self, f, *args):
+        f(*args)
+
+
+class StackTraceProcessor(VSCodeMessageProcessor):
+    """Only what on_stackTrace() uses, with a fake pydevd."""
+
+    INTERNAL = os.path.join(os.path.dirname(wrapper.__file__), 'daemon.py')
+
+    def __init__(self, files):
+        self.loop = ImmediateLoop()
+        self.thread_map = wrapper.IDMap()
+        self.frame_map = wrapper.ThreadScopedIDMap()
+        self.source_map = wrapper.IDMap()
+        self.modules_mgr = wrapper.ModulesManager(self)
+        self.internals_filter = wrapper.InternalsFilter()
+        self.path_casing = wrapper.PathUnNormcase()
+        self.start_reason = 'launch'
+        self.debug_options = {}
+        self.vsc_tid = self.thread_map.to_vscode('tid', autogen=True)
+        self.frames = [
+            {'id': i, 'name': os.path.basename(f), 'file': f, 'line': 1}
+            for i, f in enumerate(files)
+        ]
+        self.pydevd_requests = []
+        self.responses = []
+        self.hung = False
+
+    def pydevd_request(self, cmd_id, args, timeout=None):
+        self.pydevd_requests.append(args)
+        fut = futures.Future(self.loop)
+        if self.hung:
+            try:
+                raise wrapper.PydevdRequestTimeoutError(cmd_id, timeout)
+            except wrapper.PydevdRequestTimeoutError:
+                fut.set_exc_info(sys.exc_info())
+            return fut
+        # What pydevd does with the frame filter set by the processor.
+        _, start, levels = args.split('\t')
+        start, levels = int(start), int(levels)
+        shown = [f for f in self.frames if self._is_user_frame(f['file'])]
+        if levels:
+            frames = shown[start:start + levels]
+        else:
+            frames = shown[start:]
+        fut.set_result((cmd_id, 0, {
+            'id': 'tid',
+            'frames': frames,
+            'totalFrames': len(shown),
+        }))
+        return fut
+
+    def send_response(self, request, **kwargs):
+        self.responses.append(kwargs)
+
+    def send_event(self, event, **kwargs):
+        pass
+
+    def stack_trace(self, startFrame, levels):
+        self.on_stackTrace({}, {
+            'threadId': self.vsc_tid,
+            'startFrame': startFrame,
+            'levels': levels,
+        })
+        response = self.responses.pop()
+        names = [frame['name'] for frame in response['stackFrames']]
+        return names, response['totalFrames']
+
+
+class StackTraceTests(unittest.TestCase):
+
+    FILES = [
+        '/abc/f0.py',
+        StackTraceProcessor.INTERNAL,
+        '/abc/f2.py',
+        StackTraceProcessor.INTERNAL,
+        '/abc/f4.py',
+        '/abc/f5.py',
+    ]
+
+    def test_internal_frames_in_window(self):
+        proc = StackTraceProcessor(self.FILES)
+
+        self.assertEqual(proc.stack_trace(1, 2), (['f2.py', 'f4.py'], 4))
+        # The window is requested as is, in a single request.
+        self.assertEqual(proc.pydevd_requests, ['tid\t1\t2'])
+
+    def test_pages(self):
+        proc = StackTraceProcessor(self.FILES)
+        names = []
+        totals = []
+        for start in range(0, 6, 2):
+            page, total = proc.stack_trace(start, 2)
+            names.extend(page)
+            totals.append(total)
+
+        self.assertEqual(names, ['f0.py', 'f2.py', 'f4.py', 'f5.py'])
+        self.assertEqual(totals, [4, 4, 4])
+        self.assertEqual(proc.stack_trace(0, 0), (names, 4))
+
+    def test_timeout(self):
+        proc = StackTraceProcessor(self.FILES)
+        proc.hung = True
+        proc.on_stackTrace({}, {'threadId': proc.vsc_tid})
+
+        self.assertEqual(proc.responses, [{
+            'success': False,
+            'message': 'no response to pydevd command {} after {} seconds'
+                       .format(pydevd_comm.CMD_GET_THREAD_STACK,
+                               wrapper.INSPECT_REQUEST_TIMEOUT),
+        }])
+
+
+class PydevdRequestTests(unittest.TestCase):
+
+    def setUp(self):
+        super(PydevdRequestTests, self).setUp()
+        self.loop = futures.EventLoop()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+        self.unhandled = []
+        self.sock = wrapper.PydevdSocket(
+            lambda *msg: self.unhandled.append(msg),
+            lambda: None,
+            lambda: None,
+            lambda: None,
+        )
+
+    def tearDown(self):
+        self.loop.stop()
+        self.thread.join(5)
+        super(PydevdRequestTests, self).tearDown()
+
+    def _wait(self, fut):
+        done = threading.Event()
+        fut.add_done_callback(lambda _: done.set())
+        self.assertTrue(done.wait(5))
+
+    def test_timeout(self):
+        fut = self.sock.pydevd_request(self.loop, 111, 'spam', timeout=0.01)
+        seq = list(self.sock.requests)[0]
+        self._wait(fut)
+
+        self.assertIsInstance(fut.exc_info()[1],
+                              wrapper.PydevdRequestTimeoutError)
+        self.assertEqual(self.sock.requests, {})
+        # A late response is handled as any other message.
+        self.sock.send_command(111, seq, 'eggs')
+        self.assertEqual(self.unhandled, [(111, seq, 'eggs')])
+
+    def test_response_in_time(self):
+        fut = self.sock.pydevd_request(self.loop, 111, 'spam', timeout=0.1)
+        seq = list(self.sock.requests)[0]
+        self.sock.send_command(111, seq, 'eggs')
+        self._wait(fut)
+
+        self.assertEqual(fut.result(), (111, seq, 'eggs'))
+        self.assertEqual(self.sock.requests, {})
+
+
+class VariablePageTests(unittest.TestCase):
+
+    def test_list_page(self):
+        value = list(range(1000))
+        var = pydevd_xml.var_to_dict(value, 'value')
+        _, _, resolver = pydevd_xml.get_type(value)
+
+        self.assertEqual(var['indexedVariables'], 1000)
+        self.assertEqual(resolver.get_indexed_items(value, 500, 3), [
+            ('0500', 500),
+            ('0501', 501),
+            ('0502', 502),
+        ])
+        self.assertEqual(resolver.resolve(value, '0501'), 501)
+        self.assertEqual(resolver.get_named_dictionary(value)['__len__'],
+                         1000)
+
+    def test_dict_page(self):
+        value = dict((i, str(i)) for i in range(1000))
+        _, _, resolver = pydevd_xml.get_type(value)
+
+        items = resolver.get_indexed_items(value, 999, 10)
+        self.assertEqual(len(items), 1)
+        name, item = items[0]
+        self.assertEqual(item, '999')
+        self.assertEqual(resolver.resolve(value, name), '999')
+
+    def test_deque_and_set_pages(self):
+        import collections
+        value = collections.deque(range(1000), maxlen=2000)
+        _, _, resolver = pydevd_xml.get_type(value)
+
+        self.assertEqual(resolver.get_indexed_items(value, 998, 10),
+                         [('0998', 998), ('0999', 999)])
+        self.assertEqual(resolver.get_named_dictionary(value)['maxlen'],
+                         2000)
+
+        value = set(range(1000))
+        _, _, resolver = pydevd_xml.get_type(value)
+        self.assertEqual(len(resolver.get_indexed_items(value, 0, 400)), 400)
@@ -0,0 +1,53 @@
+import unittest
+
+from _pydev_bundle.pydev_read_buffer import ReadBuffer
+
+
+class FakeSocket(object):
+
+    def __init__(self, data, chunk_size):
+        self.data = data
+        self.chunk_size = chunk_size
+
+    def recv_into(self, buf, size):
+        size = min(size, self.chunk_size, len(self.data))
+        buf[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
+
+class RecvSocket(FakeSocket):
+
+    recv_into = None
+
+    def recv(self, size):
+        data = self.data[:min(size, self.chunk_size)]
+        self.data = self.data[len(data):]
+        return data
+
+
+class ReadBufferTests(unittest.TestCase):
+
+    def test_read_lines(self):
+        data = b'101\t1\tspam\n' + b'x' * 1000 + b'\n\n'
+        for sock in (FakeSocket(data, 7), RecvSocket(data, 7)):
+            buf = ReadBuffer(sock, recv_size=16)
+
+            self.assertEqual(buf.read_line(), b'101\t1\tspam')
+            self.assertEqual(buf.read_line(), b'x' * 1000)
+            self.assertEqual(buf.read_line(), b'')
+            self.assertIsNone(buf.read_line())
+            self.assertEqual(len(buf), 0)
+
+    def test_content_length(self):
+        content = b'{"seq": 1}' * 100
+        header = 'Content-Length: %d' % len(content)
+        data = header.encode('ascii') + b'\r\n\r\n' + content
+        buf = ReadBuffer(FakeSocket(data + b'Content-', 5), recv_size=16)
+
+        self.assertEqual(buf.read_line(b'\r\n'), header.encode('ascii'))
+        self.assertEqual(buf.read_line(b'\r\n'), b'')
+        self.assertEqual(buf.read(len(content)), content)
+        self.assertIsNone(buf.read_line(b'\r\n'))
+        self.assertEqual(len(buf), len(b'Content-'))
+        self.assertIsNone(buf.read(100))
@@ -0,0 +1,68 @@
+import threading
+import unittest
+
+import pydevd
+from _pydevd_bundle import pydevd_comm
+
+
+class FakeWriter(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def add_command(self, cmd):
+        self.commands.append(cmd)
+
+
+class FakeCommand(object):
+
+    def __init__(self):
+        self.done = 0
+
+    def can_be_executed_by(self, thread_id):
+        return True
+
+    def do_it(self, py_db):
+        self.done += 1
+
+
+class ThreadTrackingTests(unittest.TestCase):
+
+    def setUp(self):
+        super(ThreadTrackingTests, self).setUp()
+        self._global_debugger = pydevd_comm.get_global_debugger()
+        self.py_db = pydevd.PyDB()
+        self.py_db.writer = FakeWriter()
+        # The threads are only the ones notified by the tests.
+        self.py_db._next_check_threads_time = float('inf')
+
+    def tearDown(self):
+        pydevd_comm.set_global_debugger(self._global_debugger)
+        super(ThreadTrackingTests, self).tearDown()
+
+    def test_commands_for_unknown_thread(self):
+        cmd = FakeCommand()
+        self.py_db.post_internal_command(cmd, 'pid_1_id_1')
+        self.py_db.process_internal_commands()
+
+        self.assertEqual(cmd.done, 0)
+        self.assertEqual(self.py_db._thread_ids_with_commands, set())
+
+    def test_commands_posted_before_thread_notified(self):
+        cmd = FakeCommand()
+        self.py_db.post_internal_command(cmd, 'pid_1_id_1')
+        self.py_db.process_internal_commands()
+        self.py_db.notify_thread_created('pid_1_id_1', threading.Thread())
+        self.py_db.process_internal_commands()
+
+        self.assertEqual(cmd.done, 1)
+
+    def test_suspended_thread_event_removed(self):
+        self.py_db.wake_suspended_thread('pid_1_id_1')
+        self.assertEqual(self.py_db._suspended_thread_events, {})
+
+        self.py_db.notify_thread_created('pid_1_id_1', threading.Thread())
+        self.py_db.get_suspended_thread_event('pid_1_id_1')
+        self.py_db.notify_thread_not_alive('pid_1_id_1')
+
+        self.assertEqual(self.py_db._suspended_thread_events, {})
@@ -0,0 +1,25 @@
+import unittest
+
+from _pydevd_bundle import pydevd_vars
+from _pydevd_bundle.pydevd_xml import var_to_xml
+
+
+class TableToXMLTests(unittest.TestCase):
+
+    def test_same_as_var_to_xml(self):
+        table = [[1.5, -2], [1e20, float('nan')]]
+        values = [[u'a<b & "c"', u'x' * 2000], [u'1.5', u'']]
+        xml = []
+
+        formatted = pydevd_vars._format_table(table, '%.2f')
+        pydevd_vars._table_to_xml(xml, formatted + values, '<row %s/>')
+
+        expected = []
+        for row, cells in enumerate(formatted + values):
+            expected.append('<row %s/>' % row)
+            expected.extend(var_to_xml(cell, '') for cell in cells)
+        self.assertEqual(formatted, [
+            ['1.50', '-2.00'],
+            ['100000000000000000000.00', 'nan'],
+        ])
+        self.assertEqual(xml, expected)
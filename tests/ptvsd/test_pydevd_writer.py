@@ -0,0 +1,65 @@
+import threading
+import unittest
+
+from _pydevd_bundle import pydevd_comm
+
+
+class FakeSocket(object):
+
+    def __init__(self):
+        self.sent = []
+        self.closed = threading.Event()
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+    def shutdown(self, how):
+        pass
+
+    def close(self):
+        self.closed.set()
+
+
+class PartialSendSocket(FakeSocket):
+
+    sendall = None
+
+    def send(self, data):
+        self.sent.append(data[:3])
+        return len(data[:3])
+
+
+class WriterThreadTests(unittest.TestCase):
+
+    def _write(self, sock, cmds):
+        writer = pydevd_comm.WriterThread(sock)
+        for cmd in cmds:
+            writer.add_command(cmd)
+        writer.start()
+        writer.do_kill_pydev_thread()
+        self.assertTrue(sock.closed.wait(5))
+        writer.join(5)
+
+    def _commands(self):
+        cmd_id = pydevd_comm.CMD_RETURN
+        return [pydevd_comm.NetCommand(cmd_id, 0, 'spam %s' % i)
+                for i in range(3)]
+
+    def test_batched(self):
+        sock = FakeSocket()
+        cmds = self._commands()
+
+        self._write(sock, cmds)
+
+        self.assertEqual(sock.sent, [
+            ''.join(cmd.outgoing for cmd in cmds).encode('utf-8'),
+        ])
+
+    def test_partial_send(self):
+        sock = PartialSendSocket()
+        cmds = self._commands()
+
+        self._write(sock, cmds)
+
+        self.assertEqual(b''.join(sock.sent),
+                         ''.join(cmd.outgoing for cmd in cmds).encode('utf-8'))
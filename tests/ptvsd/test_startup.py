@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import unittest
+
+from tests import PROJECT_ROOT
+
+
+LAZY_ATTACH = """
+import ptvsd
+ptvsd.enable_attach(('localhost', 0), lazy=True)
+"""
+
+
+def _run(code):
+    script = ('import sys, time\n'
+              'start = time.time()\n'
+              '{}\n'
+              'elapsed = time.time() - start\n'
+              'print(elapsed)\n'
+              "print(sorted(m for m in sys.modules if 'pydev' in m"
+              " or m.startswith('ptvsd.')))\n").format(code)
+    out = subprocess.check_output([sys.executable, '-c', script],
+                                  cwd=PROJECT_ROOT)
+    elapsed, modules = out.decode('utf-8').splitlines()[-2:]
+    return float(elapsed), eval(modules)
+
+
+def _best_time(code, runs=3):
+    return min(_run(code)[0] for _ in range(runs))
+
+
+class ImportTimeTests(unittest.TestCase):
+
+    def test_lazy_attach_does_not_load_debugger(self):
+        _, modules = _run(LAZY_ATTACH)
+
+        self.assertNotIn('pydevd', modules)
+        self.assertNotIn('ptvsd.wrapper', modules)
+        self.assertNotIn('ptvsd._vendored.force_pydevd', modules)
+
+    def test_import_time(self):
+        lazy = _best_time(LAZY_ATTACH)
+        full = _best_time('import ptvsd.wrapper')
+
+        self.assertLess(lazy * 2, full)
@@ -0,0 +1,17 @@
+import unittest
+
+from _pydevd_bundle import pydevd_additional_thread_info
+from _pydevd_bundle import pydevd_constants
+from _pydevd_bundle import pydevd_trace_dispatch
+
+
+class TracerSelectionTests(unittest.TestCase):
+
+    def test_consistent(self):
+        info = pydevd_additional_thread_info.PyDBAdditionalThreadInfo
+        using_cython = pydevd_trace_dispatch.USING_CYTHON
+
+        self.assertEqual(info.__module__.endswith('_regular'),
+                         not using_cython)
+        if using_cython:
+            self.assertTrue(pydevd_constants.CYTHON_SUPPORTED)
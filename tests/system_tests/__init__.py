@@ -1,6 +1,7 @@
 import contextlib
 import os
 import ptvsd
+import re
 import signal
 import sys
 import time
@@ -131,10 +132,25 @@ def _strip_output_event(received, output):
     return _strip_messages(received, match)
 
 
+def _split_output_events(received):
+    # The debugger coalesces the output written in a short time (see
+    # pydevd_comm.OutputBuffer), so it's split back into one event per
+    # line (and per newline) to compare it.
+    for msg in received:
+        if not _match_event(msg, 'output', output=ANY):
+            yield msg
+        elif msg.body.get('category') == 'telemetry':
+            yield msg
+        else:
+            for text in re.findall(r'[^\r\n]+|\r?\n', msg.body['output']):
+                text = text if text.strip() else u'\n'
+                yield msg._replace(body=dict(msg.body, output=text))
+
+
 def _strip_newline_output_events(received):
     def match(msg):
         return _match_event(msg, 'output', output=u'\n')
-    return _strip_messages(received, match)
+    return _strip_messages(_split_output_events(received), match)
 
 
 def _strip_pydevd_output(out):
@@ -269,7 +269,7 @@ class BreakpointTests(LifecycleTestsBase):
             self.new_event(
                 'output',
                 category='stdout',
-                output='Sum of a + i = {}{}'.format(i + 1, os.linesep))
+                output='Sum of a + i = {}'.format(i + 1))
             for i in range(5)
         ]
 
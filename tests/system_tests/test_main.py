@@ -4,13 +4,14 @@ from textwrap import dedent
 import unittest
 
 import ptvsd
+from ptvsd._util import ClosedError
 from ptvsd.socket import Address
 from ptvsd.wrapper import INITIALIZE_RESPONSE
 from tests.helpers.debugadapter import DebugAdapter
 from tests.helpers.debugclient import EasyDebugClient as DebugClient
 from tests.helpers.lock import LockTimeoutError
 from tests.helpers.script import find_line, set_lock, set_release
-from tests.helpers.debugsession import Awaitable
+from tests.helpers.debugsession import Awaitable, DebugSession
 
 from . import (
     _strip_newline_output_events, lifecycle_handshake, TestsBase,
@@ -81,6 +82,71 @@ class CLITests(TestsBase, unittest.TestCase):
 
         self.assertEqual(rc, 42)
 
+    @unittest.skipUnless(hasattr(os, 'fork'), 'os.fork() is not available')
+    def test_multiprocess(self):
+        child = self.write_script('child.py', """
+            import sys
+            print('child')
+            sys.stdout.flush()
+            """)
+        filename = self.write_script('spam.py', """
+            import os
+            import subprocess
+            import sys
+            proc = subprocess.Popen([sys.executable, {!r}])
+            pid = os.fork()
+            if pid == 0:
+                print('forked')
+                sys.stdout.flush()
+                os._exit(0)
+            os.waitpid(pid, 0)
+            proc.wait()
+            print('done')
+            sys.stdout.flush()
+            """.format(child))
+        with DebugClient(port=PORT) as editor:
+            adapter, session = editor.host_local_debugger([
+                '--multiprocess',
+                filename,
+            ])
+            # Both are reported once the session is configured.
+            subprocesses = [
+                session.get_awaiter_for_event('ptvsd_subprocess'),
+                session.get_awaiter_for_event('ptvsd_subprocess'),
+            ]
+            lifecycle_handshake(session, 'launch')
+            infos = []
+            subsessions = []
+            try:
+                for awaiter in subprocesses:
+                    awaiter.wait(timeout=10.0)
+                    info = awaiter.event.body
+                    infos.append(info)
+                    subsession = DebugSession.create_client(
+                        (info['host'], info['port']),
+                    )
+                    subsessions.append(subsession)
+                    lifecycle_handshake(subsession, 'attach')
+                adapter.wait()
+            finally:
+                # They are closed when the subprocesses exit.
+                for subsession in subsessions:
+                    try:
+                        subsession.close()
+                    except ClosedError:
+                        pass
+        out = adapter.output.decode('utf-8').splitlines()
+
+        self.assertEqual(adapter.exitcode, 0)
+        self.assertEqual(len(set(info['port'] for info in infos)), 2)
+        self.assertEqual(len(set(info['processId'] for info in infos)), 2)
+        for info in infos:
+            self.assertEqual(info['rootProcessId'], adapter.pid)
+            self.assertEqual(info['parentProcessId'], adapter.pid)
+        self.assertIn('child', out)
+        self.assertIn('forked', out)
+        self.assertIn('done', out)
+
 
 class DebugTests(TestsBase, unittest.TestCase):
 
@@ -216,6 +282,12 @@ class LifecycleTests(LifecycleTestsBase):
         ])
 
     def test_attach_embedded(self):
+        self._attach_embedded(lazy=False)
+
+    def test_attach_embedded_lazy(self):
+        self._attach_embedded(lazy=True)
+
+    def _attach_embedded(self, lazy):
         lockfile = self.workspace.lockfile()
         done, waitscript = lockfile.wait_in_script()
         addr = Address('localhost', 8888)
@@ -224,13 +296,13 @@ class LifecycleTests(LifecycleTestsBase):
             import sys
             sys.path.insert(0, {!r})
             import ptvsd
-            ptvsd.enable_attach({}, redirect_output={})
+            ptvsd.enable_attach({}, redirect_output={}, lazy={})
             ptvsd.wait_for_attach()
 
             print('success!', end='')
 
             %s
-            """).format(os.getcwd(), tuple(addr), True)
+            """).format(os.getcwd(), tuple(addr), True, lazy)
         filename = self.write_script('spam.py', script % waitscript)
         with DebugAdapter.start_embedded(addr, filename) as adapter:
             with DebugClient() as editor:
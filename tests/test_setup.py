@@ -101,6 +101,7 @@ VENDORED = {file.replace('/', os.path.sep) for file in [
     'pydevd/_pydev_bundle/pydev_imports.py',
     'pydevd/_pydev_bundle/pydev_override.py',
     'pydevd/_pydev_bundle/pydev_monkey.py',
+    'pydevd/_pydev_bundle/pydev_read_buffer.py',
     'pydevd/_pydev_bundle/pydev_localhost.py',
     'pydevd/_pydev_bundle/pydev_log.py',
     'pydevd/_pydev_bundle/pydev_ipython_console_011.py',
@@ -184,6 +185,7 @@ VENDORED = {file.replace('/', os.path.sep) for file in [
     'pydevd/_pydevd_bundle/pydevd_xml.py',
     'pydevd/_pydevd_bundle/pydevd_extension_api.py',
     'pydevd/_pydevd_bundle/pydevd_comm.py',
+    'pydevd/_pydevd_bundle/pydevd_condition_compiler.py',
     'pydevd/_pydevd_bundle/pydevd_kill_all_pydevd_threads.py',
     'pydevd/_pydevd_bundle/pydevd_traceproperty.py',
     'pydevd/_pydevd_bundle/pydevd_command_line_handling.py',